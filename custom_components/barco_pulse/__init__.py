@@ -4,95 +4,319 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from functools import partial
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from homeassistant.const import CONF_HOST, CONF_PORT, EVENT_HOMEASSISTANT_STOP
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import STORAGE_DIR
 
-from .api import BarcoDevice
-from .const import CONF_AUTH_CODE, DEFAULT_PORT, DEFAULT_TIMEOUT
-from .coordinator import BarcoDataUpdateCoordinator
-from .data import BarcoRuntimeData
+from .connectors import BarcoConnectorMonitor
+from .const import (
+    CONF_AUTH_CODE,
+    CONF_MIRROR_LEADER,
+    CONF_MIRROR_OFFSETS,
+    CONF_RECORD_SESSIONS,
+    DEFAULT_PORT,
+    DOMAIN,
+    HISTORY_FLUSH_INTERVAL,
+    LOG_DIRECTORY,
+    SIGNAL_PROJECTOR_UPDATED,
+)
+from .coordinator import BarcoDataUpdateCoordinator, snapshot_store
+from .counters import BarcoCounterCoordinator, counter_store
+from .data import BarcoGroupRuntimeData, BarcoRuntimeData
 from .exceptions import BarcoAuthError, BarcoConnectionError
+from .fleet import async_get_fleet
+from .group import BarcoGroupController, is_group_entry
+from .history import TelemetryHistory
+from .keys import BarcoKeyEventForwarder
+from .logs import prune_archives
+from .mirror import BarcoPictureMirror
+from .notifications import BarcoNotificationManager
+from .picture import BarcoPictureSnapshots, picture_store
+from .registry import async_get_registry
+from .services import async_setup_services
+from .telemetry import BarcoTelemetryCoordinator
+from .transport import SessionRecorder
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import Event, HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
 
 # Platforms to set up
-PLATFORMS = ["binary_sensor", "sensor", "switch", "select", "number", "remote"]
+PLATFORMS = [
+    "binary_sensor",
+    "sensor",
+    "switch",
+    "select",
+    "number",
+    "remote",
+    "camera",
+]
+# Platforms of projector group entries
+GROUP_PLATFORMS = ["switch", "select", "number"]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+def history_path(hass: HomeAssistant, entry_id: str) -> Path:
+    """Return the telemetry history file of a config entry."""
+    return Path(hass.config.path(STORAGE_DIR, f"{DOMAIN}.{entry_id}.history"))
+
+
+def _async_start_listener(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    listener: BarcoNotificationManager | BarcoConnectorMonitor | BarcoKeyEventForwarder,
+    name: str,
+) -> None:
+    """Start a subscription-driven listener in the background."""
+    entry.async_on_unload(listener.async_stop)
+    entry.async_create_background_task(
+        hass, listener.async_start(), f"{DOMAIN}_{name}_start"
+    )
+
+
+async def _async_open_history(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> TelemetryHistory | None:
+    """Open the telemetry history of an entry and flush it periodically."""
+    history = TelemetryHistory(history_path(hass, entry.entry_id))
+    try:
+        await hass.async_add_executor_job(history.open)
+    except OSError as err:
+        _LOGGER.warning("Telemetry history disabled: %s", err)
+        return None
+
+    async def _async_flush_history(_now: datetime) -> None:
+        """Write back dirty history pages."""
+        await hass.async_add_executor_job(history.flush)
+
+    entry.async_on_unload(
+        async_track_time_interval(hass, _async_flush_history, HISTORY_FLUSH_INTERVAL)
+    )
+    return history
+
+
+async def async_setup(hass: HomeAssistant, _config: ConfigType) -> bool:
+    """Set up integration-wide services."""
+    async_setup_services(hass)
+    return True
+
+
+async def _async_setup_group_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up a projector group; it follows its members as they (un)load."""
+    controller = BarcoGroupController(hass, entry)
+    controller.async_start()
+    entry.async_on_unload(controller.async_stop)
+
+    # Optional mirror mode: followers track the leader's picture settings
+    mirror = None
+    if leader := entry.options.get(CONF_MIRROR_LEADER):
+        mirror = BarcoPictureMirror(
+            hass, controller, leader, entry.options.get(CONF_MIRROR_OFFSETS, {})
+        )
+        mirror.async_start()
+        entry.async_on_unload(mirror.async_stop)
+
+    entry.runtime_data = BarcoGroupRuntimeData(controller=controller, mirror=mirror)
+    entry.async_on_unload(entry.add_update_listener(_async_group_updated))
+    await hass.config_entries.async_forward_entry_setups(entry, GROUP_PLATFORMS)
+    return True
+
+
+async def _async_group_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload a projector group when its options changed."""
+    await hass.config_entries.async_reload(entry.entry_id)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Barco Pulse from a config entry."""
+    if is_group_entry(entry):
+        return await _async_setup_group_entry(hass, entry)
+
     # Extract configuration
     host = entry.data[CONF_HOST]
     port = entry.data.get(CONF_PORT, DEFAULT_PORT)
     # Convert empty string to None for auth_code
     auth_code = entry.data.get(CONF_AUTH_CODE) or None
 
-    # Create device instance
-    device = BarcoDevice(
-        host=host,
-        port=port,
-        auth_code=auth_code,
-        timeout=DEFAULT_TIMEOUT,
+    # Optionally record raw traffic for offline replay
+    recorder = None
+    if entry.options.get(CONF_RECORD_SESSIONS, False):
+        recorder = SessionRecorder(hass.config.path(f"{DOMAIN}_{entry.entry_id}.bprc"))
+
+    # Acquire shared session (reuses a warm connection from the config flow
+    # or a previous setup of this entry)
+    registry = async_get_registry(hass)
+    connection_factory = (
+        recorder.open_connection if recorder else asyncio.open_connection
     )
 
-    # Try to connect
     try:
-        await device.connect()
-    except BarcoConnectionError as err:
-        raise ConfigEntryNotReady(f"Failed to connect to {host}:{port}") from err
+        device = await registry.async_acquire(
+            host, port, auth_code, connection_factory, connect=False
+        )
     except BarcoAuthError as err:
         raise ConfigEntryNotReady(f"Authentication failed for {host}:{port}") from err
 
-    # Create coordinator
+    # Create coordinator; the fleet scheduler staggers and budgets its polling
+    # together with every other configured projector
     coordinator = BarcoDataUpdateCoordinator(hass, device)
+    entry.async_on_unload(async_get_fleet(hass).async_add(coordinator))
+    entry.async_on_unload(
+        device.add_notification_listener(coordinator.handle_notification)
+    )
 
-    # Perform initial refresh
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as err:
-        await device.disconnect()
-        raise ConfigEntryNotReady(f"Failed to fetch initial data: {err}") from err
+    if await coordinator.async_restore_snapshot():
+        # Last-known snapshot restored: create entities right away and
+        # connect/refresh in the background so a slow projector never
+        # delays Home Assistant startup
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN}_initial_refresh"
+        )
+    else:
+        # First setup: identity is needed for stable entity IDs, so block
+        try:
+            await device.connect()
+            await coordinator.async_config_entry_first_refresh()
+        except BarcoConnectionError as err:
+            await registry.async_release(device)
+            raise ConfigEntryNotReady(f"Failed to connect to {host}:{port}") from err
+        except BarcoAuthError as err:
+            await registry.async_release(device)
+            raise ConfigEntryNotReady(
+                f"Authentication failed for {host}:{port}"
+            ) from err
+        except Exception as err:
+            await registry.async_release(device)
+            raise ConfigEntryNotReady(f"Failed to fetch initial data: {err}") from err
 
-    # Store runtime data
-    entry.runtime_data = BarcoRuntimeData(client=device, coordinator=coordinator)
+    # Environment telemetry samples on its own slow cadence; the first sample
+    # runs in the background and sensors are added as blocks are discovered
+    telemetry = BarcoTelemetryCoordinator(hass, coordinator)
 
-    # Register shutdown handler
-    async def _async_close_connection(_event: Event) -> None:
-        """Close connection on shutdown."""
-        await device.disconnect()
+    # Raw samples are kept in a local ring file rather than the recorder
+    history = await _async_open_history(hass, entry)
+    telemetry.history = history
 
-    entry.async_on_unload(
-        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close_connection)
+    entry.async_create_background_task(
+        hass, telemetry.async_refresh(), f"{DOMAIN}_telemetry_refresh"
+    )
+
+    # Runtime counters: restore the persisted list and values so sensors
+    # start populated, then sample on a slow cadence
+    counters = BarcoCounterCoordinator(hass, coordinator)
+    await counters.async_restore()
+    entry.async_create_background_task(
+        hass, counters.async_refresh(), f"{DOMAIN}_counter_refresh"
+    )
+
+    # Projector alarms are pushed via signal subscriptions, not polled
+    notifications = BarcoNotificationManager(hass, entry, device)
+    _async_start_listener(hass, entry, notifications, "notifications")
+
+    # Input signals are pushed per connector via property subscriptions
+    connectors = BarcoConnectorMonitor(hass, entry, device)
+    _async_start_listener(hass, entry, connectors, "connectors")
+
+    # Physical remote/keypad presses are forwarded as events
+    _async_start_listener(
+        hass, entry, BarcoKeyEventForwarder(hass, entry, device), "key_events"
     )
 
+    # Store runtime data
+    entry.runtime_data = BarcoRuntimeData(
+        client=device,
+        coordinator=coordinator,
+        telemetry=telemetry,
+        counters=counters,
+        notifications=notifications,
+        connectors=connectors,
+        pictures=BarcoPictureSnapshots(hass, device, entry.entry_id),
+        recorder=recorder,
+        history=history,
+    )
+
+    entry.async_on_unload(entry.add_update_listener(_async_projector_updated))
+
+    # Register shutdown handler (the registry closes shared sessions itself)
+    if recorder:
+
+        async def _async_flush_recording(_event: Event) -> None:
+            """Flush recorded traffic on shutdown."""
+            await recorder.flush()
+
+        entry.async_on_unload(
+            hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_flush_recording)
+        )
+
     # Forward to platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Let projector groups containing this entry pick it up
+    async_dispatcher_send(hass, SIGNAL_PROJECTOR_UPDATED, entry.entry_id, True)  # noqa: FBT003
+
     return True
 
 
+async def _async_projector_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload a projector when session recording was switched on or off."""
+    recording = entry.options.get(CONF_RECORD_SESSIONS, False)
+    if recording != (entry.runtime_data.recorder is not None):
+        await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if is_group_entry(entry):
+        return await hass.config_entries.async_unload_platforms(entry, GROUP_PLATFORMS)
+
+    # Projector groups stop commanding this entry before it goes away
+    async_dispatcher_send(hass, SIGNAL_PROJECTOR_UPDATED, entry.entry_id, False)  # noqa: FBT003
+
     # Unload platforms
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
-    # Disconnect device if unload successful
+    # Release shared session if unload successful; it stays warm briefly so
+    # a reload reuses the authenticated connection
     if unload_ok:
-        try:
-            await entry.runtime_data.client.disconnect()
-        except (BarcoConnectionError, OSError) as err:
-            _LOGGER.debug("Error disconnecting during unload: %s", err)
+        await async_get_registry(hass).async_release(entry.runtime_data.client)
+        if entry.runtime_data.recorder:
+            await entry.runtime_data.recorder.flush()
+        if entry.runtime_data.history:
+            await hass.async_add_executor_job(entry.runtime_data.history.close)
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted data of a deleted config entry."""
+    if is_group_entry(entry):
+        return
+    await snapshot_store(hass, entry.entry_id).async_remove()
+    await counter_store(hass, entry.entry_id).async_remove()
+    await picture_store(hass, entry.entry_id).async_remove()
+    await hass.async_add_executor_job(
+        partial(history_path(hass, entry.entry_id).unlink, missing_ok=True)
+    )
+    await hass.async_add_executor_job(
+        prune_archives, Path(hass.config.path(LOG_DIRECTORY)), f"{entry.entry_id}_", 0
+    )
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
     await async_unload_entry(hass, entry)
@@ -0,0 +1,282 @@
+"""Streaming anomaly detection on environment telemetry for Barco Pulse."""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+import statistics
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .telemetry import TelemetryColumns
+
+_LOGGER = logging.getLogger(__name__)
+
+ANOMALY_ALPHA = 0.05  # EWMA smoothing factor (~20 sample memory)
+ANOMALY_WARMUP_SAMPLES = 20  # Samples before a baseline is trusted
+ANOMALY_Z_RAISE = 4.0  # |z| needed to raise an anomaly
+ANOMALY_Z_CLEAR = 2.0  # |z| below which a raised anomaly clears
+ANOMALY_CONFIRM_SAMPLES = 3  # Consecutive samples beyond ANOMALY_Z_RAISE
+
+KIND_SIBLING_DRIFT = "sibling_drift"
+KIND_FAN_DROP = "fan_drop"
+KIND_INLET_OUTLET_DELTA = "inlet_outlet_delta"
+KIND_FAN_DRIVE = "fan_drive"
+
+# Minimum standard deviation per signal kind, so perfectly flat baselines
+# don't turn sensor quantization steps into huge z-scores
+ANOMALY_MIN_STD: dict[str, float] = {
+    KIND_SIBLING_DRIFT: 0.5,  # °C
+    KIND_FAN_DROP: 50.0,  # RPM
+    KIND_INLET_OUTLET_DELTA: 0.5,  # °C
+    KIND_FAN_DRIVE: 2.0,  # RPM per percent PWM
+}
+
+# Numbered member of a block group, e.g. environment.laser.board0.heatsink3.
+# temperature -> group environment.laser.board0.heatsink.temperature
+_SIBLING = re.compile(r"^(?P<group>.+\.[a-z]+)\d+(?P<suffix>(?:\.[a-z]+)*)$")
+ANOMALY_MIN_SIBLINGS = 3  # Members needed for a meaningful group median
+ANOMALY_MIN_PWM = 5.0  # Percent PWM below which a fan's drive ratio is ignored
+
+
+def sibling_group(name: str) -> str | None:
+    """Return the block group of a numbered sensor, None if not numbered."""
+    match = _SIBLING.match(name)
+    return match["group"] + match["suffix"] if match else None
+
+
+def fan_key(name: str) -> str:
+    """
+    Return the fan a Speed or PWM block belongs to.
+
+    The value type segment is dropped, so environment.fanspeed.mainboard.fan1
+    and environment.pwm.mainboard.fan1 both map to mainboard.fan1.
+    """
+    return name.split(".", 2)[-1]
+
+
+@dataclass(frozen=True, slots=True)
+class Anomaly:
+    """Raised anomaly of one telemetry signal."""
+
+    kind: str
+    sensor: str
+    value: float
+    baseline: float
+    z_score: float
+
+
+class _Baseline:
+    """Exponentially weighted mean and variance of one derived signal."""
+
+    __slots__ = ("mean", "min_std", "over", "samples", "variance")
+
+    def __init__(self, min_std: float) -> None:
+        """Initialize an empty baseline."""
+        self.mean = 0.0
+        self.variance = 0.0
+        self.samples = 0
+        self.over = 0  # Consecutive samples beyond the raise threshold
+        self.min_std = min_std
+
+    def score(self, value: float) -> float:
+        """Return the z-score of a value against the baseline."""
+        std = max(math.sqrt(self.variance), self.min_std)
+        return (value - self.mean) / std
+
+    def update(self, value: float) -> None:
+        """
+        Fold a value into the baseline (O(1)).
+
+        Once warmed up, the step is clipped to ANOMALY_Z_CLEAR standard
+        deviations: genuine level changes are still learned over time, but a
+        fast drift cannot drag the baseline (and inflate the variance) along
+        before it is flagged.
+        """
+        self.samples += 1
+        if self.samples == 1:
+            self.mean = value
+            return
+        delta = value - self.mean
+        if self.samples > ANOMALY_WARMUP_SAMPLES:
+            limit = ANOMALY_Z_CLEAR * max(math.sqrt(self.variance), self.min_std)
+            delta = max(-limit, min(limit, delta))
+        self.mean += ANOMALY_ALPHA * delta
+        self.variance = (1 - ANOMALY_ALPHA) * (
+            self.variance + ANOMALY_ALPHA * delta * delta
+        )
+
+
+class TelemetryAnomalyDetector:
+    """
+    Flag thermal and fan problems from the raw telemetry stream.
+
+    Four derived signals are tracked, each with an incremental EWMA/z-score
+    baseline:
+
+    - sibling drift: a temperature's offset from the median of the sensors in
+      its numbered block group (e.g. heatsinks on one laser board)
+    - fan drop: a fan speed falling below its own learned level
+    - inlet/outlet delta: outlet minus inlet temperature rising above its
+      learned level
+    - fan drive: a fan's tacho speed per percent of PWM drive falling below
+      its learned level, i.e. the tacho drops while the PWM holds or rises
+
+    A signal is raised after ANOMALY_CONFIRM_SAMPLES consecutive samples
+    beyond ANOMALY_Z_RAISE and cleared once it falls below ANOMALY_Z_CLEAR.
+    Baselines are frozen while a signal is raised so an ongoing fault is not
+    learned as normal.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the detector."""
+        self._baselines: dict[tuple[str, str], _Baseline] = {}
+        self.active: dict[tuple[str, str], Anomaly] = {}
+
+    def pause(self) -> None:
+        """Clear raised anomalies while the projector is not running."""
+        self.active.clear()
+        for baseline in self._baselines.values():
+            baseline.over = 0
+
+    def observe(self, sample: dict[str, TelemetryColumns]) -> list[Anomaly]:
+        """
+        Feed one telemetry sample.
+
+        Args:
+            sample: Columns of the value types sampled this round
+
+        Returns:
+            Anomalies raised by this sample
+
+        """
+        raised: list[Anomaly] = []
+
+        temperatures = sample.get("Temperature")
+        if temperatures is not None:
+            self._observe_siblings(temperatures, raised)
+            self._observe_inlet_outlet(temperatures, raised)
+
+        speeds = sample.get("Speed")
+        if speeds is not None:
+            for name, reading in zip(speeds.names, speeds.values, strict=True):
+                # Only falling fan speeds are a fault
+                self._check(KIND_FAN_DROP, name, reading, -1.0, raised)
+            pwm = sample.get("PWM")
+            if pwm is not None:
+                self._observe_fan_drive(speeds, pwm, raised)
+
+        return raised
+
+    def _observe_siblings(
+        self, temperatures: TelemetryColumns, raised: list[Anomaly]
+    ) -> None:
+        """Track each temperature's offset from its sibling group median."""
+        groups: dict[str, list[tuple[str, float]]] = {}
+        for name, reading in zip(temperatures.names, temperatures.values, strict=True):
+            group = sibling_group(name)
+            if group is not None and not math.isnan(reading):
+                groups.setdefault(group, []).append((name, reading))
+
+        for members in groups.values():
+            if len(members) < ANOMALY_MIN_SIBLINGS:
+                continue
+            # Median, so one hot sensor does not shift its siblings' reference
+            reference = statistics.median(reading for _, reading in members)
+            for name, reading in members:
+                self._check(KIND_SIBLING_DRIFT, name, reading - reference, 0, raised)
+
+    def _observe_inlet_outlet(
+        self, temperatures: TelemetryColumns, raised: list[Anomaly]
+    ) -> None:
+        """Track outlet minus inlet temperature."""
+        inlet = next((n for n in temperatures.names if "inlet" in n), None)
+        outlet = next((n for n in temperatures.names if "outlet" in n), None)
+        if inlet is None or outlet is None:
+            return
+        values, index = temperatures.values, temperatures.index
+        delta = values[index[outlet]] - values[index[inlet]]
+        self._check(KIND_INLET_OUTLET_DELTA, outlet, delta, 1.0, raised)
+
+    def _observe_fan_drive(
+        self, speeds: TelemetryColumns, pwm: TelemetryColumns, raised: list[Anomaly]
+    ) -> None:
+        """Track each fan's speed per percent of PWM drive."""
+        drives = {
+            fan_key(name): reading
+            for name, reading in zip(pwm.names, pwm.values, strict=True)
+            if reading >= ANOMALY_MIN_PWM  # Also skips NaN
+        }
+        for name, reading in zip(speeds.names, speeds.values, strict=True):
+            drive = drives.get(fan_key(name))
+            if drive is not None:
+                # Only a falling ratio (less speed for the drive) is a fault
+                self._check(KIND_FAN_DRIVE, name, reading / drive, -1.0, raised)
+
+    def _check(
+        self,
+        kind: str,
+        sensor: str,
+        value: float,
+        direction: float,
+        raised: list[Anomaly],
+    ) -> None:
+        """
+        Score a signal value, raise/clear its anomaly and update its baseline.
+
+        Args:
+            kind: Signal kind
+            sensor: Environment block the signal belongs to
+            value: Current signal value (NaN = missing, ignored)
+            direction: 1 or -1 to flag one direction only, 0 for both
+            raised: Receives a newly raised anomaly
+
+        """
+        if math.isnan(value):
+            return
+        key = (kind, sensor)
+        baseline = self._baselines.get(key)
+        if baseline is None:
+            baseline = self._baselines[key] = _Baseline(ANOMALY_MIN_STD[kind])
+
+        if baseline.samples < ANOMALY_WARMUP_SAMPLES:
+            baseline.update(value)
+            return
+
+        z_score = baseline.score(value)
+        deviation = z_score * direction if direction else abs(z_score)
+
+        if key in self.active:
+            if deviation < ANOMALY_Z_CLEAR:
+                del self.active[key]
+                baseline.over = 0
+                _LOGGER.debug("Cleared %s anomaly on %s", kind, sensor)
+                baseline.update(value)
+            return
+
+        if deviation < ANOMALY_Z_RAISE:
+            baseline.over = 0
+            baseline.update(value)
+            return
+
+        baseline.over += 1
+        if baseline.over >= ANOMALY_CONFIRM_SAMPLES:
+            anomaly = Anomaly(
+                kind,
+                sensor,
+                round(value, 2),
+                round(baseline.mean, 2),
+                round(z_score, 1),
+            )
+            self.active[key] = anomaly
+            raised.append(anomaly)
+            _LOGGER.warning(
+                "Telemetry anomaly (%s) on %s: %.2f vs baseline %.2f (z=%.1f)",
+                kind,
+                sensor,
+                value,
+                baseline.mean,
+                z_score,
+            )
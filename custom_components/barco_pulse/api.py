@@ -9,15 +9,38 @@ import asyncio
 import json
 import logging
 import time
-from typing import Any
-
-from .const import PRESET_ASSIGNMENT_TUPLE_SIZE
+from contextlib import asynccontextmanager, nullcontext
+from typing import TYPE_CHECKING, Any
+
+from .command_queue import COMMAND_QUEUE_TIMEOUT, ReadyCommandQueue
+from .const import (
+    COMMAND_HOLD_STATES,
+    COMMAND_READY_STATES,
+    PRESET_ASSIGNMENT_TUPLE_SIZE,
+)
 from .exceptions import (
     BarcoApiError,
     BarcoAuthError,
     BarcoConnectionError,
+    BarcoError,
     BarcoStateError,
 )
+from .wol import (
+    WOL_ADDRESS,
+    WOL_PORT,
+    WOL_PROBE_MAX_DELAY,
+    WOL_PROBE_MIN_DELAY,
+    WOL_RESEND_INTERVAL,
+    WOL_WAKE_TIMEOUT,
+    async_port_open,
+    async_send_magic_packet,
+    normalize_mac,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+    from .transport import ConnectionFactory, TransportReader, TransportWriter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,6 +48,9 @@ _LOGGER = logging.getLogger(__name__)
 ERROR_PROPERTY_NOT_FOUND = -32601
 ERROR_DEVICE_BUSY = -32009  # Device busy transitioning states
 ERROR_METHOD_NOT_AVAILABLE = -32000  # Method/interface not available in current state
+# Errors with a null id for a request that could not be read: for a batch,
+# a sign that the projector does not accept batches (none of it ran)
+ERROR_BATCH_REJECTED: frozenset[int] = frozenset({-32700, -32600})
 
 # Rate limiting and buffer constants
 MIN_REQUEST_INTERVAL = 0.1  # Minimum seconds between requests (100ms)
@@ -32,6 +58,38 @@ MAX_RESPONSE_SIZE = 1024 * 1024  # Maximum response size in bytes (1MB)
 MAX_READ_CHUNKS = 256  # Maximum read iterations to prevent infinite loops
 READ_CHUNK_SIZE = 4096  # Bytes to read per chunk
 
+# Read cache freshness in seconds; properties not listed use DEFAULT_CACHE_TTL.
+# A TTL of 0 disables caching (reads still share in-flight requests).
+DEFAULT_CACHE_TTL = 1.0
+PROPERTY_CACHE_TTL: dict[str, float] = {
+    "system.state": 0.0,  # Drives state-dependent logic; always read fresh
+    "system.serialnumber": 3600.0,
+    "system.modelname": 3600.0,
+    "system.firmwareversion": 3600.0,
+    "network.device.lan.hwaddress": 3600.0,
+    "illumination.sources.laser.power.min": 10.0,
+    "illumination.sources.laser.power.max": 10.0,
+    "profile.profiles": 10.0,
+    "profile.presetassignments": 10.0,
+}
+
+
+_JSON_DECODER = json.JSONDecoder()
+_INCOMPLETE = object()  # More responses are needed to answer an exchange
+
+
+def _is_notification(message: Any) -> bool:
+    """Return True if a message is a JSON-RPC notification (no id)."""
+    return isinstance(message, dict) and "method" in message and "id" not in message
+
+
+def _is_batch_rejection(message: Any) -> bool:
+    """Return True if a message rejects a batch as a whole (none of it ran)."""
+    if not isinstance(message, dict) or message.get("id") is not None:
+        return False
+    error = message.get("error")
+    return isinstance(error, dict) and error.get("code") in ERROR_BATCH_REJECTED
+
 
 class BarcoDevice:
     """Barco Pulse projector device client."""
@@ -42,6 +100,7 @@ class BarcoDevice:
         port: int = 9090,
         auth_code: str | None = None,
         timeout: int = 10,
+        connection_factory: ConnectionFactory | None = None,
     ) -> None:
         """
         Initialize the Barco device client.
@@ -51,47 +110,119 @@ class BarcoDevice:
             port: TCP port (default 9090)
             auth_code: Optional 5-digit authentication code
             timeout: Request timeout in seconds
+            connection_factory: Optional transport factory (e.g. a session
+                recorder or replay transport); defaults to a plain TCP socket
 
         """
         self.host = host
         self.port = port
         self.auth_code = auth_code
         self.timeout = timeout
+        self._connection_factory = connection_factory or asyncio.open_connection
 
         self._lock = asyncio.Lock()
-        self._reader: asyncio.StreamReader | None = None
-        self._writer: asyncio.StreamWriter | None = None
+        self._reader: TransportReader | None = None
+        self._writer: TransportWriter | None = None
         self._connected = False
         self._request_id = 0
         self._max_request_id = 2**31 - 1  # Prevent overflow
         self._last_request_time = 0.0  # For rate limiting
         self._min_request_interval = MIN_REQUEST_INTERVAL
+        self._batch_supported = True  # Cleared if the projector rejects a batch
+        # Optional limit on concurrent requests shared with other devices
+        self.request_limiter: asyncio.Semaphore | None = None
+        self._read_buffer = b""
+
+        # Read cache (property -> (expiry, value)) and in-flight reads
+        # (property -> shared future of the batch fetching it)
+        self._cache: dict[str, tuple[float, Any]] = {}
+        self._inflight: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        self._cache_epoch = 0  # Bumped when the whole cache is invalidated
+        self._cache_generation: dict[str, int] = {}  # Bumped per invalidation
+        self._notification_listeners: list[Callable[[str, Any], None]] = []
+        self._connect_listeners: list[Callable[[], None]] = []
+
+        # Background read loop, started once anything is subscribed: it owns
+        # the socket's read side, resolving responses by id and dispatching
+        # notifications as they arrive instead of only during requests
+        self._read_task: asyncio.Task[None] | None = None
+        self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        self._subscribed_properties: set[str] = set()
+        self._subscribed_signals: set[str] = set()
+
+        # State-dependent commands sent while the projector is powering on
+        # wait here (up to command_timeout seconds after power_on) and are
+        # flushed as one batch once a poll or system.state notification
+        # reports it on
+        self.commands = ReadyCommandQueue(self.send_batch)
+        self.command_timeout = COMMAND_QUEUE_TIMEOUT
+        self._power_on_deadline = 0.0  # Loop time a power_on stops holding at
+        # The projector does not report its active profile; this is the one
+        # last activated through this client, forgotten whenever a change
+        # may have gone unseen (reconnect, leaving the on state)
+        self.active_profile: str | None = None
+
+        # Wake-on-LAN for ECO mode, where the JSON-RPC port is closed: the
+        # MAC address is read while the projector is awake (and restored by
+        # the coordinator across restarts)
+        self.mac_address: str | None = None
+        self._mac_lookup_failed = False  # Not reported; retried on reconnect
+        self.wol_address = WOL_ADDRESS
+        self.wol_port = WOL_PORT
+        self.wake_timeout = WOL_WAKE_TIMEOUT
+
+    @property
+    def is_connected(self) -> bool:
+        """Return True if the TCP session is open."""
+        return (
+            self._connected
+            and self._writer is not None
+            and not self._writer.is_closing()
+        )
+
+    @property
+    def _listening(self) -> bool:
+        """Return True if notifications are expected outside of requests."""
+        return bool(self._subscribed_properties or self._subscribed_signals)
 
     async def connect(self) -> None:
         """Establish connection to Barco Pulse device."""
+        async with self._lock:
+            await self._connect()
+
+    async def _connect(self) -> None:
+        """Establish connection; caller holds the request lock."""
         if self._connected and self._reader and self._writer:
             return
 
         try:
+            self._read_buffer = b""
             self._reader, self._writer = await asyncio.wait_for(
-                asyncio.open_connection(self.host, self.port),
+                self._connection_factory(self.host, self.port),
                 timeout=self.timeout,
             )
 
             # Mark as connected BEFORE authentication attempt
             # This ensures proper cleanup if auth fails
             self._connected = True
+            self.active_profile = None
+            self._mac_lookup_failed = False
+            if self._listening:
+                self._start_read_loop()
 
             # Authenticate if PIN provided
             # Wrapped in try/except to ensure cleanup on auth failure
             if self.auth_code:
                 try:
-                    await self.authenticate(self.auth_code)
+                    await self._authenticate(self.auth_code)
                 except Exception:
                     # Auth failed after connection opened - must cleanup
                     await self.disconnect()
                     raise
 
+            # Subscriptions are per connection; restore them after a reconnect
+            await self._resubscribe()
+
             _LOGGER.debug("Connected to %s:%s", self.host, self.port)
 
         except TimeoutError as err:
@@ -111,8 +242,130 @@ class BarcoDevice:
                 f"Failed to connect to {self.host}:{self.port}: {err}"
             ) from err
 
+        for listener in list(self._connect_listeners):
+            try:
+                listener()
+            except Exception:
+                _LOGGER.exception("Error in connect listener")
+
+    async def _resubscribe(self) -> None:
+        """Send the current property and signal subscriptions."""
+        for method, key, names in (
+            ("property.subscribe", "property", self._subscribed_properties),
+            ("signal.subscribe", "signal", self._subscribed_signals),
+        ):
+            if not names:
+                continue
+            try:
+                await self._request(method, {key: sorted(names)})
+            except (BarcoApiError, BarcoStateError) as err:
+                _LOGGER.debug("Could not restore %s: %s", method, err)
+
+    def add_connect_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """
+        Register a listener called after every (re)connect.
+
+        Subscribers use it to resynchronize state that may have changed while
+        the connection was down.
+
+        Returns:
+            Callback that removes the listener
+
+        """
+        self._connect_listeners.append(listener)
+
+        def _remove() -> None:
+            if listener in self._connect_listeners:
+                self._connect_listeners.remove(listener)
+
+        return _remove
+
+    def _start_read_loop(self) -> None:
+        """Start the background read loop for the current connection."""
+        if self._read_task and not self._read_task.done():
+            return
+        self._read_task = asyncio.get_running_loop().create_task(
+            self._read_loop(), name=f"barco_pulse_read_{self.host}"
+        )
+
+    def _stop_read_loop(self) -> None:
+        """Stop the background read loop and fail requests waiting on it."""
+        task, self._read_task = self._read_task, None
+        if task and task is not asyncio.current_task():
+            task.cancel()
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(BarcoConnectionError("Connection closed"))
+        self._pending.clear()
+
+    async def _read_loop(self) -> None:
+        """Read messages until the connection closes."""
+        reader = self._reader
+        try:
+            while reader is not None:
+                try:
+                    message = self._pop_buffered_message()
+                except BarcoApiError as err:
+                    _LOGGER.debug("Discarding unreadable data: %s", err)
+                    continue
+
+                if message is None:
+                    chunk = await reader.read(READ_CHUNK_SIZE)
+                    if not chunk:
+                        raise BarcoConnectionError("Connection closed by projector")
+                    self._read_buffer += chunk
+                    if len(self._read_buffer) > MAX_RESPONSE_SIZE:
+                        self._read_buffer = b""
+                        _LOGGER.warning("Discarding oversized message")
+                    continue
+
+                if _is_notification(message):
+                    self._dispatch_notification(message)
+                    continue
+
+                future = self._pending.pop(self._pending_id(message), None)
+                if future and not future.done():
+                    future.set_result(message)
+                else:
+                    _LOGGER.debug("Dropping unexpected response: %s", message)
+        except (BarcoConnectionError, ConnectionError, OSError) as err:
+            _LOGGER.debug("Read loop for %s:%s ended: %s", self.host, self.port, err)
+            # Close the writer so the next request reconnects
+            if self._reader is reader and self._writer:
+                self._writer.close()
+            self._stop_read_loop()
+
+    def _pending_id(self, message: Any) -> Any:
+        """Return the id of the pending request a response answers."""
+        if isinstance(message, list):
+            # Batch responses may come in any order; match any member
+            ids = [item.get("id") for item in message if isinstance(item, dict)]
+            return next((id_ for id_ in ids if id_ in self._pending), None)
+        response_id = message.get("id") if isinstance(message, dict) else None
+        if response_id is None and self._pending:
+            # Errors for unparsable requests (e.g. a rejected batch) carry a
+            # null id; requests are serialized, so all pending futures belong
+            # to the exchange it answers
+            return next(iter(self._pending))
+        return response_id
+
+    async def set_connection_factory(
+        self, connection_factory: ConnectionFactory
+    ) -> None:
+        """
+        Open connections with another transport factory from now on.
+
+        An open connection is closed if the factory changed, so the next
+        request reconnects through the new one.
+        """
+        if connection_factory == self._connection_factory:
+            return
+        self._connection_factory = connection_factory
+        await self.disconnect()
+
     async def disconnect(self) -> None:
         """Close the TCP connection."""
+        self._stop_read_loop()
         if self._writer:
             try:
                 self._writer.close()
@@ -126,7 +379,7 @@ class BarcoDevice:
                 _LOGGER.debug("Disconnected from %s:%s", self.host, self.port)
 
     async def _ensure_connected(self) -> None:
-        """Ensure connection is active, reconnect if needed."""
+        """Ensure connection is active, reconnect if needed (lock held)."""
         # Check if writer is closing (connection dropped)
         if self._writer and self._writer.is_closing():
             _LOGGER.warning("Connection closed, reconnecting...")
@@ -135,7 +388,7 @@ class BarcoDevice:
 
         # Reconnect if not connected
         if not self._connected:
-            await self.connect()
+            await self._connect()
 
     def _build_jsonrpc_request(
         self,
@@ -195,6 +448,9 @@ class BarcoDevice:
         Read JSON response from the projector.
 
         The Barco Pulse protocol returns raw JSON without HTTP headers.
+        Notifications (messages without an id) received while waiting are
+        dispatched to notification handlers; bytes following a complete
+        message are kept for the next read.
 
         Returns:
             Parsed JSON response
@@ -207,55 +463,75 @@ class BarcoDevice:
         if not self._reader:
             raise BarcoConnectionError("Not connected")
 
-        buffer = b""
         chunk_count = 0
 
-        # Apply overall timeout to the entire read operation
-        try:
-            while chunk_count < MAX_READ_CHUNKS:
-                chunk_count += 1
+        while chunk_count < MAX_READ_CHUNKS:
+            message = self._pop_buffered_message()
+            if message is not None:
+                if _is_notification(message):
+                    self._dispatch_notification(message)
+                    continue
+                _LOGGER.debug(
+                    "Successfully parsed response after %d chunks", chunk_count
+                )
+                return message
 
-                chunk = await self._reader.read(READ_CHUNK_SIZE)
+            chunk_count += 1
+            chunk = await self._reader.read(READ_CHUNK_SIZE)
 
-                if not chunk:
-                    raise BarcoConnectionError("Connection closed by projector")
+            if not chunk:
+                raise BarcoConnectionError("Connection closed by projector")
 
-                buffer += chunk
+            self._read_buffer += chunk
 
-                # Prevent unbounded buffer growth
-                if len(buffer) > MAX_RESPONSE_SIZE:
-                    raise BarcoApiError(
-                        -1, f"Response too large (>{MAX_RESPONSE_SIZE} bytes)"
-                    )
+            # Prevent unbounded buffer growth
+            if len(self._read_buffer) > MAX_RESPONSE_SIZE:
+                self._read_buffer = b""
+                raise BarcoApiError(
+                    -1, f"Response too large (>{MAX_RESPONSE_SIZE} bytes)"
+                )
 
-                # Try to parse as JSON
-                try:
-                    response = json.loads(buffer.decode("utf-8"))
-                except json.JSONDecodeError:
-                    # Need more data - check if we've received a complete message
-                    # by looking for closing brace
-                    decoded = buffer.decode("utf-8", errors="ignore")
-                    if decoded.count("{") > 0 and decoded.count("{") == decoded.count(
-                        "}"
-                    ):
-                        # We have balanced braces but invalid JSON - likely malformed
-                        _LOGGER.warning(
-                            "Received malformed JSON response: %s", decoded[:200]
-                        )
-                        raise BarcoApiError(-1, "Malformed JSON response") from None
-                    continue
-                else:
-                    _LOGGER.debug(
-                        "Successfully parsed response after %d chunks", chunk_count
-                    )
-                    return response
+        # If we exit the loop, we've hit max chunks
+        raise BarcoApiError(-1, f"Too many read attempts (>{MAX_READ_CHUNKS})")
 
-            # If we exit the loop, we've hit max chunks
-            raise BarcoApiError(-1, f"Too many read attempts (>{MAX_READ_CHUNKS})")
+    def _pop_buffered_message(self) -> Any:
+        """
+        Decode the first complete JSON message from the read buffer.
+
+        Returns:
+            Decoded message, or None if more data is needed
 
+        Raises:
+            BarcoApiError: If the buffer holds malformed JSON or invalid UTF-8
+
+        """
+        if not self._read_buffer.strip():
+            return None
+
+        try:
+            text = self._read_buffer.decode("utf-8")
         except UnicodeDecodeError as err:
+            if err.reason == "unexpected end of data":
+                # Multi-byte character split across chunks
+                return None
+            self._read_buffer = b""
             raise BarcoApiError(-1, f"Invalid response encoding: {err}") from err
 
+        start = len(text) - len(text.lstrip())
+        try:
+            message, end = _JSON_DECODER.raw_decode(text, start)
+        except json.JSONDecodeError:
+            # Need more data - unless braces are balanced, which means the
+            # message is complete but malformed
+            if text.count("{") > 0 and text.count("{") == text.count("}"):
+                self._read_buffer = b""
+                _LOGGER.warning("Received malformed JSON response: %s", text[:200])
+                raise BarcoApiError(-1, "Malformed JSON response") from None
+            return None
+
+        self._read_buffer = text[end:].lstrip().encode("utf-8")
+        return message
+
     def _parse_jsonrpc_response(
         self,
         response: dict[str, Any],
@@ -312,12 +588,90 @@ class BarcoDevice:
         # Return result
         return response.get("result")
 
+    def add_notification_listener(
+        self, listener: Callable[[str, Any], None]
+    ) -> Callable[[], None]:
+        """
+        Register a listener for JSON-RPC notifications.
+
+        Args:
+            listener: Called with (method, params) for every notification,
+                e.g. ("property.changed", {"property": [{"name": value}]})
+
+        Returns:
+            Callback that removes the listener
+
+        """
+        self._notification_listeners.append(listener)
+
+        def _remove() -> None:
+            if listener in self._notification_listeners:
+                self._notification_listeners.remove(listener)
+
+        return _remove
+
+    def _dispatch_notification(self, message: dict[str, Any]) -> None:
+        """Apply a notification to the read cache and forward it to listeners."""
+        method = message.get("method", "")
+        params = message.get("params")
+
+        if method == "property.changed" and isinstance(params, dict):
+            self._apply_property_changes(params.get("property"))
+
+        for listener in list(self._notification_listeners):
+            try:
+                listener(method, params)
+            except Exception:
+                _LOGGER.exception("Error in notification listener for %s", method)
+
+    def _apply_property_changes(self, changes: Any) -> None:
+        """Refresh cached values from a property.changed notification."""
+        if isinstance(changes, dict):
+            changes = [changes]
+        if not isinstance(changes, list):
+            return
+
+        now = time.monotonic()
+        for change in changes:
+            if not isinstance(change, dict):
+                continue
+            for name, value in change.items():
+                if name == "system.state":
+                    self._observe_state(value)
+                self.invalidate_cache([name])
+                ttl = PROPERTY_CACHE_TTL.get(name, DEFAULT_CACHE_TTL)
+                if ttl > 0:
+                    self._cache[name] = (now + ttl, value)
+
+    def invalidate_cache(self, property_names: list[str] | None = None) -> None:
+        """
+        Drop cached values so the next read goes to the projector.
+
+        Reads already in flight are detached as well, so their (possibly
+        outdated) results are neither shared nor cached.
+
+        Args:
+            property_names: Properties to invalidate; None invalidates all
+
+        """
+        if property_names is None:
+            self._cache_epoch += 1
+            self._cache.clear()
+            self._inflight.clear()
+            return
+        for name in property_names:
+            self._cache_generation[name] = self._cache_generation.get(name, 0) + 1
+            self._cache.pop(name, None)
+            self._inflight.pop(name, None)
+
     async def _cleanup_connection(self) -> None:
         """Clean up broken connection and reset state."""
+        self._stop_read_loop()
         writer = self._writer
         self._connected = False
         self._reader = None
         self._writer = None
+        self._read_buffer = b""
         if writer:
             try:
                 writer.close()
@@ -345,6 +699,21 @@ class BarcoDevice:
             BarcoApiError: If API returns error
             BarcoStateError: If property not available in current state
 
+        """
+        async with self._exclusive():
+            return await self._request(method, params)
+
+    @asynccontextmanager
+    async def _exclusive(
+        self, release: Callable[[], Awaitable[None]] | None = None
+    ) -> AsyncIterator[None]:
+        """
+        Hold the request lock on a connected, rate limited connection.
+
+        Args:
+            release: Awaited once connected, before taking a fleet request
+                limiter slot, so waiting on other projectors holds no slot
+
         """
         async with self._lock:
             # Enforce minimum interval between all requests
@@ -356,55 +725,243 @@ class BarcoDevice:
 
             self._last_request_time = time.time()
 
-            # Ensure connection is active
-            await self._ensure_connected()
+            limiter = self.request_limiter or nullcontext()
+            if release is not None:
+                async with limiter:
+                    await self._ensure_connected()
+                await release()
 
-            # Generate request ID (reset on overflow to prevent issues)
-            self._request_id += 1
-            if self._request_id > self._max_request_id:
-                self._request_id = 1
-            request_id = self._request_id
+            async with limiter:
+                # Ensure connection is active
+                await self._ensure_connected()
 
-            # Build JSON-RPC request
-            jsonrpc_request = self._build_jsonrpc_request(method, params, request_id)
-            json_payload = json.dumps(jsonrpc_request)
+                yield
 
-            # Build HTTP request
-            http_request = self._build_http_request(json_payload)
+    async def _request(self, method: str, params: Any = None) -> Any:
+        """
+        Send a JSON-RPC request on the open connection (request lock held).
 
-            _LOGGER.debug("Sending request: %s", json_payload)
+        Args:
+            method: JSON-RPC method name
+            params: Method parameters
 
-            # Send request and read response with overall timeout
-            try:
-                if not self._writer:
-                    raise BarcoConnectionError("Not connected")
+        Returns:
+            Result from JSON-RPC response
 
-                # Wrap both send and receive in a single timeout
-                async def _send_and_receive() -> dict[str, Any]:
+        Raises:
+            BarcoConnectionError: If connection fails
+            BarcoApiError: If API returns error
+            BarcoStateError: If property not available in current state
+
+        """
+        request_id = self._next_request_id()
+        response = await self._exchange(
+            self._build_jsonrpc_request(method, params, request_id), request_id
+        )
+        return self._parse_jsonrpc_response(response, request_id)
+
+    def _next_request_id(self) -> int:
+        """Return the next request ID (reset on overflow to prevent issues)."""
+        self._request_id += 1
+        if self._request_id > self._max_request_id:
+            self._request_id = 1
+        return self._request_id
+
+    async def _exchange(self, payload: Any, request_id: int | list[int]) -> Any:
+        """
+        Send a request (or batch) and wait for its response (request lock held).
+
+        Responses are matched by id; late responses to earlier requests are
+        dropped. A batch is answered by a batch response or, on firmware that
+        answers each member separately, once every member has been answered.
+
+        Args:
+            payload: JSON-RPC request object, or list of them for a batch
+            request_id: ID the response is matched by, or the IDs of a batch
+
+        Returns:
+            Decoded response message; for a batch the list of responses, or
+            an error with a null id if the batch was not accepted
+
+        Raises:
+            BarcoConnectionError: If connection fails
+
+        """
+        json_payload = json.dumps(payload)
+
+        # Build HTTP request
+        http_request = self._build_http_request(json_payload)
+
+        _LOGGER.debug("Sending request: %s", json_payload)
+
+        # Send request and read response with overall timeout
+        try:
+            if not self._writer:
+                raise BarcoConnectionError("Not connected")
+
+            ids = request_id if isinstance(request_id, list) else [request_id]
+            collected: dict[int, Any] = {}
+
+            # Wrap both send and receive in a single timeout
+            async def _send_and_receive() -> Any:
+                if self._read_task is None:
                     self._writer.write(http_request.encode("utf-8"))  # type: ignore[union-attr]
                     await self._writer.drain()  # type: ignore[union-attr]
-                    return await self._read_json_response()
+                    while True:
+                        response = self._collect_response(
+                            await self._read_json_response(), request_id, collected
+                        )
+                        if response is not _INCOMPLETE:
+                            return response
+
+                # The read loop owns the socket; wait for our responses
+                loop = asyncio.get_running_loop()
+                waiting: set[asyncio.Future[Any]] = set()
+                for id_ in ids:
+                    self._pending[id_] = loop.create_future()
+                    waiting.add(self._pending[id_])
+                try:
+                    self._writer.write(http_request.encode("utf-8"))  # type: ignore[union-attr]
+                    await self._writer.drain()  # type: ignore[union-attr]
+                    while waiting:
+                        done, waiting = await asyncio.wait(
+                            waiting, return_when=asyncio.FIRST_COMPLETED
+                        )
+                        for future in done:
+                            response = self._collect_response(
+                                future.result(), request_id, collected
+                            )
+                            if response is not _INCOMPLETE:
+                                return response
+                    raise BarcoConnectionError("Response lost")
+                finally:
+                    for id_ in ids:
+                        self._pending.pop(id_, None)
+
+            response = await asyncio.wait_for(
+                _send_and_receive(),
+                timeout=self.timeout,
+            )
+            _LOGGER.debug("Received response: %s", response)
 
-                response = await asyncio.wait_for(
-                    _send_and_receive(),
-                    timeout=self.timeout,
-                )
-                _LOGGER.debug("Received response: %s", response)
+        except TimeoutError as err:
+            await self._cleanup_connection()
+            raise BarcoConnectionError(
+                f"Request timeout after {self.timeout}s"
+            ) from err
+        except (ConnectionError, OSError) as err:
+            await self._cleanup_connection()
+            raise BarcoConnectionError(f"Failed to send request: {err}") from err
+        except BarcoConnectionError:
+            await self._cleanup_connection()
+            raise
+
+        return response
+
+    @staticmethod
+    def _collect_response(
+        message: Any, request_id: int | list[int], collected: dict[int, Any]
+    ) -> Any:
+        """
+        Match a message against the request(s) of an exchange.
 
-            except TimeoutError as err:
-                await self._cleanup_connection()
-                raise BarcoConnectionError(
-                    f"Request timeout after {self.timeout}s"
-                ) from err
-            except (ConnectionError, OSError) as err:
-                await self._cleanup_connection()
-                raise BarcoConnectionError(f"Failed to send request: {err}") from err
-            except BarcoConnectionError:
-                await self._cleanup_connection()
-                raise
+        Returns:
+            The exchange's response, or _INCOMPLETE if more are needed
+
+        """
+        if not isinstance(request_id, list):
+            if isinstance(message, dict) and message.get("id") not in (
+                request_id,
+                None,
+            ):
+                _LOGGER.debug("Dropping late response: %s", message)
+                return _INCOMPLETE
+            return message
+        if not isinstance(message, dict) or message.get("id") is None:
+            # A batch response, or an error for the batch as a whole
+            return message
+        if message["id"] not in request_id:
+            _LOGGER.debug("Dropping late response: %s", message)
+            return _INCOMPLETE
+        collected[message["id"]] = message
+        if len(collected) < len(request_id):
+            return _INCOMPLETE
+        return [collected[id_] for id_ in request_id]
+
+    async def send_batch(
+        self,
+        calls: list[tuple[str, Any]],
+        *,
+        release: Callable[[], Awaitable[None]] | None = None,
+    ) -> list[Any]:
+        """
+        Send several method calls as one JSON-RPC batch (one round trip).
+
+        Calls are sent in order. If the projector rejects batch requests as
+        such (a parse or invalid request error with a null id, so none of
+        them ran) they are sent one by one on the same connection instead,
+        and batching is not tried again. Calls that may have run are never
+        sent again.
+
+        Args:
+            calls: (method, params) pairs
+            release: Awaited once the connection is ready to send (lock held,
+                rate limit waited, connected; no fleet request limiter slot
+                held), so writes staged on several projectors can be released
+                together
+
+        Returns:
+            Per call, its result or the BarcoApiError/BarcoStateError it
+            failed with, in call order
+
+        Raises:
+            BarcoConnectionError: If connection fails
 
-            # Parse and return result
-            return self._parse_jsonrpc_response(response, request_id)
+        """
+        results: list[Any] = []
+        async with self._exclusive(release):
+            if len(calls) > 1 and self._batch_supported:
+                ids = [self._next_request_id() for _ in calls]
+                response = await self._exchange(
+                    [
+                        self._build_jsonrpc_request(method, params, request_id)
+                        for (method, params), request_id in zip(calls, ids, strict=True)
+                    ],
+                    ids,
+                )
+                if isinstance(response, list):
+                    by_id = {
+                        item.get("id"): item
+                        for item in response
+                        if isinstance(item, dict)
+                    }
+                    return [
+                        self._batch_result(by_id.get(request_id)) for request_id in ids
+                    ]
+                if not _is_batch_rejection(response):
+                    _LOGGER.debug("Unexpected batch response: %s", response)
+                    return [
+                        BarcoApiError(-1, "Unexpected response to batched call")
+                        for _ in ids
+                    ]
+                _LOGGER.debug("Batch requests not supported: %s", response)
+                self._batch_supported = False
+
+            for method, params in calls:
+                try:
+                    results.append(await self._request(method, params))
+                except (BarcoApiError, BarcoStateError) as err:
+                    results.append(err)
+        return results
+
+    def _batch_result(self, response: dict[str, Any] | None) -> Any:
+        """Return the result of one batch member, or the error it failed with."""
+        if response is None:
+            return BarcoApiError(-1, "No response for batched call")
+        try:
+            return self._parse_jsonrpc_response(response)
+        except (BarcoApiError, BarcoStateError) as err:
+            return err
 
     async def authenticate(self, code: str) -> bool:
         """
@@ -422,12 +979,25 @@ class BarcoDevice:
         """
         try:
             result = await self._send_request("authenticate", {"code": code})
-            if result:
-                _LOGGER.debug("Authentication successful")
-                return True
-            raise BarcoAuthError("Authentication failed")
         except BarcoApiError as err:
             raise BarcoAuthError(f"Authentication error: {err.message}") from err
+        return self._check_auth_result(result)
+
+    async def _authenticate(self, code: str) -> bool:
+        """Authenticate on the open connection (request lock held)."""
+        try:
+            result = await self._request("authenticate", {"code": code})
+        except BarcoApiError as err:
+            raise BarcoAuthError(f"Authentication error: {err.message}") from err
+        return self._check_auth_result(result)
+
+    @staticmethod
+    def _check_auth_result(result: Any) -> bool:
+        """Return True for a successful authenticate result, raise otherwise."""
+        if result:
+            _LOGGER.debug("Authentication successful")
+            return True
+        raise BarcoAuthError("Authentication failed")
 
     async def get_state(self) -> str:
         """
@@ -437,20 +1007,258 @@ class BarcoDevice:
             Power state (boot, eco, standby, ready, on, conditioning, deconditioning)
 
         """
-        return await self.get_property("system.state")
+        state = await self.get_property("system.state")
+        self._observe_state(state)
+        return state
+
+    def _observe_state(self, state: Any) -> None:
+        """Record an observed power state."""
+        self.commands.observe_state(state)
+        if state not in COMMAND_READY_STATES:
+            self.active_profile = None
+
+    async def get_mac_address(self) -> str | None:
+        """
+        Read and remember the projector's MAC address for Wake-on-LAN.
+
+        Tries network.device.lan.hwaddress, then the identification list
+        (system.getidentifications) of firmware without that property. If
+        neither reports one, the lookup is not repeated until the next
+        connection, so polls calling this don't keep sending failing requests.
+
+        Returns:
+            The normalized MAC address, or None if the projector reports none
+
+        Raises:
+            BarcoConnectionError: If connection fails
+
+        """
+        if self.mac_address is None and self._mac_lookup_failed:
+            return None
+        try:
+            mac = normalize_mac(await self.get_property("network.device.lan.hwaddress"))
+        except (BarcoApiError, BarcoStateError):
+            mac = None
+        if mac is None:
+            try:
+                identifications = await self._send_request("system.getidentifications")
+            except (BarcoApiError, BarcoStateError):
+                identifications = None
+            for item in identifications if isinstance(identifications, list) else []:
+                if isinstance(item, dict) and "mac" in str(item.get("key", "")).lower():
+                    mac = normalize_mac(item.get("value"))
+                    if mac is not None:
+                        break
+        if mac is not None:
+            self.mac_address = mac
+        else:
+            _LOGGER.debug("%s reports no MAC address", self.host)
+            self._mac_lookup_failed = True
+        return mac
+
+    async def wake(self) -> None:
+        """
+        Wake the projector from ECO mode with Wake-on-LAN.
+
+        Sends a burst of magic packets every WOL_RESEND_INTERVAL seconds and
+        probes the JSON-RPC port with a short, doubling backoff until it
+        accepts connections.
+
+        Raises:
+            BarcoConnectionError: If no MAC address is known, the packets
+                cannot be sent, or the port stays closed for wake_timeout
+
+        """
+        if self.mac_address is None:
+            raise BarcoConnectionError(
+                f"{self.host} is unreachable and its MAC address is unknown; "
+                "cannot wake it from ECO mode"
+            )
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.wake_timeout
+        next_burst = loop.time()
+        delay = WOL_PROBE_MIN_DELAY
+        _LOGGER.debug("Waking %s (%s) from ECO mode", self.host, self.mac_address)
+        while True:
+            if loop.time() >= next_burst:
+                try:
+                    await async_send_magic_packet(
+                        self.mac_address, self.wol_address, self.wol_port
+                    )
+                except OSError as err:
+                    raise BarcoConnectionError(
+                        f"Failed to send Wake-on-LAN packet to {self.wol_address}: "
+                        f"{err}"
+                    ) from err
+                next_burst = loop.time() + WOL_RESEND_INTERVAL
+            # Probes bypass the connection factory: a recording or replay
+            # transport must not see them
+            if await async_port_open(self.host, self.port):
+                _LOGGER.debug("%s:%s is listening again", self.host, self.port)
+                return
+            if loop.time() >= deadline:
+                raise BarcoConnectionError(
+                    f"{self.host}:{self.port} did not answer within "
+                    f"{self.wake_timeout:g} s of Wake-on-LAN"
+                )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, WOL_PROBE_MAX_DELAY)
 
     async def power_on(self) -> None:
-        """Power on the projector."""
-        await self._send_request("system.poweron")
+        """
+        Power on the projector, waking it from ECO mode first if needed.
+
+        In ECO mode the JSON-RPC port is closed. When the session is down and
+        a quick probe finds the port closed, the projector is woken with
+        Wake-on-LAN (see wake()) before system.poweron is sent. A session that
+        looked alive can also be stale, so if system.poweron fails to connect
+        the projector is woken and the command sent again. Commands the
+        still-booting projector rejects as busy are retried until
+        wake_timeout.
+
+        Raises:
+            BarcoConnectionError: If the projector cannot be reached or woken
+            BarcoApiError: If the projector rejects the command
+
+        """
+        loop = asyncio.get_running_loop()
+        # Commands issued from now on are held until the projector is on
+        self._power_on_deadline = loop.time() + self.wake_timeout + self.command_timeout
+        try:
+            woken = False
+            if (
+                self.mac_address is not None
+                and not self.is_connected
+                and not await async_port_open(self.host, self.port)
+            ):
+                await self.wake()
+                woken = True
+            deadline = loop.time() + self.wake_timeout
+            while True:
+                try:
+                    await self._send_request("system.poweron")
+                    break
+                except BarcoConnectionError:
+                    if woken or self.mac_address is None:
+                        raise
+                    _LOGGER.debug("%s unreachable, trying Wake-on-LAN", self.host)
+                    await self.wake()
+                    woken = True
+                    deadline = loop.time() + self.wake_timeout
+                except BarcoStateError:
+                    # Just woken: the projector may still be booting
+                    if not woken or loop.time() >= deadline:
+                        raise
+                    await asyncio.sleep(WOL_PROBE_MAX_DELAY)
+        except BarcoError:
+            self._power_on_deadline = 0.0
+            raise
+        self._power_on_deadline = loop.time() + self.command_timeout
+        self.invalidate_cache()
 
     async def power_off(self) -> None:
         """Power off the projector."""
+        self._power_on_deadline = 0.0
         await self._send_request("system.poweroff")
+        self.invalidate_cache()
+
+    def _hold_timeout(self) -> float | None:
+        """
+        Return how long state-dependent commands may be held.
+
+        Returns:
+            Seconds left of a power_on (or command_timeout while the projector
+            is booting or conditioning), or None if it is not powering on
+
+        """
+        wait = self._power_on_deadline - asyncio.get_running_loop().time()
+        if self.commands.state in COMMAND_HOLD_STATES:
+            wait = max(wait, self.command_timeout)
+        return wait if wait > 0 else None
+
+    async def _send_when_ready(self, method: str, params: Any = None) -> Any:
+        """
+        Send a state-dependent command, holding it while the projector powers on.
+
+        Raises:
+            BarcoStateError: If the projector is not on (not on in time, if it
+                is powering on)
+            BarcoApiError: If the projector rejects the command
+            BarcoConnectionError: If connection fails
+
+        """
+        (result,) = await self.send_batch_when_ready([(method, params)])
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    async def send_batch_when_ready(self, calls: list[tuple[str, Any]]) -> list[Any]:
+        """
+        Send state-dependent commands, holding them while the projector powers on.
+
+        The commands are sent right away, as one batch, unless the projector
+        is powering on (booting, conditioning, or power_on was called within
+        command_timeout) and not on yet. Commands rejected with
+        BarcoStateError are only held if the projector is powering on (its
+        state is read to confirm); otherwise, e.g. in standby or while it is
+        on but lacks a property, the rejection is returned at once. Held
+        commands wait no longer than the power on (see _hold_timeout()) and
+        are flushed together; system.state is subscribed so the transition to
+        on flushes them without waiting for the next poll.
+
+        Returns:
+            Per call, its result or the BarcoApiError/BarcoStateError it
+            failed with (BarcoStateError if not on in time)
+
+        Raises:
+            BarcoConnectionError: If connection fails
+
+        """
+        results: list[Any] = [None] * len(calls)
+        waiting = list(range(len(calls)))
+        wait = self._hold_timeout()
+        if wait is None or self.commands.state is None or self.commands.ready:
+            results = await self.send_batch(calls)
+            waiting = [
+                index
+                for index, result in enumerate(results)
+                if isinstance(result, BarcoStateError)
+            ]
+            if waiting:
+                # Confirm the state: it may have changed since last observed
+                try:
+                    await self.get_state()
+                except (BarcoApiError, BarcoStateError) as err:
+                    _LOGGER.debug("Power state unavailable: %s", err)
+                    self.commands.observe_state(None)
+            wait = self._hold_timeout()
+            if not waiting or self.commands.ready or wait is None:
+                return results
+            _LOGGER.debug("Holding %s commands, projector not ready", len(waiting))
+        held = [self.commands.hold(*calls[index]) for index in waiting]
+        if "system.state" not in self._subscribed_properties:
+            try:
+                await self.subscribe_properties(["system.state"])
+            except (BarcoConnectionError, BarcoApiError, BarcoStateError) as err:
+                # Polls still observe the state; the commands stay held
+                _LOGGER.debug("Power state subscription failed: %s", err)
+        outcomes = await asyncio.gather(
+            *(self.commands.async_result(future, wait) for future in held),
+            return_exceptions=True,
+        )
+        for index, outcome in zip(waiting, outcomes, strict=True):
+            if isinstance(outcome, BarcoConnectionError):
+                raise outcome
+            results[index] = outcome
+        return results
 
     async def get_property(self, property_name: str) -> Any:
         """
         Get a single property value.
 
+        Served from the read cache while fresh; concurrent reads of the same
+        property share one request.
+
         Args:
             property_name: Property name (e.g., "system.state")
 
@@ -458,12 +1266,17 @@ class BarcoDevice:
             Property value
 
         """
-        return await self._send_request("property.get", {"property": property_name})
+        result = await self.get_properties([property_name])
+        return result.get(property_name)
 
     async def get_properties(self, property_names: list[str]) -> dict[str, Any]:
         """
         Get multiple property values in a single request.
 
+        Fresh cached values are returned without a request, properties already
+        being fetched by a concurrent call join that request, and only the
+        remaining properties are sent as one batch.
+
         Args:
             property_names: List of property names
 
@@ -471,29 +1284,217 @@ class BarcoDevice:
             Dictionary mapping property names to values
 
         """
-        # Use batch property.get - API returns dict when array is passed
-        result = await self._send_request("property.get", {"property": property_names})
+        now = time.monotonic()
+        result: dict[str, Any] = {}
+        joined: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        to_fetch: list[str] = []
+
+        for name in dict.fromkeys(property_names):
+            cached = self._cache.get(name)
+            if cached is not None and cached[0] > now:
+                result[name] = cached[1]
+            elif name in self._inflight:
+                joined[name] = self._inflight[name]
+            else:
+                to_fetch.append(name)
+
+        if to_fetch:
+            result.update(await self._fetch_properties(to_fetch))
 
-        # When an array of properties is requested, result is a dict
-        if isinstance(result, dict):
-            return result
+        for name, future in joined.items():
+            # Shield so one caller's cancellation doesn't cancel the shared read
+            values = await asyncio.shield(future)
+            if name in values:
+                result[name] = values[name]
 
-        # Fallback for single property (shouldn't happen with list input)
-        return {property_names[0]: result}
+        return result
+
+    async def _fetch_properties(self, property_names: list[str]) -> dict[str, Any]:
+        """Fetch properties in one request shared with concurrent readers."""
+        future: asyncio.Future[dict[str, Any]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        for name in property_names:
+            self._inflight[name] = future
+        epoch = self._cache_epoch
+        generations = [self._cache_generation.get(name, 0) for name in property_names]
+
+        try:
+            if len(property_names) == 1:
+                value = await self._send_request(
+                    "property.get", {"property": property_names[0]}
+                )
+                values = {property_names[0]: value}
+            else:
+                # Batch property.get - API returns dict when array is passed
+                result = await self._send_request(
+                    "property.get", {"property": property_names}
+                )
+                # Fallback for non-dict result (shouldn't happen with list input)
+                values = (
+                    result if isinstance(result, dict) else {property_names[0]: result}
+                )
+        except asyncio.CancelledError:
+            # Joined readers were not cancelled; fail them like a lost read
+            future.set_exception(
+                BarcoConnectionError("Shared property read was cancelled")
+            )
+            future.exception()
+            raise
+        except Exception as err:
+            future.set_exception(err)
+            future.exception()  # Retrieved here; joined readers still get it
+            raise
+        finally:
+            for name in property_names:
+                if self._inflight.get(name) is future:
+                    del self._inflight[name]
+
+        future.set_result(values)
+
+        # Only cache values not invalidated while the request was in flight
+        if epoch == self._cache_epoch:
+            now = time.monotonic()
+            for name, generation in zip(property_names, generations, strict=True):
+                ttl = PROPERTY_CACHE_TTL.get(name, DEFAULT_CACHE_TTL)
+                if (
+                    ttl > 0
+                    and name in values
+                    and generation == self._cache_generation.get(name, 0)
+                ):
+                    self._cache[name] = (now + ttl, values[name])
+
+        return values
 
     async def set_property(self, property_name: str, value: Any) -> None:
         """
-        Set a property value.
+        Set a property value (held while the projector powers on).
 
         Args:
             property_name: Property name
             value: New value
 
+        Raises:
+            BarcoStateError: If the projector is not on (in time)
+
         """
-        await self._send_request(
-            "property.set", {"property": property_name, "value": value}
+        self.invalidate_cache([property_name])
+        try:
+            await self._send_when_ready(
+                "property.set", {"property": property_name, "value": value}
+            )
+        finally:
+            # Reads issued while the set was pending may hold the old value
+            self.invalidate_cache([property_name])
+
+    async def set_properties(self, values: dict[str, Any]) -> dict[str, Any]:
+        """
+        Set several properties in one batch (held while powering on).
+
+        Batch members may be applied in any order, so the values must not
+        depend on each other; activate a profile first with activate_profile().
+
+        Args:
+            values: Property name -> new value
+
+        Returns:
+            Per property the BarcoApiError or BarcoStateError it failed with;
+            empty if all succeeded
+
+        Raises:
+            BarcoConnectionError: If connection fails
+
+        """
+        calls = [
+            ("property.set", {"property": name, "value": value})
+            for name, value in values.items()
+        ]
+        self.invalidate_cache(list(values))
+        try:
+            results = await self.send_batch_when_ready(calls)
+        finally:
+            self.invalidate_cache(list(values))
+        return {
+            name: result
+            for name, result in zip(values, results, strict=True)
+            if isinstance(result, BaseException)
+        }
+
+    async def subscribe_properties(self, property_names: list[str]) -> None:
+        """
+        Subscribe to change notifications for properties.
+
+        Changes arrive as property.changed notifications, which refresh the
+        read cache and are forwarded to notification listeners. Subscriptions
+        are remembered and restored after a reconnect.
+
+        Args:
+            property_names: Properties to observe
+
+        """
+        self._subscribed_properties.update(property_names)
+        await self._send_subscription(
+            "property.subscribe", {"property": property_names}
         )
 
+    async def unsubscribe_properties(self, property_names: list[str]) -> None:
+        """
+        Stop change notifications for properties.
+
+        Args:
+            property_names: Properties to stop observing
+
+        """
+        self._subscribed_properties.difference_update(property_names)
+        await self._send_unsubscription(
+            "property.unsubscribe", {"property": property_names}
+        )
+
+    async def subscribe_signals(self, signal_names: list[str]) -> None:
+        """
+        Subscribe to signals.
+
+        Signals arrive as signal.callback notifications and are forwarded to
+        notification listeners. Subscriptions are remembered and restored
+        after a reconnect.
+
+        Args:
+            signal_names: Signals to observe (e.g. "notification.emitted")
+
+        """
+        self._subscribed_signals.update(signal_names)
+        await self._send_subscription("signal.subscribe", {"signal": signal_names})
+
+    async def unsubscribe_signals(self, signal_names: list[str]) -> None:
+        """
+        Stop observing signals.
+
+        Args:
+            signal_names: Signals to stop observing
+
+        """
+        self._subscribed_signals.difference_update(signal_names)
+        await self._send_unsubscription("signal.unsubscribe", {"signal": signal_names})
+
+    async def _send_subscription(self, method: str, params: dict[str, Any]) -> None:
+        """Start the read loop if needed and send a subscribe request."""
+        async with self._lock:
+            # A fresh connection already sends all remembered subscriptions
+            if not self._connected:
+                await self._connect()
+                return
+            await self._ensure_connected()
+            self._start_read_loop()
+            await self._request(method, params)
+
+    async def _send_unsubscription(self, method: str, params: dict[str, Any]) -> None:
+        """Send an unsubscribe request if connected."""
+        async with self._lock:
+            # A fresh connection only sends the remembered subscriptions
+            if not self._connected:
+                return
+            await self._request(method, params)
+
     async def get_source(self) -> str:
         """
         Get current input source.
@@ -515,6 +1516,17 @@ class BarcoDevice:
         result = await self._send_request("image.source.list")
         return result if isinstance(result, list) else []
 
+    async def get_connectors(self) -> list[str]:
+        """
+        Get list of input connectors.
+
+        Returns:
+            List of connector names (e.g. "DisplayPort 1")
+
+        """
+        result = await self._send_request("image.connector.list")
+        return [str(item) for item in result] if isinstance(result, list) else []
+
     async def set_source(self, source: str) -> None:
         """
         Set input source.
@@ -554,9 +1566,16 @@ class BarcoDevice:
             Tuple of (min_power, max_power)
 
         """
-        min_power = await self.get_property("illumination.sources.laser.power.min")
-        max_power = await self.get_property("illumination.sources.laser.power.max")
-        return (float(min_power), float(max_power))
+        result = await self.get_properties(
+            [
+                "illumination.sources.laser.power.min",
+                "illumination.sources.laser.power.max",
+            ]
+        )
+        return (
+            float(result["illumination.sources.laser.power.min"]),
+            float(result["illumination.sources.laser.power.max"]),
+        )
 
     async def get_brightness(self) -> float:
         """
@@ -675,6 +1694,111 @@ class BarcoDevice:
         result = await self.get_property("system.firmwareversion")
         return str(result)
 
+    async def post_key_event(self, key: str, event_type: str = "CLICKED") -> None:
+        """
+        Send a synthetic key event, as if pressed on the remote or keypad.
+
+        Args:
+            key: Key name (e.g. RC_MENU, KP_OK)
+            event_type: PRESS, RELEASE, REPEAT or CLICKED
+
+        """
+        await self._send_request(
+            "keydispatcher.postevent", {"key": key, "eventtype": event_type}
+        )
+
+    async def get_key_repeat_timing(self) -> tuple[float, float]:
+        """
+        Get the key repeat timing of the projector.
+
+        Returns:
+            Tuple of (initial repeat delay, repeat interval) in seconds
+
+        """
+        values = await self.get_properties(
+            ["keydispatcher.repeatdelay", "keydispatcher.repeatinterval"]
+        )
+        return (
+            float(values["keydispatcher.repeatdelay"]) / 1000,
+            float(values["keydispatcher.repeatinterval"]) / 1000,
+        )
+
+    async def get_control_blocks(
+        self, block_type: str = "Sensor", value_type: str = "Temperature"
+    ) -> dict[str, Any]:
+        """
+        Get a snapshot of environment control blocks in one request.
+
+        Args:
+            block_type: Control block type (Sensor, Filter, Controller, ...)
+            value_type: Sensor value type (Temperature, Speed, Voltage, ...)
+
+        Returns:
+            Dictionary mapping block names to their current readings
+
+        """
+        result = await self._send_request(
+            "environment.getcontrolblocks",
+            {"type": block_type, "valuetype": value_type},
+        )
+        return result if isinstance(result, dict) else {}
+
+    async def get_notifications(self) -> list[dict[str, Any]]:
+        """
+        Get all active projector notifications.
+
+        Returns:
+            Notifications (id, severity, code, message, ...) from
+            notification.list
+
+        """
+        result = await self._send_request("notification.list")
+        return [item for item in result if isinstance(item, dict)] if result else []
+
+    async def list_counters(self) -> list[dict[str, Any]]:
+        """
+        List the statistics counters of the projector.
+
+        Returns:
+            Counter descriptions (name, unit, ...) from statistics.listcounters
+
+        """
+        result = await self._send_request("statistics.listcounters")
+        return [item for item in result if isinstance(item, dict)] if result else []
+
+    async def get_counter_name(self, counter: str) -> str:
+        """
+        Get the display name of a statistics counter.
+
+        Args:
+            counter: Counter name as listed by statistics.listcounters
+
+        Returns:
+            Human-readable counter name
+
+        """
+        return str(await self._send_request(f"statistics.{counter}.getname"))
+
+    async def get_counter_values(self, counters: list[str]) -> dict[str, Any]:
+        """
+        Get statistics counter values in one request.
+
+        Args:
+            counters: Counter names as listed by statistics.listcounters
+
+        Returns:
+            Dictionary mapping counter names to their values
+
+        """
+        properties = await self.get_properties(
+            [f"statistics.{counter}.value" for counter in counters]
+        )
+        return {
+            counter: properties[f"statistics.{counter}.value"]
+            for counter in counters
+            if f"statistics.{counter}.value" in properties
+        }
+
     async def get_preset_assignments(self) -> dict[int, str]:
         """
         Get all preset assignments (preset number -> profile name mapping).
@@ -721,7 +1845,7 @@ class BarcoDevice:
 
     async def activate_preset(self, preset: int) -> bool:
         """
-        Activate a preset by number.
+        Activate a preset by number (held while the projector powers on).
 
         Args:
             preset: Preset number to activate
@@ -730,16 +1854,19 @@ class BarcoDevice:
             True if activation successful
 
         Raises:
-            BarcoStateError: If projector not in active state
+            BarcoStateError: If the projector is not on (in time)
             BarcoApiError: If preset not assigned or invalid
 
         """
-        result = await self._send_request("profile.activatepreset", preset)
+        result = await self._send_when_ready("profile.activatepreset", preset)
+        # A preset changes picture settings, source and more
+        self.invalidate_cache()
+        self.active_profile = None
         return bool(result)
 
     async def activate_profile(self, name: str) -> bool:
         """
-        Activate a profile by name.
+        Activate a profile by name (held while the projector powers on).
 
         Args:
             name: Profile name to activate
@@ -748,11 +1875,13 @@ class BarcoDevice:
             True if activation successful
 
         Raises:
-            BarcoStateError: If projector not in active state
+            BarcoStateError: If the projector is not on (in time)
             BarcoApiError: If profile not found
 
         """
-        result = await self._send_request("profile.activateprofile", name)
+        result = await self._send_when_ready("profile.activateprofile", name)
+        self.invalidate_cache()
+        self.active_profile = name
         return bool(result)
 
     async def get_profile_for_preset(self, preset: int) -> str:
@@ -10,9 +10,11 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
+from homeassistant.core import callback
+from homeassistant.helpers.entity import EntityCategory
 
 from .const import ACTIVE_STATES, PowerState
-from .entity import BarcoEntity
+from .entity import BarcoConnectorEntity, BarcoEntity, BarcoTelemetryEntity
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -21,8 +23,11 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .connectors import BarcoConnectorMonitor
     from .coordinator import BarcoDataUpdateCoordinator
     from .data import BarcoRuntimeData
+    from .notifications import BarcoNotificationManager
+    from .telemetry import BarcoTelemetryCoordinator
 
 
 def _is_power_on(data: dict[str, Any]) -> bool:
@@ -48,6 +53,13 @@ BINARY_SENSORS: tuple[BarcoBinarySensorEntityDescription, ...] = (
         device_class=BinarySensorDeviceClass.POWER,
         value_fn=_is_power_on,
     ),
+    BarcoBinarySensorEntityDescription(
+        key="stale",
+        translation_key="stale",
+        icon="mdi:history",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda data: bool(data.get("stale")),
+    ),
 )
 
 
@@ -72,6 +84,123 @@ class BarcoBinarySensor(BarcoEntity, BinarySensorEntity):
         return self.entity_description.value_fn(self.coordinator.data)
 
 
+class BarcoTelemetryAnomalySensor(BarcoTelemetryEntity, BinarySensorEntity):
+    """Problem sensor raised by the environment telemetry anomaly detector."""
+
+    _attr_translation_key = "telemetry_anomaly"
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coordinator: BarcoTelemetryCoordinator) -> None:
+        """Initialize the anomaly sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.coordinator.unique_id}_telemetry_anomaly"
+
+    @property
+    def is_on(self) -> bool:
+        """Return true if any telemetry anomaly is active."""
+        return bool(self.coordinator.anomalies.active)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the active anomalies."""
+        return {
+            "anomalies": [
+                {
+                    "kind": anomaly.kind,
+                    "sensor": anomaly.sensor,
+                    "value": anomaly.value,
+                    "baseline": anomaly.baseline,
+                    "z_score": anomaly.z_score,
+                }
+                for anomaly in self.coordinator.anomalies.active.values()
+            ]
+        }
+
+
+class BarcoNotificationProblemSensor(BarcoEntity, BinarySensorEntity):
+    """Problem sensor for active projector errors, warnings and cautions."""
+
+    _attr_translation_key = "notification"
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+
+    def __init__(
+        self,
+        coordinator: BarcoDataUpdateCoordinator,
+        notifications: BarcoNotificationManager,
+    ) -> None:
+        """Initialize the notification problem sensor."""
+        super().__init__(coordinator)
+        self._notifications = notifications
+        self._attr_unique_id = f"{coordinator.unique_id}_notification"
+
+    async def async_added_to_hass(self) -> None:
+        """Listen for notification changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._notifications.async_add_listener(self.async_write_ha_state)
+        )
+
+    @property
+    def is_on(self) -> bool:
+        """Return true if an error, warning or caution is active."""
+        return self._notifications.problem
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the active notifications."""
+        return {
+            "notifications": [
+                {
+                    "severity": item.get("severity"),
+                    "code": item.get("code"),
+                    "message": item.get("message"),
+                    "timestamp": item.get("timestamp"),
+                }
+                for item in self._notifications.active.values()
+            ]
+        }
+
+
+class BarcoConnectorSignalSensor(BarcoConnectorEntity, BinarySensorEntity):
+    """Signal detected on an input connector."""
+
+    _attr_icon = "mdi:video-input-hdmi"
+    _attr_translation_key = "connector_signal"
+
+    def __init__(
+        self,
+        coordinator: BarcoDataUpdateCoordinator,
+        connectors: BarcoConnectorMonitor,
+        connector: str,
+    ) -> None:
+        """Initialize the connector signal sensor."""
+        super().__init__(coordinator, connectors, connector)
+        self._attr_unique_id = f"{coordinator.unique_id}_connector_{connector}_signal"
+
+    @property
+    def is_on(self) -> bool:
+        """Return true if a signal is detected."""
+        return bool(self.signal.get("active"))
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the detected signal format."""
+        if not self.is_on:
+            return None
+        return {
+            key: self.signal.get(key)
+            for key in (
+                "name",
+                "bits_per_component",
+                "color_space",
+                "chroma_sampling",
+                "scan",
+                "signal_range",
+            )
+        }
+
+
 async def async_setup_entry(
     _hass: HomeAssistant,
     entry: ConfigEntry,
@@ -84,5 +213,29 @@ async def async_setup_entry(
     entities = [
         BarcoBinarySensor(coordinator, description) for description in BINARY_SENSORS
     ]
+    entities.append(BarcoTelemetryAnomalySensor(runtime_data.telemetry))
+    entities.append(
+        BarcoNotificationProblemSensor(coordinator, runtime_data.notifications)
+    )
 
     async_add_entities(entities)
+
+    # Connector sensors are added once the connector list has been read
+    connectors = runtime_data.connectors
+    known_connectors: set[str] = set()
+
+    @callback
+    def _async_add_connector_sensors() -> None:
+        """Add signal sensors for newly listed connectors."""
+        new_entities = []
+        for connector in connectors.connectors:
+            if connector not in known_connectors:
+                known_connectors.add(connector)
+                new_entities.append(
+                    BarcoConnectorSignalSensor(coordinator, connectors, connector)
+                )
+        if new_entities:
+            async_add_entities(new_entities)
+
+    _async_add_connector_sensors()
+    entry.async_on_unload(connectors.async_add_listener(_async_add_connector_sensors))
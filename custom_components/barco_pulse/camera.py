@@ -0,0 +1,126 @@
+"""Barco Pulse camera platform (OSD and LCD screen captures)."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+from homeassistant.components.camera import Camera
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import CONF_CAPTURE_INTERVAL, DEFAULT_CAPTURE_INTERVAL
+from .entity import BarcoEntity
+from .files import file_endpoint_url
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .coordinator import BarcoDataUpdateCoordinator
+    from .data import BarcoRuntimeData
+
+_LOGGER = logging.getLogger(__name__)
+
+# Capture kind -> file endpoint below http://<host>/api/ (spec §7.1.4-7.1.5)
+CAPTURE_ENDPOINTS = {
+    "osd": "ui/capture/osd",
+    "lcd": "ui/capture/lcd",
+}
+CAPTURE_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+
+class BarcoCaptureCamera(BarcoEntity, Camera):
+    """
+    Screen capture of the projector's OSD menu or LCD.
+
+    Captures are only fetched when a frame is requested, i.e. while someone
+    views the camera, and at most once per capture interval (an entry option):
+    requests within the interval, from any number of viewers, get the cached
+    frame, and concurrent requests share a single fetch. A capture whose
+    content hash matches the cached frame is dropped without replacing the
+    frame or writing entity state.
+    """
+
+    def __init__(self, coordinator: BarcoDataUpdateCoordinator, kind: str) -> None:
+        """Initialize the capture camera."""
+        BarcoEntity.__init__(self, coordinator)
+        Camera.__init__(self)
+        self._kind = kind
+        self._attr_translation_key = f"{kind}_capture"
+        self._attr_unique_id = f"{coordinator.unique_id}_{kind}_capture"
+        self._frame: bytes | None = None
+        self._digest: bytes | None = None
+        self._fetched = 0.0  # Monotonic time of the last fetch attempt
+        self._changed: float | None = None  # Unix time the content last changed
+        self._lock = asyncio.Lock()
+
+    @property
+    def capture_interval(self) -> float:
+        """Return the minimum seconds between two captures."""
+        return self.coordinator.config_entry.options.get(
+            CONF_CAPTURE_INTERVAL, DEFAULT_CAPTURE_INTERVAL
+        )
+
+    @property
+    def frame_interval(self) -> float:
+        """Return the interval between frames of the MJPEG stream."""
+        return self.capture_interval
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return when the captured content last changed."""
+        return {"changed": self._changed}
+
+    async def async_camera_image(
+        self,
+        width: int | None = None,  # noqa: ARG002
+        height: int | None = None,  # noqa: ARG002
+    ) -> bytes | None:
+        """Return the cached frame, capturing a new one if it is stale."""
+        async with self._lock:
+            if time.monotonic() - self._fetched >= self.capture_interval:
+                await self._async_capture()
+            return self._frame
+
+    async def _async_capture(self) -> None:
+        """Fetch a capture; keep serving the cached frame if that fails."""
+        self._fetched = time.monotonic()
+        url = file_endpoint_url(
+            self.coordinator.device.host, CAPTURE_ENDPOINTS[self._kind]
+        )
+        try:
+            async with async_get_clientsession(self.hass).get(
+                url, timeout=CAPTURE_TIMEOUT
+            ) as response:
+                response.raise_for_status()
+                frame = await response.read()
+                content_type = response.content_type
+        except (aiohttp.ClientError, TimeoutError) as err:
+            _LOGGER.debug("Could not capture %s of %s: %s", self._kind, url, err)
+            return
+
+        digest = hashlib.blake2b(frame, digest_size=16).digest()
+        if digest == self._digest:
+            return
+        self._frame = frame
+        self._digest = digest
+        self._changed = time.time()
+        self.content_type = content_type or self.content_type
+        self.async_write_ha_state()
+
+
+async def async_setup_entry(
+    _hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Barco Pulse cameras from a config entry."""
+    runtime_data: BarcoRuntimeData = entry.runtime_data
+    async_add_entities(
+        BarcoCaptureCamera(runtime_data.coordinator, kind) for kind in CAPTURE_ENDPOINTS
+    )
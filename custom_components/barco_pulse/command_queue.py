@@ -0,0 +1,158 @@
+"""Power-state gated command queue for Barco Pulse projectors."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .const import COMMAND_READY_STATES
+from .exceptions import BarcoError, BarcoStateError
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+COMMAND_QUEUE_TIMEOUT = 120.0  # Seconds a command waits for the projector
+
+
+@dataclass(slots=True)
+class _QueuedCommand:
+    """A held command and the future its caller awaits."""
+
+    method: str
+    params: Any
+    future: asyncio.Future[Any]
+    rejected: bool = False  # Already rejected once by a flush while ready
+
+
+class ReadyCommandQueue:
+    """
+    Hold state-dependent commands until the projector is ready or on.
+
+    Source, profile, laser power and picture setting commands fail with
+    BarcoStateError while the projector is in standby or still conditioning.
+    Such commands issued while it powers on are held here (each caller
+    waits, up to its timeout) and
+    sent as one batch as soon as a power state in COMMAND_READY_STATES is
+    observed, whether by a poll or by a system.state change notification.
+    A command the projector still rejects as not ready is held once more
+    until the next observation (it may report on a moment before accepting
+    commands); rejected again, it fails with that error.
+    """
+
+    def __init__(
+        self, send_batch: Callable[[list[tuple[str, Any]]], Awaitable[list[Any]]]
+    ) -> None:
+        """
+        Initialize the queue.
+
+        Args:
+            send_batch: Sends (method, params) calls in one round trip and
+                returns per call its result or error
+
+        """
+        self._send_batch = send_batch
+        self._commands: list[_QueuedCommand] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        self.state: str | None = None  # Last observed power state
+
+    def __len__(self) -> int:
+        """Return the number of held commands."""
+        return len(self._commands)
+
+    @property
+    def ready(self) -> bool:
+        """Return True if the projector was last seen in a ready state."""
+        return self.state in COMMAND_READY_STATES
+
+    def observe_state(self, state: Any) -> None:
+        """Record a power state seen by a poll or notification; flush if ready."""
+        self.state = state if isinstance(state, str) else None
+        if self.ready and self._commands:
+            self._schedule_flush()
+
+    def hold(self, method: str, params: Any) -> asyncio.Future[Any]:
+        """
+        Queue a command until the projector is ready.
+
+        Commands are sent in the order they were held.
+
+        Returns:
+            Future of the command's result; pass it to async_result()
+
+        """
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._commands.append(_QueuedCommand(method, params, future))
+        _LOGGER.debug("Holding %s until the projector is ready", method)
+        if self.ready:
+            self._schedule_flush()
+        return future
+
+    async def async_result(
+        self, future: asyncio.Future[Any], wait: float = COMMAND_QUEUE_TIMEOUT
+    ) -> Any:
+        """
+        Wait for a held command to be sent and return its result.
+
+        Args:
+            future: Future returned by hold()
+            wait: Seconds to wait for the projector before giving up
+
+        Raises:
+            BarcoStateError: If the projector is not ready within wait seconds
+            BarcoApiError: If the projector rejects the command
+            BarcoConnectionError: If the connection fails while flushing
+
+        """
+        try:
+            async with asyncio.timeout(wait):
+                return await asyncio.shield(future)
+        except TimeoutError:
+            msg = f"Projector not ready within {wait:g} s; command not sent"
+            raise BarcoStateError(msg) from None
+        finally:
+            # Drop the command if it was not sent (timeout or cancellation)
+            self._commands = [c for c in self._commands if c.future is not future]
+            if not future.done():
+                future.cancel()
+
+    def _schedule_flush(self) -> None:
+        """Start flushing unless a flush is already running."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(
+                self._flush(), name="barco_pulse_command_flush"
+            )
+
+    async def _flush(self) -> None:
+        """Send all held commands, in order, as one batch per round."""
+        while self.ready and self._commands:
+            batch = [c for c in self._commands if not c.future.done()]
+            self._commands.clear()
+            if not batch:
+                return
+            try:
+                results = await self._send_batch([(c.method, c.params) for c in batch])
+            except BarcoError as err:
+                results = [err] * len(batch)
+
+            retry = []
+            for command, result in zip(batch, results, strict=True):
+                if command.future.done():
+                    continue
+                if isinstance(result, BarcoStateError) and not command.rejected:
+                    command.rejected = True
+                    retry.append(command)
+                elif isinstance(result, BaseException):
+                    command.future.set_exception(result)
+                else:
+                    command.future.set_result(result)
+            if retry:
+                # On, but not accepting these yet: wait for the next observation
+                _LOGGER.debug("Projector not ready for %s commands yet", len(retry))
+                self._commands[:0] = retry
+                self.state = None
+            else:
+                _LOGGER.debug("Flushed %s held commands", len(batch))
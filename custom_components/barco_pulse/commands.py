@@ -0,0 +1,127 @@
+"""Remote command compilation for Barco Pulse integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from .helpers import parse_key_command, parse_preset_command
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+# Ops of the same group set the same state, so only the last of adjacent
+# ops in a group has any effect (a preset activates a profile too)
+GROUP_SOURCE = "source"
+GROUP_PROFILE = "profile"
+
+
+@dataclass(frozen=True, slots=True)
+class RemoteOp:
+    """One compiled remote command: a single JSON-RPC call."""
+
+    command: str  # Original command string, for result reporting
+    method: str
+    params: Any
+    group: str | None = None  # Collapse group of idempotent ops
+    key: str | None = None  # Key name for key presses
+
+    @property
+    def refresh(self) -> bool:
+        """Return True if the op changes state the coordinator polls."""
+        return self.key is None
+
+    @property
+    def barrier(self) -> bool:
+        """
+        Return True if the op must be sent on its own, after the ops before it.
+
+        A preset or profile rewrites source and picture settings, and batch
+        members may be processed in any order, so it never shares a batch.
+        """
+        return self.group == GROUP_PROFILE
+
+
+def _source_op(command: str, source: str) -> RemoteOp | None:
+    """Compile source_<name>."""
+    if not source:
+        return None
+    return RemoteOp(
+        command,
+        "property.set",
+        {"property": "image.window.main.source", "value": source},
+        group=GROUP_SOURCE,
+    )
+
+
+def _preset_op(command: str, _preset: str) -> RemoteOp | None:
+    """Compile preset_<number>."""
+    preset = parse_preset_command(command)
+    if preset is None:
+        return None
+    return RemoteOp(command, "profile.activatepreset", preset, group=GROUP_PROFILE)
+
+
+def _profile_op(command: str, profile: str) -> RemoteOp | None:
+    """Compile profile_<name>."""
+    if not profile:
+        return None
+    return RemoteOp(command, "profile.activateprofile", profile, group=GROUP_PROFILE)
+
+
+# Command prefix -> compiler of the text after "<prefix>_"
+_PREFIX_COMPILERS: dict[str, Callable[[str, str], RemoteOp | None]] = {
+    "source": _source_op,
+    "preset": _preset_op,
+    "profile": _profile_op,
+}
+
+
+@lru_cache(maxsize=256)
+def compile_command(command: str) -> RemoteOp | None:
+    """
+    Compile a remote command string (cached, so repeated macros are free).
+
+    Args:
+        command: Command string (source_<name>, preset_<n>, profile_<name> or
+            a remote/keypad key name)
+
+    Returns:
+        Compiled op, or None if the command is not understood
+
+    """
+    prefix, _, argument = command.partition("_")
+    compiler = _PREFIX_COMPILERS.get(prefix)
+    if compiler is not None:
+        return compiler(command, argument)
+    key = parse_key_command(command)
+    if key is None:
+        return None
+    return RemoteOp(
+        command,
+        "keydispatcher.postevent",
+        {"key": key, "eventtype": "CLICKED"},
+        key=key,
+    )
+
+
+def collapse_ops(ops: Iterable[RemoteOp]) -> tuple[list[RemoteOp], list[RemoteOp]]:
+    """
+    Drop ops superseded by the next op of the same collapse group.
+
+    Only adjacent ops collapse (source_HDMI 1, source_HDMI 2 -> source_HDMI 2);
+    an op of another kind in between keeps both, since it may depend on the
+    first.
+
+    Returns:
+        Tuple of (ops to send, superseded ops)
+
+    """
+    kept: list[RemoteOp] = []
+    superseded: list[RemoteOp] = []
+    for op in ops:
+        if kept and op.group is not None and kept[-1].group == op.group:
+            superseded.append(kept.pop())
+        kept.append(op)
+    return kept, superseded
@@ -2,26 +2,72 @@
 
 from __future__ import annotations
 
-import contextlib
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
-from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
+from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.selector import (
+    ObjectSelector,
+    SelectOptionDict,
+    SelectSelector,
+    SelectSelectorConfig,
+)
 
-from .api import BarcoDevice
-from .const import CONF_AUTH_CODE, DEFAULT_PORT, DEFAULT_TIMEOUT, DOMAIN
+from .const import (
+    CONF_AUTH_CODE,
+    CONF_CAPTURE_INTERVAL,
+    CONF_MEMBERS,
+    CONF_MIRROR_LEADER,
+    CONF_MIRROR_OFFSETS,
+    CONF_NETWORK,
+    CONF_RECORD_SESSIONS,
+    CONF_TELEMETRY_DEADBANDS,
+    DEFAULT_CAPTURE_INTERVAL,
+    DEFAULT_PORT,
+    DOMAIN,
+)
+from .discovery import DiscoveredProjector, async_scan
 from .exceptions import BarcoAuthError, BarcoConnectionError
+from .group import is_group_entry
+from .mirror import MIRROR_PROPERTIES
+from .registry import async_get_registry
+from .telemetry import TELEMETRY_DEADBANDS
+
+if TYPE_CHECKING:
+    from .api import BarcoDevice
 
 _LOGGER = logging.getLogger(__name__)
 
+GROUP_MIN_MEMBERS = 2
+CAPTURE_INTERVAL_RANGE = (0.5, 60.0)  # Seconds
+
 
 class BarcoConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Barco Pulse."""
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._discovered: dict[str, DiscoveredProjector] = {}
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Return the options flow of a projector or projector group."""
+        if is_group_entry(config_entry):
+            return BarcoGroupOptionsFlow()
+        return BarcoProjectorOptionsFlow()
+
     def _get_user_schema(self, defaults: dict[str, Any] | None = None) -> vol.Schema:
         """Get user configuration schema."""
         if defaults is None:
@@ -39,10 +85,142 @@ class BarcoConfigFlow(ConfigFlow, domain=DOMAIN):
             }
         )
 
+    def _projector_entries(self) -> dict[str, str]:
+        """Return configured projector entries (entry id -> title)."""
+        return {
+            entry.entry_id: entry.title
+            for entry in self._async_current_entries()
+            if not is_group_entry(entry)
+        }
+
+    def _get_group_schema(self, defaults: dict[str, Any] | None = None) -> vol.Schema:
+        """Get projector group configuration schema."""
+        if defaults is None:
+            defaults = {}
+
+        return vol.Schema(
+            {
+                vol.Required(CONF_NAME, default=defaults.get(CONF_NAME, "")): str,
+                vol.Required(
+                    CONF_MEMBERS, default=defaults.get(CONF_MEMBERS, [])
+                ): cv.multi_select(self._projector_entries()),
+            }
+        )
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
-        """Handle the initial step."""
+        """Handle the initial step: discover, enter a projector, or add a group."""
+        if user_input is not None:
+            return await self.async_step_projector(user_input)
+        menu_options = ["discover", "projector"]
+        if len(self._projector_entries()) >= GROUP_MIN_MEMBERS:
+            menu_options.append("group")
+        return self.async_show_menu(step_id="user", menu_options=menu_options)
+
+    async def async_step_discover(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle scanning a network for projectors."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            try:
+                found = await async_scan(
+                    user_input[CONF_NETWORK],
+                    user_input.get(CONF_PORT, DEFAULT_PORT),
+                )
+            except ValueError:
+                errors[CONF_NETWORK] = "invalid_network"
+            else:
+                # Skip projectors that are already configured (groups have
+                # neither a serial number nor a host)
+                entries = [
+                    entry
+                    for entry in self._async_current_entries()
+                    if not is_group_entry(entry)
+                ]
+                serials = {entry.unique_id for entry in entries} - {None}
+                hosts = {entry.data.get(CONF_HOST) for entry in entries}
+                self._discovered = {
+                    projector.host: projector
+                    for projector in found
+                    if projector.serial_number not in serials
+                    and projector.host not in hosts
+                }
+                if self._discovered:
+                    return await self.async_step_pick_projector()
+                errors["base"] = "no_devices_found"
+
+        if user_input is None:
+            user_input = {}
+        return self.async_show_form(
+            step_id="discover",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_NETWORK, default=user_input.get(CONF_NETWORK, "")
+                    ): str,
+                    vol.Optional(
+                        CONF_PORT, default=user_input.get(CONF_PORT, DEFAULT_PORT)
+                    ): int,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_pick_projector(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle picking a discovered projector."""
+        if user_input is not None:
+            projector = self._discovered[user_input[CONF_HOST]]
+            # Continue with the connection form, prefilled (an auth code may
+            # still be needed)
+            return self.async_show_form(
+                step_id="projector",
+                data_schema=self._get_user_schema(
+                    {CONF_HOST: projector.host, CONF_PORT: projector.port}
+                ),
+            )
+
+        labels = {
+            host: (
+                f"{projector.model_name} ({host}, {projector.serial_number})"
+                if projector.serial_number
+                else f"{host} (not identified)"
+            )
+            for host, projector in self._discovered.items()
+        }
+        return self.async_show_form(
+            step_id="pick_projector",
+            data_schema=vol.Schema({vol.Required(CONF_HOST): vol.In(labels)}),
+        )
+
+    async def async_step_group(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle creating a projector group from configured projectors."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            if len(user_input[CONF_MEMBERS]) < GROUP_MIN_MEMBERS:
+                errors[CONF_MEMBERS] = "too_few_members"
+            else:
+                return self.async_create_entry(
+                    title=user_input[CONF_NAME], data=user_input
+                )
+
+        return self.async_show_form(
+            step_id="group",
+            data_schema=self._get_group_schema(user_input),
+            errors=errors,
+        )
+
+    async def async_step_projector(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle connecting to a projector."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
@@ -52,19 +230,18 @@ class BarcoConfigFlow(ConfigFlow, domain=DOMAIN):
             # Convert empty string to None for auth_code
             auth_code = user_input.get(CONF_AUTH_CODE) or None
 
-            # Create device instance
-            device = BarcoDevice(
-                host=host,
-                port=port,
-                auth_code=auth_code,
-                timeout=DEFAULT_TIMEOUT,
-            )
+            # Shared session; stays warm for the entry setup that follows
+            registry = async_get_registry(self.hass)
+            device: BarcoDevice | None = None
 
             try:
                 # Try to connect and get device info
-                await device.connect()
-                serial_number = await device.get_serial_number()
-                model_name = await device.get_model_name()
+                device = await registry.async_acquire(host, port, auth_code)
+                info = await device.get_properties(
+                    ["system.serialnumber", "system.modelname"]
+                )
+                serial_number = str(info.get("system.serialnumber"))
+                model_name = str(info.get("system.modelname"))
 
                 # Set unique ID based on serial number
                 await self.async_set_unique_id(serial_number)
@@ -82,11 +259,11 @@ class BarcoConfigFlow(ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
             finally:
-                with contextlib.suppress(BarcoConnectionError, OSError):
-                    await device.disconnect()
+                if device is not None:
+                    await registry.async_release(device)
 
         return self.async_show_form(
-            step_id="user",
+            step_id="projector",
             data_schema=self._get_user_schema(user_input),
             errors=errors,
         )
@@ -105,6 +282,9 @@ class BarcoConfigFlow(ConfigFlow, domain=DOMAIN):
         if entry is None:
             return self.async_abort(reason="reconfigure_failed")
 
+        if is_group_entry(entry):
+            return await self.async_step_reconfigure_group(user_input)
+
         if user_input is not None:
             # Extract configuration
             host = user_input[CONF_HOST]
@@ -112,17 +292,13 @@ class BarcoConfigFlow(ConfigFlow, domain=DOMAIN):
             # Convert empty string to None for auth_code
             auth_code = user_input.get(CONF_AUTH_CODE) or None
 
-            # Create device instance
-            device = BarcoDevice(
-                host=host,
-                port=port,
-                auth_code=auth_code,
-                timeout=DEFAULT_TIMEOUT,
-            )
+            # Shared session; reused by the running entry and its reload
+            registry = async_get_registry(self.hass)
+            device: BarcoDevice | None = None
 
             try:
                 # Validate connection
-                await device.connect()
+                device = await registry.async_acquire(host, port, auth_code)
                 await device.get_state()
 
                 # Update entry
@@ -141,8 +317,8 @@ class BarcoConfigFlow(ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception during reconfigure")
                 errors["base"] = "unknown"
             finally:
-                with contextlib.suppress(BarcoConnectionError, OSError):
-                    await device.disconnect()
+                if device is not None:
+                    await registry.async_release(device)
 
         # Use existing entry data as defaults if no user input yet
         defaults = dict(entry.data) if user_input is None else user_input
@@ -153,6 +329,158 @@ class BarcoConfigFlow(ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    async def async_step_reconfigure_group(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle changing the members of a projector group."""
+        errors: dict[str, str] = {}
+        entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
+        if entry is None:
+            return self.async_abort(reason="reconfigure_failed")
+
+        if user_input is not None:
+            if len(user_input[CONF_MEMBERS]) < GROUP_MIN_MEMBERS:
+                errors[CONF_MEMBERS] = "too_few_members"
+            else:
+                # The group reloads itself through its update listener
+                self.hass.config_entries.async_update_entry(
+                    entry, title=user_input[CONF_NAME], data=user_input
+                )
+                return self.async_abort(reason="reconfigure_successful")
+
+        defaults = dict(entry.data) if user_input is None else user_input
+
+        return self.async_show_form(
+            step_id="reconfigure_group",
+            data_schema=self._get_group_schema(defaults),
+            errors=errors,
+        )
+
     async def async_step_import(self, user_input: dict[str, Any]) -> ConfigFlowResult:
         """Handle import from YAML configuration."""
         return await self.async_step_user(user_input)
+
+
+def _parse_offsets(
+    raw: Any, ids: dict[str, str], leader: str
+) -> dict[str, dict[str, float]] | None:
+    """
+    Convert offsets entered per follower title to offsets per entry id.
+
+    Returns:
+        Offsets per follower entry id, or None if the input is invalid
+
+    """
+    if not isinstance(raw, dict):
+        return None
+    offsets: dict[str, dict[str, float]] = {}
+    for title, values in raw.items():
+        if title not in ids or ids[title] == leader or not isinstance(values, dict):
+            return None
+        try:
+            offsets[ids[title]] = {
+                key: float(value)
+                for key, value in values.items()
+                if key in MIRROR_PROPERTIES
+            }
+        except (TypeError, ValueError):
+            return None
+    return offsets
+
+
+class BarcoGroupOptionsFlow(OptionsFlow):
+    """Handle projector group options (picture setting mirroring)."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Select a mirror leader and per follower offsets."""
+        errors: dict[str, str] = {}
+        titles: dict[str, str] = {}
+        for entry_id in self.config_entry.data[CONF_MEMBERS]:
+            member = self.hass.config_entries.async_get_entry(entry_id)
+            titles[entry_id] = member.title if member is not None else entry_id
+        ids = {title: entry_id for entry_id, title in titles.items()}
+
+        if user_input is not None:
+            leader = user_input.get(CONF_MIRROR_LEADER, "")
+            offsets = _parse_offsets(
+                user_input.get(CONF_MIRROR_OFFSETS, {}), ids, leader
+            )
+            if offsets is None:
+                errors[CONF_MIRROR_OFFSETS] = "invalid_offsets"
+            else:
+                return self.async_create_entry(
+                    data={CONF_MIRROR_LEADER: leader, CONF_MIRROR_OFFSETS: offsets}
+                )
+
+        options = self.config_entry.options
+        default_offsets = {
+            titles.get(entry_id, entry_id): values
+            for entry_id, values in options.get(CONF_MIRROR_OFFSETS, {}).items()
+        }
+        schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_MIRROR_LEADER,
+                    default=options.get(CONF_MIRROR_LEADER, ""),
+                ): SelectSelector(
+                    SelectSelectorConfig(
+                        options=[
+                            SelectOptionDict(value="", label="-"),
+                            *(
+                                SelectOptionDict(value=entry_id, label=title)
+                                for entry_id, title in titles.items()
+                            ),
+                        ]
+                    )
+                ),
+                vol.Optional(
+                    CONF_MIRROR_OFFSETS, default=default_offsets
+                ): ObjectSelector(),
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
+
+
+class BarcoProjectorOptionsFlow(OptionsFlow):
+    """Handle projector options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Show the projector options."""
+        return await self.async_step_projector(user_input)
+
+    async def async_step_projector(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Set capture limit, telemetry deadbands and session recording."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        low, high = CAPTURE_INTERVAL_RANGE
+        schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_CAPTURE_INTERVAL,
+                    default=self.config_entry.options.get(
+                        CONF_CAPTURE_INTERVAL, DEFAULT_CAPTURE_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=low, max=high)),
+                **{
+                    vol.Optional(
+                        key,
+                        default=self.config_entry.options.get(
+                            key, TELEMETRY_DEADBANDS[value_type].absolute
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0))
+                    for value_type, key in CONF_TELEMETRY_DEADBANDS.items()
+                },
+                vol.Optional(
+                    CONF_RECORD_SESSIONS,
+                    default=self.config_entry.options.get(CONF_RECORD_SESSIONS, False),
+                ): bool,
+            }
+        )
+        return self.async_show_form(step_id="projector", data_schema=schema)
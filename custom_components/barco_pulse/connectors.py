@@ -0,0 +1,233 @@
+"""Input connector signal monitoring for Barco Pulse integration."""
+
+from __future__ import annotations
+
+import logging
+import re
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.debounce import Debouncer
+
+from .const import DOMAIN
+from .exceptions import BarcoApiError, BarcoConnectionError, BarcoStateError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .api import BarcoDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+CONNECTOR_PREFIX = "image.connector."
+DETECTED_SIGNAL = ".detectedsignal"
+MODEL_UPDATE_SIGNALS = ("modelupdated", "introspect.objectchanged")
+CONNECTOR_RELOAD_COOLDOWN = 5.0  # Seconds to coalesce model update bursts
+
+
+def connector_object_name(connector: str) -> str:
+    """Return the object name of a connector ("DisplayPort 1" -> "displayport1")."""
+    return re.sub(r"\W", "", connector).lower()
+
+
+def detected_signal_property(object_name: str) -> str:
+    """Return the detectedsignal property of a connector object."""
+    return f"{CONNECTOR_PREFIX}{object_name}{DETECTED_SIGNAL}"
+
+
+class BarcoConnectorMonitor:
+    """
+    Detected input signal per connector, pushed by property subscriptions.
+
+    The connector list is read once and cached; it is only re-read when the
+    projector signals a model update touching image.connector objects. Every
+    connector's detectedsignal property is subscribed, so a source dropping
+    out or a frame-rate change is reflected immediately without polling.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, device: BarcoDevice
+    ) -> None:
+        """Initialize the connector monitor."""
+        self.hass = hass
+        self.entry = entry
+        self.device = device
+        self.connectors: dict[str, str] = {}  # Object name -> display name
+        self.signals: dict[str, dict[str, Any]] = {}  # Object name -> signal
+        self._listeners: list[Callable[[], None]] = []
+        self._unsubscribers: list[Callable[[], None]] = []
+        self._started = False
+        self._reload_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=CONNECTOR_RELOAD_COOLDOWN,
+            immediate=False,
+            function=self.async_reload_connectors,
+        )
+
+    @callback
+    def async_add_listener(
+        self, update_callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Listen for connector list or signal changes."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def _remove() -> None:
+            if update_callback in self._listeners:
+                self._listeners.remove(update_callback)
+
+        return _remove
+
+    @callback
+    def _async_update_listeners(self) -> None:
+        """Notify entities of a change."""
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    async def async_start(self) -> None:
+        """Read connectors and subscribe to their signals."""
+        self._unsubscribers = [
+            self.device.add_notification_listener(self._handle_notification),
+            self.device.add_connect_listener(self._handle_connect),
+        ]
+        try:
+            await self.device.subscribe_signals(list(MODEL_UPDATE_SIGNALS))
+        except (BarcoConnectionError, BarcoApiError, BarcoStateError) as err:
+            _LOGGER.debug("Model update subscription deferred: %s", err)
+        await self.async_reload_connectors()
+
+    async def async_stop(self) -> None:
+        """Stop monitoring connectors and drop their subscriptions."""
+        self._reload_debouncer.async_shutdown()
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        self._unsubscribers = []
+        properties = [detected_signal_property(name) for name in self.connectors]
+        for unsubscribe, names in (
+            (self.device.unsubscribe_signals, list(MODEL_UPDATE_SIGNALS)),
+            (self.device.unsubscribe_properties, properties),
+        ):
+            if not names:
+                continue
+            try:
+                await unsubscribe(names)
+            except (BarcoConnectionError, BarcoApiError, BarcoStateError) as err:
+                _LOGGER.debug("Could not unsubscribe connector signals: %s", err)
+
+    async def async_reload_connectors(self) -> None:
+        """Re-read the connector list and (un)subscribe detectedsignal."""
+        try:
+            names = await self.device.get_connectors()
+        except (BarcoConnectionError, BarcoApiError, BarcoStateError) as err:
+            _LOGGER.debug("Could not read connector list: %s", err)
+            return
+
+        connectors = {connector_object_name(name): name for name in names}
+        removed = self.connectors.keys() - connectors.keys()
+        added = connectors.keys() - self.connectors.keys()
+        self.connectors = connectors
+        self._started = True
+        for object_name in removed:
+            self.signals.pop(object_name, None)
+
+        try:
+            if removed:
+                await self.device.unsubscribe_properties(
+                    [detected_signal_property(name) for name in removed]
+                )
+            if added:
+                await self.device.subscribe_properties(
+                    [detected_signal_property(name) for name in added]
+                )
+        except (BarcoConnectionError, BarcoApiError, BarcoStateError) as err:
+            _LOGGER.debug("Could not update connector subscriptions: %s", err)
+
+        # Subscribing does not report current values; read them once
+        await self.async_refresh_signals()
+
+    async def async_refresh_signals(self) -> None:
+        """Read the detected signal of every connector in one request."""
+        if not self.connectors:
+            self._async_update_listeners()
+            return
+        try:
+            values = await self.device.get_properties(
+                [detected_signal_property(name) for name in self.connectors]
+            )
+        except (BarcoConnectionError, BarcoApiError, BarcoStateError) as err:
+            _LOGGER.debug("Could not read detected signals: %s", err)
+            values = {}
+        for prop, value in values.items():
+            self._apply(prop, value)
+        self._async_update_listeners()
+
+    def _apply(self, prop: str, value: Any) -> bool:
+        """Store a detectedsignal value; return True if it belongs to us."""
+        if not (prop.startswith(CONNECTOR_PREFIX) and prop.endswith(DETECTED_SIGNAL)):
+            return False
+        object_name = prop[len(CONNECTOR_PREFIX) : -len(DETECTED_SIGNAL)]
+        if object_name not in self.connectors:
+            return False
+        self.signals[object_name] = value if isinstance(value, dict) else {}
+        return True
+
+    @callback
+    def _handle_connect(self) -> None:
+        """Re-read signals after a reconnect (changes may have been missed)."""
+        if not self._started:
+            # Offline at startup: the connector list was never read
+            self.entry.async_create_background_task(
+                self.hass, self.async_reload_connectors(), f"{DOMAIN}_connector_load"
+            )
+            return
+        self.device.invalidate_cache(
+            [detected_signal_property(name) for name in self.connectors]
+        )
+        self.entry.async_create_background_task(
+            self.hass, self.async_refresh_signals(), f"{DOMAIN}_connector_refresh"
+        )
+
+    @callback
+    def _handle_notification(self, method: str, params: Any) -> None:
+        """Apply detectedsignal changes and connector model updates."""
+        if not isinstance(params, dict):
+            return
+        if method == "property.changed":
+            self._handle_property_changes(params.get("property"))
+        elif method == "signal.callback":
+            self._handle_signals(params.get("signal"))
+
+    def _handle_property_changes(self, changes: Any) -> None:
+        """Apply changed detectedsignal properties."""
+        if isinstance(changes, dict):
+            changes = [changes]
+        if not isinstance(changes, list):
+            return
+        changed = False
+        for change in changes:
+            if isinstance(change, dict):
+                for prop, value in change.items():
+                    changed |= self._apply(prop, value)
+        if changed:
+            self._async_update_listeners()
+
+    def _handle_signals(self, signals: Any) -> None:
+        """Schedule a connector list reload on connector model updates."""
+        if isinstance(signals, dict):
+            signals = [signals]
+        if not isinstance(signals, list):
+            return
+        for signal in signals:
+            if not isinstance(signal, dict):
+                continue
+            for name, args in signal.items():
+                if (
+                    name in MODEL_UPDATE_SIGNALS
+                    and isinstance(args, dict)
+                    and str(args.get("object", "")).startswith(CONNECTOR_PREFIX)
+                ):
+                    self._reload_debouncer.async_schedule_call()
@@ -18,6 +18,12 @@ DEFAULT_TIMEOUT = 10
 # Keep persistent connections for better performance
 # Connection cleanup is handled on errors and shutdown
 CLOSE_CONNECTION_AFTER_UPDATE = False
+# Seconds an unused shared session stays open (keeps it warm across reloads)
+SESSION_IDLE_TIMEOUT = 60
+
+# hass.data[DOMAIN] keys
+DATA_CONNECTIONS = "connections"
+DATA_FLEET = "fleet"
 
 
 class PowerState(StrEnum):
@@ -42,6 +48,18 @@ ACTIVE_STATES: frozenset[PowerState] = frozenset(
     }
 )
 
+# States accepting state-dependent commands (source, profiles, laser power,
+# picture settings); commands held by the device are flushed on entering them
+COMMAND_READY_STATES: frozenset[PowerState] = frozenset(
+    {PowerState.ON, PowerState.READY}
+)
+
+# Transitions towards on: state-dependent commands issued meanwhile are held
+# (outside these, and of a recent power on, they are sent once and may fail)
+COMMAND_HOLD_STATES: frozenset[PowerState] = frozenset(
+    {PowerState.BOOT, PowerState.CONDITIONING}
+)
+
 STANDBY_STATES: frozenset[PowerState] = frozenset(
     {
         PowerState.STANDBY,
@@ -63,13 +81,117 @@ POLLING_INTERVALS: dict[PowerState, timedelta] = {
 
 DEFAULT_POLLING_INTERVAL = timedelta(seconds=10)
 
+# Environment telemetry sampling (separate from the state polling loop)
+TELEMETRY_INTERVAL = timedelta(seconds=30)
+TELEMETRY_INTERVAL_STANDBY = timedelta(minutes=5)
+# environment.getcontrolblocks sensor value types sampled by telemetry
+TELEMETRY_VALUE_TYPES: tuple[str, ...] = ("Temperature", "Speed", "PWM", "Voltage")
+# statistics.* runtime counters change slowly; sample them rarely
+COUNTER_INTERVAL = timedelta(minutes=10)
+# Fired when the telemetry anomaly detector raises a new anomaly
+EVENT_TELEMETRY_ANOMALY = f"{DOMAIN}_telemetry_anomaly"
+# Fired when a projector notification is emitted or dismissed
+EVENT_NOTIFICATION = f"{DOMAIN}_notification"
+# Fired for every key event of the projector's own remote control or keypad
+EVENT_KEY = f"{DOMAIN}_key"
+# Fired while a file is streamed to or from a projector file endpoint
+EVENT_FILE_TRANSFER = f"{DOMAIN}_file_transfer"
+# Dirty pages of the local telemetry history are written back this often
+HISTORY_FLUSH_INTERVAL = timedelta(minutes=5)
+# Downloaded log archives (below the config directory) and how many are kept
+LOG_DIRECTORY = f"{DOMAIN}_logs"
+LOG_KEEP_ARCHIVES = 7  # Per projector and log kind
+
 # Configuration keys
 CONF_AUTH_CODE = "auth_code"
+CONF_NETWORK = "network"  # Discovery: network to scan in CIDR notation
+CONF_MEMBERS = "members"  # Projector group: config entry ids of the members
+# Projector group options: picture settings mirrored from a leader member,
+# with per follower entry id offsets ({entry_id: {"brightness": 0.02}})
+CONF_MIRROR_LEADER = "mirror_leader"
+CONF_MIRROR_OFFSETS = "mirror_offsets"
+# Projector options
+CONF_CAPTURE_INTERVAL = "capture_interval"  # Minimum seconds between captures
+DEFAULT_CAPTURE_INTERVAL = 2.0
+# Diagnostics: record raw projector traffic to <config>/barco_pulse_<entry_id>.bprc
+# so sessions can be replayed offline with transport.ReplayTransport
+CONF_RECORD_SESSIONS = "record_sessions"
+# Absolute telemetry deadband per value type (defaults in TELEMETRY_DEADBANDS)
+CONF_TELEMETRY_DEADBANDS: dict[str, str] = {
+    "Temperature": "deadband_temperature",
+    "Speed": "deadband_speed",
+    "PWM": "deadband_pwm",
+    "Voltage": "deadband_voltage",
+}
+
+# Dispatched with (entry_id, loaded) when a projector entry is set up/unloaded
+SIGNAL_PROJECTOR_UPDATED = f"{DOMAIN}_projector_updated"
 
 # API constants
 PRESET_ASSIGNMENT_TUPLE_SIZE = 2  # [preset_num, profile_name]
 PRESET_MAX_NUMBER = 29  # Presets range from 0 to 29 (30 total)
 
+# keydispatcher.postevent key names (remote control RC_* and keypad KP_*)
+REMOTE_KEYS: frozenset[str] = frozenset(
+    {
+        *(
+            f"RC_{key}"
+            for key in (
+                "SHUTTER_OPEN",
+                "SHUTTER_CLOSE",
+                "POWER_ON",
+                "POWER_OFF",
+                "OSD",
+                "LCD",
+                "PATTERN",
+                "RGB",
+                "ZOOM_PLUS",
+                "ZOOM_MINUS",
+                "SHIFT_LEFT",
+                "SHIFT_UP",
+                "SHIFT_RIGHT",
+                "SHIFT_DOWN",
+                "FOCUS_PLUS",
+                "FOCUS_MINUS",
+                "MENU",
+                "DEFAULT",
+                "BACK",
+                "UP",
+                "LEFT",
+                "OK",
+                "RIGHT",
+                "DOWN",
+                "ADDRESS",
+                "INPUT",
+                "MACRO",
+                "ASTERISK",
+                "NUMBER",
+                *(str(digit) for digit in range(10)),
+            )
+        ),
+        *(
+            f"KP_{key}"
+            for key in (
+                "LEFT",
+                "UP",
+                "OK",
+                "RIGHT",
+                "DOWN",
+                "MENU",
+                "POWER",
+                "BACK",
+                "OSD",
+                "LENS",
+                "PATTERN",
+                "SHUTTER",
+            )
+        ),
+    }
+)
+# Used when keydispatcher.repeatdelay / repeatinterval cannot be read
+DEFAULT_KEY_REPEAT_DELAY = 0.5  # Seconds before the first repeat
+DEFAULT_KEY_REPEAT_INTERVAL = 0.1  # Seconds between repeats
+
 # Entity attribute keys
 ATTR_LASER_POWER = "laser_power"
 ATTR_SOURCE = "source"
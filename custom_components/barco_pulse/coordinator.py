@@ -13,35 +13,62 @@ import logging
 import time
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
     ACTIVE_STATES,
     CLOSE_CONNECTION_AFTER_UPDATE,
     DEFAULT_POLLING_INTERVAL,
+    DOMAIN,
     NAME,
     POLLING_INTERVALS,
     PRESET_ASSIGNMENT_TUPLE_SIZE,
     PowerState,
 )
 from .exceptions import (
+    BarcoApiError,
     BarcoAuthError,
     BarcoConnectionError,
     BarcoStateError,
 )
+from .metrics import CommandLatencyTracker
+from .wol import normalize_mac
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
 
     from .api import BarcoDevice
+    from .fleet import BarcoFleetScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
 # Coordinator update rate limiting
 MIN_UPDATE_INTERVAL = 1.0  # Minimum seconds between coordinator updates
 
+# Properties whose change notifications confirm tracked commands
+# (property -> coordinator data key / command type)
+CONFIRM_PROPERTIES: dict[str, str] = {
+    "image.window.main.source": "source",
+    "image.brightness": "brightness",
+    "image.contrast": "contrast",
+    "image.saturation": "saturation",
+    "image.hue": "hue",
+    "illumination.sources.laser.power": "laser_power",
+}
+
+# Persisted last-known snapshot
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 60  # Seconds to coalesce snapshot writes
+
+
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the storage holding the last good snapshot of a config entry."""
+    return Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot")
+
 
 class BarcoDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Data update coordinator for Barco Pulse projector."""
@@ -59,6 +86,15 @@ class BarcoDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.device = device
         self._update_lock = asyncio.Lock()
         self._last_update = 0.0
+        self.command_latency = CommandLatencyTracker()
+        # Commands are also confirmed from change notifications; subscribed
+        # once the projector is active (restored by the device on reconnect)
+        self._confirmations_subscribed = False
+        self._hue_supported = True  # Cleared if the model lacks image.hue
+        # Set while this coordinator is part of the fleet scheduler
+        self.fleet: BarcoFleetScheduler | None = None
+        self._refresh_requested = False
+        self._store: Store[dict[str, Any]] | None = None
         # Generate stable fallback ID immediately (never None)
         # Use blake2b for non-cryptographic hashing (faster than SHA256)
         self._fallback_id = hashlib.blake2b(
@@ -66,6 +102,64 @@ class BarcoDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             digest_size=8,
         ).hexdigest()
 
+    @property
+    def is_stale(self) -> bool:
+        """Return True while data is a restored snapshot not yet refreshed."""
+        return bool(self.data and self.data.get("stale"))
+
+    def _get_store(self) -> Store[dict[str, Any]]:
+        """Return the snapshot store for this coordinator's config entry."""
+        if self._store is None:
+            self._store = snapshot_store(self.hass, self.config_entry.entry_id)
+        return self._store
+
+    async def async_restore_snapshot(self) -> bool:
+        """
+        Restore the last persisted snapshot as stale data.
+
+        Returns:
+            True if a snapshot was restored
+
+        """
+        snapshot = await self._get_store().async_load()
+        if not snapshot:
+            return False
+
+        # JSON object keys are strings; preset numbers are ints
+        assignments = snapshot.get("preset_assignments")
+        if isinstance(assignments, dict):
+            snapshot["preset_assignments"] = {
+                int(preset): profile for preset, profile in assignments.items()
+            }
+
+        # Lets power on wake the projector from ECO mode before it is reached
+        if self.device.mac_address is None:
+            self.device.mac_address = normalize_mac(snapshot.get("mac_address"))
+
+        snapshot["stale"] = True
+        self.data = snapshot
+        _LOGGER.debug(
+            "Restored snapshot for %s:%s (state %s)",
+            self.device.host,
+            self.device.port,
+            snapshot.get("state"),
+        )
+        return True
+
+    def _snapshot_to_store(self) -> dict[str, Any]:
+        """Return current data for persistence."""
+        return {key: value for key, value in self.data.items() if key != "stale"}
+
+    async def async_wait_idle(self) -> None:
+        """Wait for an in-progress refresh so background samplers yield to it."""
+        async with self._update_lock:
+            pass
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh; it skips the fleet phase slot wait."""
+        self._refresh_requested = True
+        await super().async_request_refresh()
+
     async def _enforce_rate_limit(self) -> None:
         """Enforce minimum interval between updates to prevent overwhelming device."""
         elapsed = time.time() - self._last_update
@@ -81,10 +175,14 @@ class BarcoDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "system.firmwareversion",
         ]
         result = await self.device.get_properties(properties)
+        # Read once while awake; needed to wake the projector from ECO mode
+        if self.device.mac_address is None:
+            await self.device.get_mac_address()
         return {
             "serial_number": result.get("system.serialnumber"),
             "model": result.get("system.modelname"),
             "firmware_version": result.get("system.firmwareversion"),
+            "mac_address": self.device.mac_address,
         }
 
     def _parse_float_properties(
@@ -96,6 +194,7 @@ class BarcoDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             ("brightness", "image.brightness"),
             ("contrast", "image.contrast"),
             ("saturation", "image.saturation"),
+            ("hue", "image.hue"),
         ]
 
         for key, result_key in property_mappings:
@@ -145,10 +244,12 @@ class BarcoDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "profile.presetassignments",
             "profile.profiles",
         ]
+        if self._hue_supported:
+            property_names.append("image.hue")
 
         try:
             # Fetch all properties in a single batch request
-            results = await self.device.get_properties(property_names)
+            results = await self._get_properties_without_unsupported_hue(property_names)
 
             # Validate response type
             if not isinstance(results, dict):
@@ -191,6 +292,66 @@ class BarcoDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         return data
 
+    async def _get_properties_without_unsupported_hue(
+        self, property_names: list[str]
+    ) -> dict[str, Any]:
+        """
+        Get properties in one batch, dropping image.hue if the model lacks it.
+
+        One unknown property fails the whole batched property.get, so when a
+        batch including image.hue fails and the same batch without it
+        succeeds, hue is not polled again.
+
+        Raises:
+            BarcoStateError: If properties are not available in this state
+
+        """
+        try:
+            return await self.device.get_properties(property_names)
+        except BarcoStateError:
+            if "image.hue" not in property_names:
+                raise
+            results = await self.device.get_properties(
+                [name for name in property_names if name != "image.hue"]
+            )
+            _LOGGER.debug("image.hue not supported, no longer polling it")
+            self._hue_supported = False
+            return results
+
+    async def _async_subscribe_confirmations(self) -> None:
+        """Subscribe to the properties that confirm tracked commands."""
+        properties = [
+            name
+            for name in CONFIRM_PROPERTIES
+            if self._hue_supported or name != "image.hue"
+        ]
+        try:
+            await self.device.subscribe_properties(properties)
+        except (BarcoApiError, BarcoStateError) as err:
+            _LOGGER.debug("Confirmation subscription failed, retrying: %s", err)
+            return
+        self._confirmations_subscribed = True
+
+    @callback
+    def handle_notification(self, method: str, params: Any) -> None:
+        """Confirm pending commands from property.changed notifications."""
+        if method != "property.changed" or not isinstance(params, dict):
+            return
+        changes = params.get("property")
+        if isinstance(changes, dict):
+            changes = [changes]
+        if not isinstance(changes, list):
+            return
+        values = {
+            CONFIRM_PROPERTIES[name]: value
+            for change in changes
+            if isinstance(change, dict)
+            for name, value in change.items()
+            if name in CONFIRM_PROPERTIES
+        }
+        if values:
+            self.command_latency.observe(values)
+
     def _parse_preset_assignments(self, preset_data: Any) -> dict[str, Any]:
         """Parse preset assignments from API response."""
         result: dict[str, Any] = {}
@@ -210,11 +371,17 @@ class BarcoDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from the projector."""
+        # Scheduled polls wait for their fleet phase slot; requested refreshes
+        # (e.g. after a command) run right away
+        requested, self._refresh_requested = self._refresh_requested, False
+        if self.fleet is not None and not requested:
+            await self.fleet.async_wait_slot(self)
+
         async with self._update_lock:
             try:
                 # Wrap entire update in timeout to prevent indefinite hangs
                 # This protects against slow network or device issues
-                return await asyncio.wait_for(
+                data = await asyncio.wait_for(
                     self._fetch_data(),
                     timeout=30.0,  # Max 30s for entire update cycle
                 )
@@ -264,6 +431,15 @@ class BarcoDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     _LOGGER.debug("Error during connection cleanup", exc_info=True)
                 raise UpdateFailed(f"Unexpected error: {err}") from err
 
+            # Complete commands confirmed by this snapshot
+            self.command_latency.observe(data)
+
+            # Persist last good snapshot for instant startup (writes coalesced)
+            self._get_store().async_delay_save(
+                self._snapshot_to_store, SNAPSHOT_SAVE_DELAY
+            )
+            return data
+
     async def _fetch_data(self) -> dict[str, Any]:
         """Fetch data from projector (internal method wrapped by timeout)."""
         # Enforce rate limiting
@@ -282,6 +458,8 @@ class BarcoDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if PowerState(state) in ACTIVE_STATES:
                 active_data = await self._get_active_properties()
                 data.update(active_data)
+                if not self._confirmations_subscribed:
+                    await self._async_subscribe_confirmations()
         except ValueError:
             # Invalid state string, skip active properties
             _LOGGER.debug("Unknown state %s, skipping active properties", state)
@@ -294,6 +472,10 @@ class BarcoDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             # Invalid state string, use default
             new_interval = DEFAULT_POLLING_INTERVAL
 
+        # Poll less often while the fleet scheduler sees event loop lag
+        if self.fleet is not None:
+            new_interval = self.fleet.scale(new_interval)
+
         if self.update_interval != new_interval:
             self.update_interval = new_interval
             _LOGGER.debug(
@@ -0,0 +1,198 @@
+"""Statistics counter sampling for Barco Pulse integration."""
+
+# ruff: noqa: TRY003, EM102
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import COUNTER_INTERVAL, DOMAIN, NAME
+from .exceptions import BarcoApiError, BarcoConnectionError, BarcoStateError
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import BarcoDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+COUNTER_STORAGE_VERSION = 1
+COUNTER_SAVE_DELAY = 60  # Seconds to coalesce counter writes
+
+# Usage rates are derived from hourly (timestamp, value) points kept for a week
+COUNTER_RATE_SPACING = 3600
+COUNTER_RATE_WINDOW = 7 * 86400
+COUNTER_RATE_MIN_SPAN = 3600  # Seconds of history needed before reporting a rate
+
+# statistics.*.getunit value -> hours per unit, for time counters
+COUNTER_TIME_UNITS: dict[str, float] = {
+    "hours": 1.0,
+    "minutes": 1 / 60,
+    "seconds": 1 / 3600,
+}
+
+
+def counter_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the storage holding counter metadata and last values."""
+    return Store(hass, COUNTER_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.counters")
+
+
+@dataclass(frozen=True, slots=True)
+class CounterInfo:
+    """Metadata of a statistics counter, discovered once."""
+
+    name: str  # Display name from statistics.<counter>.getname
+    unit: str  # Unit enum from statistics.listcounters
+
+
+class BarcoCounterCoordinator(DataUpdateCoordinator[dict[str, int]]):
+    """
+    Low-frequency sampler for statistics.* runtime counters.
+
+    The counter list, display names and units are discovered once and
+    persisted together with the last values, so counter sensors are created
+    and populated immediately on startup. Values are read in one batched
+    property request every COUNTER_INTERVAL, outside the state polling loop.
+    Usage rates (e.g. laser hours per day) are derived from hourly points over
+    a trailing week.
+    """
+
+    config_entry: ConfigEntry
+
+    def __init__(
+        self, hass: HomeAssistant, coordinator: BarcoDataUpdateCoordinator
+    ) -> None:
+        """Initialize the counter sampler."""
+        super().__init__(
+            hass=hass,
+            logger=_LOGGER,
+            name=f"{NAME} counters",
+            update_interval=COUNTER_INTERVAL,
+        )
+        self.coordinator = coordinator
+        self.device = coordinator.device
+        self.info: dict[str, CounterInfo] = {}
+        self._discovered = False
+        self.rates: dict[str, float] = {}
+        self._points: dict[str, list[tuple[float, int]]] = {}
+        self._store: Store[dict[str, Any]] | None = None
+
+    def _get_store(self) -> Store[dict[str, Any]]:
+        """Return the counter store for this coordinator's config entry."""
+        if self._store is None:
+            self._store = counter_store(self.hass, self.config_entry.entry_id)
+        return self._store
+
+    async def async_restore(self) -> bool:
+        """
+        Restore discovered counters and their last values.
+
+        Returns:
+            True if counters were restored
+
+        """
+        stored = await self._get_store().async_load()
+        if not stored or not stored.get("info"):
+            return False
+
+        self.info = {
+            counter: CounterInfo(name, unit)
+            for counter, (name, unit) in stored["info"].items()
+        }
+        self._discovered = True
+        self._points = {
+            counter: [(timestamp, value) for timestamp, value in points]
+            for counter, points in stored.get("points", {}).items()
+        }
+        self._update_rates()
+        self.data = stored.get("values", {})
+        _LOGGER.debug("Restored %d statistics counters", len(self.info))
+        return True
+
+    def _to_store(self) -> dict[str, Any]:
+        """Return counter state for persistence."""
+        return {
+            "info": {
+                counter: [info.name, info.unit] for counter, info in self.info.items()
+            },
+            "values": self.data,
+            "points": self._points,
+        }
+
+    async def _discover(self) -> None:
+        """Read the counter list, names and units once."""
+        info: dict[str, CounterInfo] = {}
+        for item in await self.device.list_counters():
+            counter = item.get("name")
+            if not counter:
+                continue
+            try:
+                name = await self.device.get_counter_name(counter)
+            except BarcoApiError:
+                name = counter
+            info[counter] = CounterInfo(name, str(item.get("unit", "none")))
+        self.info = info
+        self._discovered = True
+        _LOGGER.debug("Discovered %d statistics counters", len(info))
+
+    def _record_point(self, counter: str, now: float, value: int) -> None:
+        """Keep an hourly point for rate derivation."""
+        points = self._points.setdefault(counter, [])
+        if points and value < points[-1][1]:
+            # Counter reset (e.g. board replaced); restart the window
+            points.clear()
+        if not points or now - points[-1][0] >= COUNTER_RATE_SPACING:
+            points.append((now, value))
+        while points and now - points[0][0] > COUNTER_RATE_WINDOW:
+            points.pop(0)
+
+    def _update_rates(self) -> None:
+        """Derive per-day usage of time counters from the trailing window."""
+        rates: dict[str, float] = {}
+        for counter, points in self._points.items():
+            info = self.info.get(counter)
+            hours_per_unit = COUNTER_TIME_UNITS.get(info.unit) if info else None
+            if hours_per_unit is None or len(points) < 2:  # noqa: PLR2004
+                continue
+            (first_at, first), (last_at, last) = points[0], points[-1]
+            span = last_at - first_at
+            if span >= COUNTER_RATE_MIN_SPAN:
+                rates[counter] = round(
+                    (last - first) * hours_per_unit / span * 86400, 2
+                )
+        self.rates = rates
+
+    async def _async_update_data(self) -> dict[str, int]:
+        """Sample all statistics counters."""
+        await self.coordinator.async_wait_idle()
+        try:
+            if not self._discovered:
+                await self._discover()
+            if not self.info:
+                return {}
+            values = await self.device.get_counter_values(list(self.info))
+        except BarcoStateError:
+            _LOGGER.debug("Statistics counters not available in current state")
+            return self.data or {}
+        except (BarcoConnectionError, BarcoApiError) as err:
+            raise UpdateFailed(f"Error reading statistics counters: {err}") from err
+
+        now = time.time()
+        data: dict[str, int] = {}
+        for counter, value in values.items():
+            try:
+                data[counter] = int(value)
+            except (TypeError, ValueError):
+                continue
+            self._record_point(counter, now, data[counter])
+        self._update_rates()
+
+        self._get_store().async_delay_save(self._to_store, COUNTER_SAVE_DELAY)
+        return data
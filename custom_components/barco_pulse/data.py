@@ -7,7 +7,16 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .api import BarcoDevice
+    from .connectors import BarcoConnectorMonitor
     from .coordinator import BarcoDataUpdateCoordinator
+    from .counters import BarcoCounterCoordinator
+    from .group import BarcoGroupController
+    from .history import TelemetryHistory
+    from .mirror import BarcoPictureMirror
+    from .notifications import BarcoNotificationManager
+    from .picture import BarcoPictureSnapshots
+    from .telemetry import BarcoTelemetryCoordinator
+    from .transport import SessionRecorder
 
 
 @dataclass
@@ -16,3 +25,18 @@ class BarcoRuntimeData:
 
     client: BarcoDevice
     coordinator: BarcoDataUpdateCoordinator
+    telemetry: BarcoTelemetryCoordinator
+    counters: BarcoCounterCoordinator
+    notifications: BarcoNotificationManager
+    connectors: BarcoConnectorMonitor
+    pictures: BarcoPictureSnapshots
+    recorder: SessionRecorder | None = None
+    history: TelemetryHistory | None = None
+
+
+@dataclass
+class BarcoGroupRuntimeData:
+    """Runtime data for a projector group config entry."""
+
+    controller: BarcoGroupController
+    mirror: BarcoPictureMirror | None = None
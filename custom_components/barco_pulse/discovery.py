@@ -0,0 +1,153 @@
+"""Subnet discovery of Barco Pulse projectors."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import ipaddress
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .api import BarcoDevice
+from .const import DEFAULT_PORT
+from .exceptions import BarcoError
+
+if TYPE_CHECKING:
+    from .transport import ConnectionFactory, TransportReader, TransportWriter
+
+_LOGGER = logging.getLogger(__name__)
+
+DISCOVERY_MAX_HOSTS = 1024  # Largest network scanned (a /22)
+DISCOVERY_MAX_CONCURRENCY = 128  # Hosts probed at the same time
+DISCOVERY_CONNECT_TIMEOUT = 0.5  # Seconds; projectors on the LAN answer fast
+DISCOVERY_FINGERPRINT_TIMEOUT = 2  # Seconds for the identification request
+
+
+@dataclass(frozen=True, slots=True)
+class DiscoveredProjector:
+    """A host answering on the JSON-RPC port."""
+
+    host: str
+    port: int
+    serial_number: str | None = None  # None if it could not be identified
+    model_name: str | None = None
+
+
+def discovery_hosts(network: str) -> list[str]:
+    """
+    Return the host addresses of a network in CIDR notation.
+
+    Args:
+        network: Network such as "192.168.1.0/24" (a single address is allowed)
+
+    Returns:
+        Host addresses to probe
+
+    Raises:
+        ValueError: If the network is invalid or larger than DISCOVERY_MAX_HOSTS
+
+    """
+    net = ipaddress.ip_network(network.strip(), strict=False)
+    if net.num_addresses > DISCOVERY_MAX_HOSTS:
+        msg = f"Network {net} has more than {DISCOVERY_MAX_HOSTS} addresses"
+        raise ValueError(msg)
+    hosts = list(net.hosts()) or [net.network_address]
+    return [str(host) for host in hosts]
+
+
+async def async_probe(
+    host: str,
+    port: int = DEFAULT_PORT,
+    *,
+    connect_timeout: float = DISCOVERY_CONNECT_TIMEOUT,
+    connection_factory: ConnectionFactory | None = None,
+) -> DiscoveredProjector | None:
+    """
+    Probe one host: connect, then identify it with one batched property.get.
+
+    Returns:
+        The responder, or None if nothing accepts connections on the port
+
+    """
+    factory = connection_factory or asyncio.open_connection
+    try:
+        reader, writer = await asyncio.wait_for(factory(host, port), connect_timeout)
+    except (TimeoutError, OSError):
+        return None
+
+    async def _open(_host: str, _port: int) -> tuple[TransportReader, TransportWriter]:
+        # Hand the probing connection to the client instead of reconnecting
+        return reader, writer
+
+    device = BarcoDevice(
+        host, port, timeout=DISCOVERY_FINGERPRINT_TIMEOUT, connection_factory=_open
+    )
+    try:
+        info = await device.get_properties(["system.serialnumber", "system.modelname"])
+    except BarcoError as err:
+        # Still listed: it may need an authentication code to answer
+        _LOGGER.debug("Could not identify %s:%s: %s", host, port, err)
+        return DiscoveredProjector(host, port)
+    finally:
+        await device.disconnect()
+        if not writer.is_closing():
+            writer.close()
+            with contextlib.suppress(ConnectionError, OSError):
+                await writer.wait_closed()
+
+    serial = info.get("system.serialnumber")
+    model = info.get("system.modelname")
+    return DiscoveredProjector(
+        host,
+        port,
+        str(serial) if serial is not None else None,
+        str(model) if model is not None else None,
+    )
+
+
+async def async_scan(
+    network: str,
+    port: int = DEFAULT_PORT,
+    *,
+    max_concurrency: int = DISCOVERY_MAX_CONCURRENCY,
+    connect_timeout: float = DISCOVERY_CONNECT_TIMEOUT,
+    connection_factory: ConnectionFactory | None = None,
+) -> list[DiscoveredProjector]:
+    """
+    Scan a network for Barco Pulse projectors.
+
+    At most max_concurrency hosts are probed at a time, each with a short
+    connect timeout, so a /24 with no responders takes about
+    256 / max_concurrency * connect_timeout seconds.
+
+    Args:
+        network: Network in CIDR notation
+        port: JSON-RPC port to probe
+        max_concurrency: Hosts probed concurrently
+        connect_timeout: Seconds to wait for a connection
+        connection_factory: Optional transport factory (for stand-in servers)
+
+    Returns:
+        Responders in address order
+
+    Raises:
+        ValueError: If the network is invalid or too large
+
+    """
+    hosts = discovery_hosts(network)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _probe(host: str) -> DiscoveredProjector | None:
+        async with semaphore:
+            return await async_probe(
+                host,
+                port,
+                connect_timeout=connect_timeout,
+                connection_factory=connection_factory,
+            )
+
+    results = await asyncio.gather(*(_probe(host) for host in hosts))
+    found = [result for result in results if result is not None]
+    _LOGGER.debug("Scanned %s hosts of %s: %s", len(hosts), network, found)
+    return found
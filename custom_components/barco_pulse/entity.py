@@ -2,14 +2,34 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC, DeviceInfo
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DOMAIN
+from .const import ATTRIBUTION, DOMAIN, MANUFACTURER
 from .coordinator import BarcoDataUpdateCoordinator
+from .counters import BarcoCounterCoordinator
 from .helpers import handle_api_errors, safe_refresh
+from .telemetry import BarcoTelemetryCoordinator
+
+if TYPE_CHECKING:
+    from .connectors import BarcoConnectorMonitor
+    from .group import BarcoGroupController
+
+
+def _device_info(coordinator: BarcoDataUpdateCoordinator) -> DeviceInfo:
+    """Return device info for the projector behind a coordinator."""
+    mac = coordinator.data.get("mac_address")
+    return DeviceInfo(
+        identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
+        connections={(CONNECTION_NETWORK_MAC, mac)} if mac else set(),
+        name=coordinator.config_entry.title,
+        manufacturer="Barco",
+        model=coordinator.data.get("model", "Pulse"),
+        sw_version=coordinator.data.get("firmware_version"),
+    )
 
 
 class BarcoEntity(CoordinatorEntity[BarcoDataUpdateCoordinator]):
@@ -25,13 +45,7 @@ class BarcoEntity(CoordinatorEntity[BarcoDataUpdateCoordinator]):
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.config_entry.entry_id)},
-            name=self.coordinator.config_entry.title,
-            manufacturer="Barco",
-            model=self.coordinator.data.get("model", "Pulse"),
-            sw_version=self.coordinator.data.get("firmware_version"),
-        )
+        return _device_info(self.coordinator)
 
     @property
     def available(self) -> bool:
@@ -39,6 +53,131 @@ class BarcoEntity(CoordinatorEntity[BarcoDataUpdateCoordinator]):
         return self.coordinator.last_update_success
 
 
+class BarcoTelemetryEntity(CoordinatorEntity[BarcoTelemetryCoordinator]):
+    """Base entity for values sampled by the environment telemetry coordinator."""
+
+    _attr_has_entity_name = True
+    _attr_attribution = ATTRIBUTION
+
+    def __init__(self, coordinator: BarcoTelemetryCoordinator) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device info."""
+        return _device_info(self.coordinator.coordinator)
+
+
+class BarcoCounterEntity(CoordinatorEntity[BarcoCounterCoordinator]):
+    """Base entity for values sampled by the statistics counter coordinator."""
+
+    _attr_has_entity_name = True
+    _attr_attribution = ATTRIBUTION
+
+    def __init__(self, coordinator: BarcoCounterCoordinator) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device info."""
+        return _device_info(self.coordinator.coordinator)
+
+
+class BarcoConnectorEntity(BarcoEntity):
+    """Base entity for the detected signal of one input connector."""
+
+    def __init__(
+        self,
+        coordinator: BarcoDataUpdateCoordinator,
+        connectors: BarcoConnectorMonitor,
+        connector: str,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._connectors = connectors
+        self._connector = connector
+        self._attr_translation_placeholders = {
+            "connector": connectors.connectors[connector]
+        }
+
+    @property
+    def signal(self) -> dict[str, Any]:
+        """Return the detected signal of the connector."""
+        return self._connectors.signals.get(self._connector, {})
+
+    @property
+    def available(self) -> bool:
+        """Return if the connector still exists and has been read."""
+        return (
+            super().available
+            and self._connector in self._connectors.connectors
+            and self._connector in self._connectors.signals
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Listen for connector signal changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._connectors.async_add_listener(self.async_write_ha_state)
+        )
+
+
+class BarcoGroupEntity(Entity):
+    """Base entity for a projector group, backed by its members' coordinators."""
+
+    _attr_has_entity_name = True
+    _attr_attribution = ATTRIBUTION
+    _attr_should_poll = False
+
+    def __init__(self, controller: BarcoGroupController, key: str) -> None:
+        """Initialize the entity."""
+        self.controller = controller
+        entry = controller.entry
+        self._attr_unique_id = f"{entry.entry_id}_group_{key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=entry.title,
+            manufacturer=MANUFACTURER,
+            model="Projector Group",
+        )
+
+    @property
+    def coordinators(self) -> list[BarcoDataUpdateCoordinator]:
+        """Return the coordinators of loaded members with current data."""
+        return [
+            data.coordinator
+            for _, data in self.controller.members
+            if data.coordinator.last_update_success
+        ]
+
+    def member_values(self, key: str) -> list[Any]:
+        """Return a coordinator data value of every member that reports it."""
+        values = (coordinator.data.get(key) for coordinator in self.coordinators)
+        return [value for value in values if value is not None]
+
+    @property
+    def available(self) -> bool:
+        """Return if any member is reachable."""
+        return bool(self.coordinators)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the members and the per-member result of the last command."""
+        return {
+            "members": [entry.title for entry, _ in self.controller.members],
+            "last_results": self.controller.last_results,
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Follow member state changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.controller.async_add_listener(self.async_write_ha_state)
+        )
+
+
 class BarcoPowerMixin:
     """
     Mixin for entities that support power on/off commands.
@@ -0,0 +1,188 @@
+"""HTTP file endpoint transfers for Barco Pulse integration."""
+
+# ruff: noqa: TRY003, EM102
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from .exceptions import BarcoConnectionError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+    from pathlib import Path
+    from typing import BinaryIO
+
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+FILE_CHUNK_SIZE = 256 * 1024  # Bytes read from disk / sent per chunk
+FILE_TRANSFER_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=60)
+
+
+@dataclass(frozen=True, slots=True)
+class FileEndpoint:
+    """An uploadable file type and how to activate an uploaded file."""
+
+    path: str  # Below http://<host>/api/
+    selected: str  # Property selecting the file by name
+    activate: tuple[str, Any]  # Property and value enabling the selected file
+
+
+# Upload kinds (spec §6.5-6.7)
+UPLOAD_ENDPOINTS: dict[str, FileEndpoint] = {
+    "warp": FileEndpoint(
+        "image/processing/warp/file/transfer",
+        "image.processing.warp.file.selected",
+        ("image.processing.warp.file.enable", True),
+    ),
+    "blend": FileEndpoint(
+        "image/processing/blend/file/transfer",
+        "image.processing.blend.file.selected",
+        ("image.processing.blend.mode", "FILE"),
+    ),
+    "blacklevel": FileEndpoint(
+        "image/processing/blacklevel/file/transfer",
+        "image.processing.blacklevel.file.selected",
+        ("image.processing.blacklevel.mode", "FILE"),
+    ),
+}
+
+
+def file_endpoint_url(host: str, path: str) -> str:
+    """Return the URL of a file endpoint (served over plain HTTP, port 80)."""
+    return f"http://{host}/api/{path}"
+
+
+async def async_upload_file(
+    hass: HomeAssistant,
+    session: aiohttp.ClientSession,
+    url: str,
+    file_path: Path,
+    progress: Callable[[int, int], None] | None = None,
+) -> int:
+    """
+    Stream a file from disk to a file endpoint as multipart/form-data.
+
+    The file is read in FILE_CHUNK_SIZE chunks in the executor and each chunk
+    is sent before the next is read, so memory use does not depend on the
+    file size.
+
+    Args:
+        hass: Home Assistant instance (for executor reads)
+        session: Shared aiohttp session
+        url: File endpoint URL
+        file_path: File to upload
+        progress: Called with (bytes sent, total bytes) after every chunk
+
+    Returns:
+        Number of bytes uploaded
+
+    Raises:
+        BarcoConnectionError: If the upload fails
+        OSError: If the file cannot be read
+
+    """
+    total = (await hass.async_add_executor_job(file_path.stat)).st_size
+    handle = await hass.async_add_executor_job(file_path.open, "rb")
+    sent = 0
+
+    async def _chunks() -> AsyncIterator[bytes]:
+        nonlocal sent
+        while chunk := await hass.async_add_executor_job(handle.read, FILE_CHUNK_SIZE):
+            sent += len(chunk)
+            yield chunk
+            if progress is not None:
+                progress(sent, total)
+
+    try:
+        with aiohttp.MultipartWriter("form-data") as form:
+            part = form.append(_chunks())
+            part.set_content_disposition(
+                "form-data", name="file", filename=file_path.name
+            )
+            async with session.post(
+                url, data=form, timeout=FILE_TRANSFER_TIMEOUT
+            ) as response:
+                response.raise_for_status()
+    except (aiohttp.ClientError, TimeoutError) as err:
+        raise BarcoConnectionError(f"Upload to {url} failed: {err}") from err
+    finally:
+        await hass.async_add_executor_job(handle.close)
+
+    _LOGGER.debug("Uploaded %s (%s bytes) to %s", file_path.name, sent, url)
+    return sent
+
+
+async def async_download_file(
+    hass: HomeAssistant,
+    session: aiohttp.ClientSession,
+    url: str,
+    file_path: Path,
+    progress: Callable[[int, int | None], None] | None = None,
+) -> tuple[int, str | None]:
+    """
+    Stream a file endpoint download straight to disk.
+
+    Chunks are written in the executor as they arrive, to a temporary file
+    that replaces file_path once complete, so memory use does not depend on
+    the file size and an aborted download leaves no temporary file behind.
+
+    Args:
+        hass: Home Assistant instance (for executor writes)
+        session: Shared aiohttp session
+        url: File endpoint URL
+        file_path: Destination file
+        progress: Called with (bytes received, total bytes or None) per chunk
+
+    Returns:
+        Tuple of (bytes written, file name suggested by the projector)
+
+    Raises:
+        BarcoConnectionError: If the download fails
+        OSError: If the file cannot be written
+
+    """
+    temporary = file_path.with_name(f"{file_path.name}.part")
+    await hass.async_add_executor_job(
+        partial(temporary.parent.mkdir, parents=True, exist_ok=True)
+    )
+    handle = await hass.async_add_executor_job(temporary.open, "wb")
+    received = 0
+    try:
+        async with session.get(url, timeout=FILE_TRANSFER_TIMEOUT) as response:
+            response.raise_for_status()
+            total = response.content_length
+            filename = (
+                response.content_disposition.filename
+                if response.content_disposition
+                else None
+            )
+            async for chunk in response.content.iter_chunked(FILE_CHUNK_SIZE):
+                await hass.async_add_executor_job(handle.write, chunk)
+                received += len(chunk)
+                if progress is not None:
+                    progress(received, total)
+    except (aiohttp.ClientError, TimeoutError) as err:
+        await hass.async_add_executor_job(_discard, handle, temporary)
+        raise BarcoConnectionError(f"Download from {url} failed: {err}") from err
+    except BaseException:
+        await hass.async_add_executor_job(_discard, handle, temporary)
+        raise
+
+    await hass.async_add_executor_job(handle.close)
+    await hass.async_add_executor_job(temporary.replace, file_path)
+    _LOGGER.debug("Downloaded %s bytes from %s to %s", received, url, file_path)
+    return received, filename
+
+
+def _discard(handle: BinaryIO, temporary: Path) -> None:
+    """Close and remove an incomplete download."""
+    handle.close()
+    temporary.unlink(missing_ok=True)
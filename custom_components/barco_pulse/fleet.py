@@ -0,0 +1,166 @@
+"""Fleet-wide polling scheduler for Barco Pulse integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import callback
+
+from .const import DATA_FLEET, DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import timedelta
+
+    from homeassistant.core import Event, HomeAssistant
+
+    from .coordinator import BarcoDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+FLEET_MAX_IN_FLIGHT = 8  # Concurrent projector requests across all entries
+FLEET_SLOT_PERIOD = 1.0  # Seconds over which refresh phases are spread
+
+# Event loop lag probing and cadence degradation
+FLEET_LAG_PROBE_INTERVAL = 1.0  # Seconds between probes
+FLEET_LAG_ALPHA = 0.3  # EWMA smoothing of measured lag
+FLEET_LAG_DEGRADE = 0.1  # Smoothed lag (s) above which polling slows down
+FLEET_LAG_RECOVER = 0.02  # Smoothed lag (s) below which polling speeds up again
+FLEET_CADENCE_STEP = 1.5  # Cadence factor multiplier per degraded probe
+FLEET_CADENCE_RECOVERY = 0.9  # Cadence factor multiplier per recovered probe
+FLEET_MAX_CADENCE_FACTOR = 4.0
+
+
+def _slot_phase(slot: int) -> float:
+    """
+    Return the phase (0..1) of a slot as the base-2 van der Corput sequence.
+
+    Slots 0, 1, 2, 3, ... get phases 0, 1/2, 1/4, 3/4, ..., so any number of
+    members is spread evenly and adding one never moves the others.
+    """
+    phase, denominator = 0.0, 1.0
+    while slot:
+        denominator *= 2
+        slot, bit = divmod(slot, 2)
+        phase += bit / denominator
+    return phase
+
+
+class BarcoFleetScheduler:
+    """
+    Spread and budget polling of all configured projectors.
+
+    Every coordinator gets a stable phase slot: scheduled refreshes wait for
+    their slot within FLEET_SLOT_PERIOD, so projectors that started together
+    don't poll in lockstep. All projector requests share a global limit of
+    FLEET_MAX_IN_FLIGHT concurrent requests. An event loop lag probe scales
+    every polling interval by a cadence factor that grows while the loop lags
+    and relaxes back to 1 once it has recovered.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.request_limiter = asyncio.Semaphore(FLEET_MAX_IN_FLIGHT)
+        self.cadence_factor = 1.0
+        self.lag = 0.0  # Smoothed event loop lag in seconds
+        self._slots: dict[BarcoDataUpdateCoordinator, int] = {}
+        self._probe: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_add(self, coordinator: BarcoDataUpdateCoordinator) -> Callable[[], None]:
+        """
+        Add a coordinator to the fleet.
+
+        Returns:
+            Callback that removes the coordinator again
+
+        """
+        used = set(self._slots.values())
+        self._slots[coordinator] = next(
+            slot for slot in range(len(used) + 1) if slot not in used
+        )
+        coordinator.fleet = self
+        coordinator.device.request_limiter = self.request_limiter
+        if self._probe is None:
+            self._schedule_probe()
+
+        @callback
+        def _remove() -> None:
+            self._slots.pop(coordinator, None)
+            coordinator.fleet = None
+            coordinator.device.request_limiter = None
+            if not self._slots:
+                self.async_stop()
+
+        return _remove
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop probing event loop lag."""
+        if self._probe is not None:
+            self._probe.cancel()
+            self._probe = None
+
+    def scale(self, interval: timedelta) -> timedelta:
+        """Return a polling interval stretched by the current cadence factor."""
+        if self.cadence_factor == 1.0:
+            return interval
+        return interval * self.cadence_factor
+
+    async def async_wait_slot(self, coordinator: BarcoDataUpdateCoordinator) -> None:
+        """Wait until the coordinator's phase slot comes up."""
+        slot = self._slots.get(coordinator)
+        if slot is None:
+            return
+        now = self.hass.loop.time()
+        offset = _slot_phase(slot) * FLEET_SLOT_PERIOD
+        delay = (offset - now) % FLEET_SLOT_PERIOD
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _schedule_probe(self) -> None:
+        """Schedule the next lag probe."""
+        expected = self.hass.loop.time() + FLEET_LAG_PROBE_INTERVAL
+        self._probe = self.hass.loop.call_at(expected, self._async_probe, expected)
+
+    @callback
+    def _async_probe(self, expected: float) -> None:
+        """Measure event loop lag and adjust the cadence factor."""
+        lag = max(0.0, self.hass.loop.time() - expected)
+        self.lag += FLEET_LAG_ALPHA * (lag - self.lag)
+
+        factor = self.cadence_factor
+        if self.lag > FLEET_LAG_DEGRADE:
+            factor = min(FLEET_MAX_CADENCE_FACTOR, factor * FLEET_CADENCE_STEP)
+        elif self.lag < FLEET_LAG_RECOVER:
+            factor = max(1.0, factor * FLEET_CADENCE_RECOVERY)
+        if factor != self.cadence_factor:
+            if (factor > 1.0) != (self.cadence_factor > 1.0):
+                _LOGGER.info(
+                    "Event loop lag %.0f ms; projector polling cadence x%.1f",
+                    self.lag * 1000,
+                    factor,
+                )
+            self.cadence_factor = factor
+
+        self._schedule_probe()
+
+
+@callback
+def async_get_fleet(hass: HomeAssistant) -> BarcoFleetScheduler:
+    """Return the shared fleet scheduler, creating it on first use."""
+    domain_data: dict = hass.data.setdefault(DOMAIN, {})
+    fleet: BarcoFleetScheduler | None = domain_data.get(DATA_FLEET)
+    if fleet is None:
+        fleet = domain_data[DATA_FLEET] = BarcoFleetScheduler(hass)
+
+        @callback
+        def _async_stop(_event: Event) -> None:
+            fleet.async_stop()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop)
+    return fleet
@@ -0,0 +1,198 @@
+"""Projector groups (stacked or blended rigs) for Barco Pulse integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import CONF_MEMBERS, SIGNAL_PROJECTOR_UPDATED
+from .data import BarcoRuntimeData
+from .exceptions import BarcoError
+from .helpers import safe_refresh
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+GROUP_MAX_PARALLEL = 8  # Members commanded concurrently
+
+
+def is_group_entry(entry: ConfigEntry) -> bool:
+    """Return True if a config entry is a projector group."""
+    return CONF_MEMBERS in entry.data
+
+
+class BarcoGroupController:
+    """
+    Track the member projectors of a group and fan commands out to them.
+
+    Members are other (projector) config entries of this integration; the
+    group follows their coordinators while they are loaded and rebinds when
+    a member is set up or unloaded. Commands run on all loaded members
+    concurrently (at most GROUP_MAX_PARALLEL at a time), every member's
+    outcome is collected, and failures are raised together afterwards.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the group controller."""
+        self.hass = hass
+        self.entry = entry
+        self.member_ids: list[str] = list(entry.data[CONF_MEMBERS])
+        self.last_results: dict[str, str] = {}
+        self._semaphore = asyncio.Semaphore(GROUP_MAX_PARALLEL)
+        self._unloading: set[str] = set()  # Members whose unload is in progress
+        self._listeners: list[Callable[[], None]] = []
+        self._unsubscribers: list[Callable[[], None]] = []
+        self._member_unsubscribers: list[Callable[[], None]] = []
+
+    @property
+    def members(self) -> list[tuple[ConfigEntry, BarcoRuntimeData]]:
+        """Return the loaded member entries with their runtime data."""
+        members = []
+        for entry_id in self.member_ids:
+            entry = self.hass.config_entries.async_get_entry(entry_id)
+            # runtime_data exists from late in setup until the entry unloaded
+            data = getattr(entry, "runtime_data", None)
+            if isinstance(data, BarcoRuntimeData) and entry_id not in self._unloading:
+                members.append((entry, data))
+        return members
+
+    @callback
+    def async_start(self) -> None:
+        """Follow member coordinators, now and whenever a member (re)loads."""
+        self._unsubscribers.append(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_PROJECTOR_UPDATED, self._async_member_updated
+            )
+        )
+        self._async_bind()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following members."""
+        for unsubscribe in self._unsubscribers + self._member_unsubscribers:
+            unsubscribe()
+        self._unsubscribers = []
+        self._member_unsubscribers = []
+
+    @callback
+    def async_add_listener(
+        self, update_callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Listen for member state changes."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def _remove() -> None:
+            if update_callback in self._listeners:
+                self._listeners.remove(update_callback)
+
+        return _remove
+
+    @callback
+    def _async_update_listeners(self) -> None:
+        """Notify group entities of a member change."""
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def _async_member_updated(self, entry_id: str, loaded: bool) -> None:  # noqa: FBT001
+        """Rebind when one of our members was set up or is being unloaded."""
+        if entry_id not in self.member_ids:
+            return
+        if loaded:
+            self._unloading.discard(entry_id)
+        else:
+            self._unloading.add(entry_id)
+        self._async_bind()
+
+    @callback
+    def _async_bind(self) -> None:
+        """Listen to the coordinators of the currently loaded members."""
+        for unsubscribe in self._member_unsubscribers:
+            unsubscribe()
+        self._member_unsubscribers = [
+            data.coordinator.async_add_listener(self._async_update_listeners)
+            for _, data in self.members
+        ]
+        self._async_update_listeners()
+
+    async def async_fan_out(
+        self,
+        action: str,
+        command: Callable[[BarcoRuntimeData], Awaitable[Any]],
+        *,
+        refresh: bool = True,
+    ) -> dict[str, str]:
+        """
+        Run a command on every member concurrently.
+
+        Every member's request is started in the same event loop pass, so a
+        whole rig switches within one round trip instead of one per member.
+
+        Args:
+            action: Action name for logging
+            command: Called with each member's runtime data
+            refresh: Request a coordinator refresh on members that succeeded
+
+        Returns:
+            Result per member title ("ok" or the error)
+
+        Raises:
+            HomeAssistantError: If any member failed or none is loaded
+
+        """
+        members = self.members
+
+        async def _run(data: BarcoRuntimeData) -> None:
+            async with self._semaphore:
+                await command(data)
+
+        outcomes = await asyncio.gather(
+            *(_run(data) for _, data in members), return_exceptions=True
+        )
+
+        by_id: dict[str, str] = {}
+        refreshes = []
+        for (entry, data), outcome in zip(members, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, (BarcoError, HomeAssistantError)):
+                    _LOGGER.error(
+                        "Unexpected error during %s on %s",
+                        action,
+                        entry.title,
+                        exc_info=outcome,
+                    )
+                by_id[entry.entry_id] = str(outcome) or type(outcome).__name__
+                continue
+            by_id[entry.entry_id] = "ok"
+            if refresh:
+                refreshes.append(safe_refresh(data.coordinator, f"group {action}"))
+        await asyncio.gather(*refreshes)
+
+        # Report in member order, including members that are not loaded
+        results: dict[str, str] = {}
+        for entry_id in self.member_ids:
+            entry = self.hass.config_entries.async_get_entry(entry_id)
+            title = entry.title if entry is not None else entry_id
+            results[title] = by_id.get(entry_id, "not loaded")
+
+        self.last_results = results
+        self._async_update_listeners()
+        _LOGGER.debug("Group %s %s: %s", self.entry.title, action, results)
+
+        failed = {title: result for title, result in results.items() if result != "ok"}
+        if failed:
+            details = ", ".join(f"{title}: {error}" for title, error in failed.items())
+            msg = f"{action} failed on {len(failed)} of {len(results)} projectors: "
+            raise HomeAssistantError(msg + details)
+        return results
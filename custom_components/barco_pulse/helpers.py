@@ -12,7 +12,7 @@ from weakref import WeakValueDictionary
 
 from homeassistant.exceptions import HomeAssistantError
 
-from .const import PRESET_MAX_NUMBER
+from .const import PRESET_MAX_NUMBER, REMOTE_KEYS
 from .exceptions import BarcoConnectionError, BarcoStateError
 
 if TYPE_CHECKING:
@@ -193,3 +193,22 @@ def parse_preset_command(command: str) -> int | None:
         # Invalid format or number; returning None is expected for parse failures
         pass
     return None
+
+
+def parse_key_command(command: str) -> str | None:
+    """
+    Parse a remote key command to its key name (e.g., 'menu' -> 'RC_MENU').
+
+    Args:
+        command: Key name with or without the RC_ prefix, or a KP_ keypad key
+            (case-insensitive)
+
+    Returns:
+        Key name for keydispatcher.postevent, or None if not a known key
+
+    """
+    key = command.strip().upper().replace(" ", "_")
+    if key in REMOTE_KEYS:
+        return key
+    key = f"RC_{key}"
+    return key if key in REMOTE_KEYS else None
@@ -0,0 +1,448 @@
+"""Memory-mapped telemetry history for Barco Pulse integration."""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import mmap
+import struct
+import threading
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from .telemetry import TelemetryColumns
+
+_LOGGER = logging.getLogger(__name__)
+
+# History file format
+#
+# One file per projector: a fixed 4 KiB header followed by two ring regions.
+# The raw region holds one record per telemetry sample (unix timestamp plus a
+# float32 per sensor column, NaN when missing); the rollup region holds one
+# record per HISTORY_ROLLUP_SECONDS bucket with per-column min, max, mean and
+# sample count. Sensor names are assigned a column on first sight and stored
+# as JSON in the header, so records stay fixed-width.
+HISTORY_MAGIC = b"BPTH"
+HISTORY_VERSION = 1
+HISTORY_COLUMNS = 64  # Sensors tracked per projector
+HISTORY_RAW_CAPACITY = 20160  # 7 days at the 30 s telemetry interval
+HISTORY_ROLLUP_SECONDS = 600
+HISTORY_ROLLUP_CAPACITY = 4320  # 30 days of 10 minute rollups
+
+HEADER_SIZE = 4096
+HEADER = struct.Struct("<4sBxHIIIIIII")
+RAW_RECORD = struct.Struct(f"<d{HISTORY_COLUMNS}f")
+ROLLUP_RECORD = struct.Struct(f"<d{4 * HISTORY_COLUMNS}f")
+
+RAW_OFFSET = HEADER_SIZE
+ROLLUP_OFFSET = RAW_OFFSET + RAW_RECORD.size * HISTORY_RAW_CAPACITY
+HISTORY_FILE_SIZE = ROLLUP_OFFSET + ROLLUP_RECORD.size * HISTORY_ROLLUP_CAPACITY
+
+
+class _Ring:
+    """Position bookkeeping of one fixed-width ring region."""
+
+    __slots__ = ("capacity", "count", "head", "offset", "record")
+
+    def __init__(self, offset: int, record: struct.Struct, capacity: int) -> None:
+        """Initialize an empty ring."""
+        self.offset = offset
+        self.record = record
+        self.capacity = capacity
+        self.head = 0  # Next slot to write
+        self.count = 0
+
+    def next_offset(self) -> int:
+        """Return the byte offset of the next slot and advance the ring."""
+        offset = self.offset + self.head * self.record.size
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        return offset
+
+    def records(self, buffer: mmap.mmap | bytes) -> Iterator[tuple[Any, ...]]:
+        """Yield records oldest first."""
+        head, count = self.head, self.count
+        start = (head - count) % self.capacity
+        for step in range(count):
+            slot = (start + step) % self.capacity
+            yield self.record.unpack_from(buffer, self.offset + slot * self.record.size)
+
+    def snapshot(self, buffer: mmap.mmap) -> tuple[_Ring, bytes]:
+        """Return a copy of the ring bookkeeping and region, detached from buffer."""
+        ring = _Ring(0, self.record, self.capacity)
+        ring.head, ring.count = self.head, self.count
+        return ring, buffer[
+            self.offset : self.offset + self.record.size * self.capacity
+        ]
+
+    def reversed_records(self, buffer: mmap.mmap) -> Iterator[tuple[Any, ...]]:
+        """Yield records newest first."""
+        for step in range(1, self.count + 1):
+            slot = (self.head - step) % self.capacity
+            yield self.record.unpack_from(buffer, self.offset + slot * self.record.size)
+
+
+class _Rollup:
+    """Running min/max/sum/count per column for one time bucket."""
+
+    __slots__ = ("counts", "maxs", "mins", "start", "sums")
+
+    def __init__(self, start: float) -> None:
+        """Initialize an empty bucket."""
+        self.start = start
+        self.mins = array("d", [math.inf]) * HISTORY_COLUMNS
+        self.maxs = array("d", [-math.inf]) * HISTORY_COLUMNS
+        self.sums = array("d", bytes(8 * HISTORY_COLUMNS))
+        self.counts = array("d", bytes(8 * HISTORY_COLUMNS))
+
+    def add(
+        self, column: int, low: float, high: float, mean: float, count: float
+    ) -> None:
+        """Merge a reading (count 1) or a partial aggregate into the bucket."""
+        if count <= 0 or math.isnan(mean):
+            return
+        self.mins[column] = min(self.mins[column], low)
+        self.maxs[column] = max(self.maxs[column], high)
+        self.sums[column] += mean * count
+        self.counts[column] += count
+
+    def columns(self) -> Iterator[tuple[int, float, float, float, int]]:
+        """Yield (column, min, max, mean, count) for columns with samples."""
+        for column, count in enumerate(self.counts):
+            if count:
+                yield (
+                    column,
+                    self.mins[column],
+                    self.maxs[column],
+                    self.sums[column] / count,
+                    int(count),
+                )
+
+
+class TelemetryHistory:
+    """
+    Rolling on-disk history of environment telemetry.
+
+    Samples are written straight into a memory-mapped ring file, so recording
+    costs a struct pack per sample and never touches the Home Assistant
+    recorder. Open, flush, close and aggregate queries perform blocking I/O
+    and must run in an executor; append() only writes to mapped memory.
+    Columns are assigned by append() on the event loop, so queries take the
+    column map from columns(), called on the loop before going to the
+    executor. A lock serializes the mapped memory between the loop and the
+    executor: queries hold it only while copying the ring they read, and
+    close() waits for that copy before unmapping.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Initialize the history.
+
+        Args:
+            path: History file; created (or recreated if incompatible) on open
+
+        """
+        self.path = Path(path)
+        self._file: Any = None
+        self._map: mmap.mmap | None = None
+        self._names: list[str] = []
+        self._columns: dict[str, int] = {}
+        self._dropped: set[str] = set()
+        self._raw = _Ring(RAW_OFFSET, RAW_RECORD, HISTORY_RAW_CAPACITY)
+        self._rollups = _Ring(ROLLUP_OFFSET, ROLLUP_RECORD, HISTORY_ROLLUP_CAPACITY)
+        self._bucket: _Rollup | None = None
+        self._lock = threading.Lock()
+
+    def open(self) -> None:
+        """Map the history file, creating it if missing or incompatible."""
+        with self._lock:
+            self._open()
+
+    def _open(self) -> None:
+        """Map the history file; called with the lock held."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        exists = self.path.exists() and self.path.stat().st_size == HISTORY_FILE_SIZE
+        self._file = self.path.open("r+b" if exists else "w+b")
+        if not exists:
+            self._file.truncate(HISTORY_FILE_SIZE)
+        self._map = mmap.mmap(self._file.fileno(), HISTORY_FILE_SIZE)
+
+        if not exists or not self._load_header():
+            _LOGGER.debug("Initializing telemetry history %s", self.path)
+            self._map[:HEADER_SIZE] = bytes(HEADER_SIZE)
+            self._write_names()
+            self._write_header()
+            return
+
+        self._restore_open_bucket()
+
+    def flush(self) -> None:
+        """Write dirty pages to disk."""
+        with self._lock:
+            if self._map is not None:
+                self._map.flush()
+
+    def close(self) -> None:
+        """Flush and unmap the history file."""
+        with self._lock:
+            if self._map is not None:
+                self._map.flush()
+                self._map.close()
+                self._map = None
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _load_header(self) -> bool:
+        """Load counters and column names; return False if incompatible."""
+        (
+            magic,
+            version,
+            columns,
+            raw_capacity,
+            rollup_capacity,
+            rollup_seconds,
+            raw_head,
+            raw_count,
+            rollup_head,
+            rollup_count,
+        ) = HEADER.unpack_from(self._map, 0)
+        if (magic, version, columns, raw_capacity, rollup_capacity, rollup_seconds) != (
+            HISTORY_MAGIC,
+            HISTORY_VERSION,
+            HISTORY_COLUMNS,
+            HISTORY_RAW_CAPACITY,
+            HISTORY_ROLLUP_CAPACITY,
+            HISTORY_ROLLUP_SECONDS,
+        ):
+            return False
+
+        (length,) = struct.unpack_from("<I", self._map, HEADER.size)
+        start = HEADER.size + 4
+        try:
+            self._names = json.loads(bytes(self._map[start : start + length]) or "[]")
+        except ValueError:
+            return False
+        self._columns = {name: column for column, name in enumerate(self._names)}
+        self._raw.head, self._raw.count = raw_head, raw_count
+        self._rollups.head, self._rollups.count = rollup_head, rollup_count
+        return True
+
+    def _write_header(self) -> None:
+        """Write format parameters and ring counters."""
+        HEADER.pack_into(
+            self._map,
+            0,
+            HISTORY_MAGIC,
+            HISTORY_VERSION,
+            HISTORY_COLUMNS,
+            HISTORY_RAW_CAPACITY,
+            HISTORY_ROLLUP_CAPACITY,
+            HISTORY_ROLLUP_SECONDS,
+            self._raw.head,
+            self._raw.count,
+            self._rollups.head,
+            self._rollups.count,
+        )
+
+    def _write_names(self) -> bool:
+        """Write the column name table; return False if it does not fit."""
+        encoded = json.dumps(self._names, separators=(",", ":")).encode()
+        start = HEADER.size + 4
+        if start + len(encoded) > HEADER_SIZE:
+            return False
+        struct.pack_into("<I", self._map, HEADER.size, len(encoded))
+        self._map[start : start + len(encoded)] = encoded
+        return True
+
+    def _column(self, name: str) -> int | None:
+        """Return the column of a sensor, assigning one on first sight."""
+        column = self._columns.get(name)
+        if column is not None or name in self._dropped:
+            return column
+        if len(self._names) < HISTORY_COLUMNS:
+            self._names.append(name)
+            if self._write_names():
+                column = self._columns[name] = len(self._names) - 1
+                return column
+            self._names.pop()
+        self._dropped.add(name)
+        _LOGGER.warning(
+            "Telemetry history %s is full (%s sensors); not recording %s",
+            self.path,
+            len(self._names),
+            name,
+        )
+        return None
+
+    def _restore_open_bucket(self) -> None:
+        """Rebuild the in-progress rollup bucket from the newest raw records."""
+        for timestamp, *values in self._raw.reversed_records(self._map):
+            bucket_start = timestamp - timestamp % HISTORY_ROLLUP_SECONDS
+            if self._bucket is None:
+                self._bucket = _Rollup(bucket_start)
+            elif bucket_start != self._bucket.start:
+                break
+            for column, value in enumerate(values):
+                self._bucket.add(column, value, value, value, 1)
+
+    def append(self, timestamp: float, sample: dict[str, TelemetryColumns]) -> None:
+        """
+        Record one telemetry sample.
+
+        Args:
+            timestamp: Unix timestamp of the sample
+            sample: Columns of the value types sampled this round
+
+        """
+        with self._lock:
+            if self._map is not None:
+                self._append(timestamp, sample)
+
+    def _append(self, timestamp: float, sample: dict[str, TelemetryColumns]) -> None:
+        """Record one telemetry sample; called with the lock held."""
+        values = [math.nan] * HISTORY_COLUMNS
+        for columns in sample.values():
+            for name, reading in zip(columns.names, columns.values, strict=True):
+                column = self._column(name)
+                if column is not None:
+                    values[column] = reading
+
+        RAW_RECORD.pack_into(self._map, self._raw.next_offset(), timestamp, *values)
+
+        bucket_start = timestamp - timestamp % HISTORY_ROLLUP_SECONDS
+        if self._bucket is not None and self._bucket.start != bucket_start:
+            self._write_rollup(self._bucket)
+            self._bucket = None
+        if self._bucket is None:
+            self._bucket = _Rollup(bucket_start)
+        for column, value in enumerate(values):
+            self._bucket.add(column, value, value, value, 1)
+
+        self._write_header()
+
+    def _write_rollup(self, bucket: _Rollup) -> None:
+        """Write a finished rollup bucket."""
+        mins = [math.nan] * HISTORY_COLUMNS
+        maxs = [math.nan] * HISTORY_COLUMNS
+        means = [math.nan] * HISTORY_COLUMNS
+        counts = [0.0] * HISTORY_COLUMNS
+        for column, low, high, mean, count in bucket.columns():
+            mins[column], maxs[column], means[column] = low, high, mean
+            counts[column] = count
+        ROLLUP_RECORD.pack_into(
+            self._map,
+            self._rollups.next_offset(),
+            bucket.start,
+            *mins,
+            *maxs,
+            *means,
+            *counts,
+        )
+
+    def columns(self, names: list[str] | None = None) -> dict[int, str]:
+        """
+        Return a snapshot of the sensor columns; call on the event loop.
+
+        Args:
+            names: Sensor names to include; all if None
+
+        Returns:
+            Column -> sensor name
+
+        """
+        return {
+            column: name
+            for name, column in self._columns.items()
+            if names is None or name in names
+        }
+
+    def aggregates(
+        self,
+        start: float,
+        end: float,
+        bucket_seconds: float,
+        columns: dict[int, str],
+    ) -> dict[str, list[dict[str, float]]]:
+        """
+        Return windowed min/max/mean per sensor.
+
+        Raw samples are used while the window is still covered by the raw
+        ring; older windows fall back to the rollups (and bucket_seconds is
+        rounded up to a multiple of HISTORY_ROLLUP_SECONDS).
+
+        Args:
+            start: Window start (unix timestamp)
+            end: Window end (unix timestamp)
+            bucket_seconds: Aggregation bucket width
+            columns: Columns to include, as returned by columns()
+
+        Returns:
+            Sensor name -> buckets with start, min, max, mean and count
+
+        """
+        with self._lock:
+            if self._map is None:
+                return {}
+            oldest_raw = next(self._raw.records(self._map), (math.inf,))[0]
+            use_raw = start >= oldest_raw
+            ring, region = (self._raw if use_raw else self._rollups).snapshot(self._map)
+            bucket = None
+            if self._bucket is not None:
+                bucket = (self._bucket.start, list(self._bucket.columns()))
+
+        if not use_raw:
+            bucket_seconds = HISTORY_ROLLUP_SECONDS * max(
+                1, math.ceil(bucket_seconds / HISTORY_ROLLUP_SECONDS)
+            )
+
+        buckets: dict[float, _Rollup] = {}
+
+        def merge(timestamp: float, entries: Iterator[tuple[Any, ...]]) -> None:
+            if not start <= timestamp < end:
+                return
+            key = timestamp - timestamp % bucket_seconds
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = _Rollup(key)
+            for column, *aggregate in entries:
+                if column in columns:
+                    bucket.add(column, *aggregate)
+
+        if use_raw:
+            for timestamp, *values in ring.records(region):
+                merge(
+                    timestamp,
+                    ((col, value, value, value, 1) for col, value in enumerate(values)),
+                )
+        else:
+            for timestamp, *fields in ring.records(region):
+                mins = fields[:HISTORY_COLUMNS]
+                maxs = fields[HISTORY_COLUMNS : 2 * HISTORY_COLUMNS]
+                means = fields[2 * HISTORY_COLUMNS : 3 * HISTORY_COLUMNS]
+                counts = fields[3 * HISTORY_COLUMNS :]
+                merge(
+                    timestamp,
+                    zip(range(HISTORY_COLUMNS), mins, maxs, means, counts, strict=True),
+                )
+            if bucket is not None:
+                merge(bucket[0], iter(bucket[1]))
+
+        result: dict[str, list[dict[str, float]]] = {}
+        for key in sorted(buckets):
+            for column, low, high, mean, count in buckets[key].columns():
+                result.setdefault(columns[column], []).append(
+                    {
+                        "start": key,
+                        "min": round(low, 2),
+                        "max": round(high, 2),
+                        "mean": round(mean, 2),
+                        "count": count,
+                    }
+                )
+        return result
@@ -0,0 +1,89 @@
+"""Physical remote control and keypad events for Barco Pulse integration."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+
+from .const import EVENT_KEY
+from .exceptions import BarcoApiError, BarcoConnectionError, BarcoStateError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .api import BarcoDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+SIGNAL_KEY_EVENT = "keydispatcher.keyevent"
+
+
+class BarcoKeyEventForwarder:
+    """
+    Forward keydispatcher.keyevent signals to the Home Assistant bus.
+
+    Events are fired straight from the device's notification dispatch, i.e.
+    from the connection's read loop, so a key press on the projector's remote
+    reaches automations without any coordinator refresh in between.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, device: BarcoDevice
+    ) -> None:
+        """Initialize the key event forwarder."""
+        self.hass = hass
+        self.entry = entry
+        self.device = device
+        self._unsubscribe: Callable[[], None] | None = None
+
+    async def async_start(self) -> None:
+        """Subscribe to key events."""
+        self._unsubscribe = self.device.add_notification_listener(
+            self._handle_notification
+        )
+        try:
+            await self.device.subscribe_signals([SIGNAL_KEY_EVENT])
+        except (BarcoConnectionError, BarcoApiError, BarcoStateError) as err:
+            # Remembered by the device; sent again on the next connect
+            _LOGGER.debug("Key event subscription deferred: %s", err)
+
+    async def async_stop(self) -> None:
+        """Stop forwarding key events and drop the signal subscription."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        try:
+            await self.device.unsubscribe_signals([SIGNAL_KEY_EVENT])
+        except (BarcoConnectionError, BarcoApiError, BarcoStateError) as err:
+            _LOGGER.debug("Could not unsubscribe key events: %s", err)
+
+    @callback
+    def _handle_notification(self, method: str, params: Any) -> None:
+        """Fire an event for every key event signal."""
+        if method != "signal.callback" or not isinstance(params, dict):
+            return
+        signals = params.get("signal")
+        if isinstance(signals, dict):
+            signals = [signals]
+        if not isinstance(signals, list):
+            return
+
+        for signal in signals:
+            if not isinstance(signal, dict):
+                continue
+            args = signal.get(SIGNAL_KEY_EVENT)
+            if isinstance(args, dict):
+                self.hass.bus.async_fire(
+                    EVENT_KEY,
+                    {
+                        "config_entry_id": self.entry.entry_id,
+                        "key": args.get("key"),
+                        "type": args.get("type"),
+                        "source": args.get("source"),
+                    },
+                )
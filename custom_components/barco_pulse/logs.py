@@ -0,0 +1,397 @@
+"""Projector log archives and their sidecar index for Barco Pulse integration."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import mmap
+import re
+import struct
+import tarfile
+import zipfile
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import datetime
+from typing import IO, TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from datetime import tzinfo
+    from pathlib import Path
+
+_LOGGER = logging.getLogger(__name__)
+
+# Log kind -> file endpoint below http://<host>/api/ (spec §7.1.1-7.1.2)
+LOG_ENDPOINTS = {
+    "notification": "notification/logger/transfer",
+    "bio": "bio/logger/transfer",
+}
+
+# Severities in ascending order; entries without one are indexed as INFO
+LOG_SEVERITIES = ("DEBUG", "INFO", "CAUTION", "WARNING", "ERROR", "CRITICAL")
+_SEVERITY_ALIASES = {
+    "TRACE": "DEBUG",
+    "NOTICE": "INFO",
+    "WARN": "WARNING",
+    "ERR": "ERROR",
+    "CRIT": "CRITICAL",
+    "FATAL": "CRITICAL",
+    "ALERT": "CRITICAL",
+    "EMERG": "CRITICAL",
+}
+_SEVERITY_LEVELS = {
+    **{name: level for level, name in enumerate(LOG_SEVERITIES)},
+    **{alias: LOG_SEVERITIES.index(name) for alias, name in _SEVERITY_ALIASES.items()},
+}
+_DEFAULT_LEVEL = LOG_SEVERITIES.index("INFO")
+
+# An entry starts with an ISO-like timestamp; other lines continue the entry
+_TIMESTAMP = re.compile(
+    rb"^\s*\[?(\d{4}-\d{2}-\d{2})[T ](\d{2}:\d{2}:\d{2})(?:[.,](\d{1,6})\d*)?"
+    rb"\s?(Z|[+-]\d{2}:?\d{2})?\]?"
+)
+_SEVERITY = re.compile(
+    rb"\b(" + b"|".join(name.encode() for name in _SEVERITY_LEVELS) + rb")\b",
+    re.IGNORECASE,
+)
+SEVERITY_SEARCH_SPAN = 64  # Bytes after the timestamp searched for a severity
+
+# Index file format
+#
+# A small header, the JSON table of archive members, then one fixed-width
+# record per log entry, sorted by timestamp: unix timestamp, severity level,
+# member number and the byte offset and length of the entry in the log text.
+# Queries bisect the memory-mapped records and only read the matching entries
+# from the text, so they cost a seek per result instead of an archive scan.
+# The text is the download itself for plain logs; compressed archives are
+# unpacked once into a "<archive>.txt" file next to it.
+LOG_INDEX_MAGIC = b"BPLI"
+LOG_INDEX_VERSION = 1
+LOG_INDEX_SUFFIX = ".idx"
+LOG_TEXT_SUFFIX = ".txt"
+INDEX_HEADER = struct.Struct("<4sBxxxIQ")
+INDEX_RECORD = struct.Struct("<dBxHQI")
+LOG_MESSAGE_MAX_BYTES = 4096  # Longer entries are truncated in query results
+
+
+@dataclass(frozen=True, slots=True)
+class LogIndexSummary:
+    """Counts of an indexed log archive."""
+
+    entries: int
+    severities: dict[str, int]  # Severity -> entries
+    first: float | None = None  # Unix timestamp of the oldest entry
+    last: float | None = None  # Unix timestamp of the newest entry
+
+
+def parse_severity(name: str) -> int:
+    """
+    Return the level of a severity name or alias.
+
+    Raises:
+        ValueError: If the name is not a known severity
+
+    """
+    try:
+        return _SEVERITY_LEVELS[name.upper()]
+    except KeyError:
+        msg = f"Unknown severity {name!r}"
+        raise ValueError(msg) from None
+
+
+def _parse_timestamp(match: re.Match[bytes], tz: tzinfo) -> float | None:
+    """Return the unix timestamp of a matched entry timestamp."""
+    date, clock, fraction, zone = match.groups()
+    text = f"{date.decode()}T{clock.decode()}"
+    if fraction:
+        text += "." + fraction.decode().ljust(6, "0")
+    if zone:
+        text += "+00:00" if zone == b"Z" else zone.decode()
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=tz)
+    return parsed.timestamp()
+
+
+def _members(archive: Path) -> Iterator[tuple[str, IO[bytes]]]:
+    """
+    Yield (name, stream) per log file of an archive.
+
+    Tar (optionally compressed), zip, gzip and plain files are supported;
+    gzipped members of tar and zip archives (rotated logs) are unpacked too.
+    Members are streamed, never read into memory as a whole.
+    """
+    if tarfile.is_tarfile(archive):
+        with tarfile.open(archive, "r:*") as tar:
+            for member in tar:
+                stream = tar.extractfile(member) if member.isfile() else None
+                if stream is not None:
+                    with stream:
+                        yield from _unpacked(member.name, stream)
+    elif zipfile.is_zipfile(archive):
+        with zipfile.ZipFile(archive) as zipped:
+            for info in zipped.infolist():
+                if not info.is_dir():
+                    with zipped.open(info) as stream:
+                        yield from _unpacked(info.filename, stream)
+    elif _is_gzip(archive):
+        with gzip.open(archive, "rb") as stream:
+            yield archive.name.removesuffix(".gz"), stream
+    else:
+        with archive.open("rb") as stream:
+            yield archive.name, stream
+
+
+def _unpacked(name: str, stream: IO[bytes]) -> Iterator[tuple[str, IO[bytes]]]:
+    """Yield a member stream, transparently gunzipping .gz members."""
+    if name.endswith(".gz"):
+        with gzip.GzipFile(fileobj=stream) as unpacked:
+            yield name.removesuffix(".gz"), unpacked
+    else:
+        yield name, stream
+
+
+def _is_gzip(path: Path) -> bool:
+    """Return True if a file is gzip compressed."""
+    with path.open("rb") as stream:
+        return stream.read(2) == b"\x1f\x8b"
+
+
+def _is_plain(archive: Path) -> bool:
+    """Return True if an archive is an uncompressed log (indexed in place)."""
+    return not (
+        _is_gzip(archive) or tarfile.is_tarfile(archive) or zipfile.is_zipfile(archive)
+    )
+
+
+def index_path(archive: Path) -> Path:
+    """Return the sidecar index file of a log archive."""
+    return archive.with_name(archive.name + LOG_INDEX_SUFFIX)
+
+
+def build_index(archive: Path, tz: tzinfo) -> LogIndexSummary:
+    """
+    Parse a log archive in one streaming pass and write its sidecar index.
+
+    Lines are parsed as they are read: a line starting with a timestamp
+    starts an entry, other lines continue it. Only fixed-width records
+    (INDEX_RECORD.size bytes per entry) are kept in memory; they are sorted
+    only if members are not already in time order. Blocking; run it in an
+    executor.
+
+    Args:
+        archive: Downloaded log archive
+        tz: Time zone of timestamps without an offset
+
+    Returns:
+        Entry counts of the archive
+
+    Raises:
+        OSError: If the archive cannot be read or the index written
+        ValueError: If the archive is corrupt
+
+    """
+    plain = _is_plain(archive)
+    text_path = archive if plain else archive.with_name(archive.name + LOG_TEXT_SUFFIX)
+    names: list[str] = []
+    records = bytearray()
+    timestamps = array("d")
+    levels = [0] * len(LOG_SEVERITIES)
+
+    def add(timestamp: float, level: int, member: int, start: int, end: int) -> None:
+        records.extend(
+            INDEX_RECORD.pack(
+                timestamp, level, member, start, min(end - start, 0xFFFFFFFF)
+            )
+        )
+        timestamps.append(timestamp)
+        levels[level] += 1
+
+    text = None if plain else text_path.open("wb")
+    offset = 0
+    try:
+        for member, (name, stream) in enumerate(_members(archive)):
+            names.append(name)
+            current: tuple[float, int, int] | None = None  # timestamp, level, start
+            for line in stream:
+                match = _TIMESTAMP.match(line)
+                timestamp = _parse_timestamp(match, tz) if match else None
+                if timestamp is not None:
+                    if current is not None:
+                        add(*current[:2], member, current[2], offset)
+                    found = _SEVERITY.search(
+                        line, match.end(), match.end() + SEVERITY_SEARCH_SPAN
+                    )
+                    level = (
+                        _SEVERITY_LEVELS[found.group(1).decode().upper()]
+                        if found
+                        else _DEFAULT_LEVEL
+                    )
+                    current = (timestamp, level, offset)
+                if text is not None:
+                    text.write(line)
+                offset += len(line)
+            if current is not None:
+                add(*current[:2], member, current[2], offset)
+    except (tarfile.TarError, zipfile.BadZipFile, gzip.BadGzipFile, EOFError) as err:
+        msg = f"{archive.name} is not a readable log archive: {err}"
+        raise ValueError(msg) from err
+    finally:
+        if text is not None:
+            text.close()
+
+    count = len(timestamps)
+    if any(timestamps[i] > timestamps[i + 1] for i in range(count - 1)):
+        order = sorted(range(count), key=timestamps.__getitem__)
+        size = INDEX_RECORD.size
+        view = memoryview(records)
+        records = b"".join(view[i * size : (i + 1) * size] for i in order)
+
+    encoded = json.dumps(
+        {"text": text_path.name, "members": names}, separators=(",", ":")
+    ).encode()
+    with index_path(archive).open("wb") as index:
+        index.write(
+            INDEX_HEADER.pack(LOG_INDEX_MAGIC, LOG_INDEX_VERSION, len(encoded), offset)
+        )
+        index.write(encoded)
+        index.write(records)
+
+    _LOGGER.debug("Indexed %s log entries of %s", count, archive)
+    return LogIndexSummary(
+        count,
+        dict(zip(LOG_SEVERITIES, levels, strict=True)),
+        min(timestamps) if count else None,
+        max(timestamps) if count else None,
+    )
+
+
+class _Timestamps:
+    """Sequence view of the record timestamps of a mapped index (for bisect)."""
+
+    __slots__ = ("_buffer", "_count", "_start")
+
+    def __init__(self, buffer: mmap.mmap, start: int, count: int) -> None:
+        """Initialize the view."""
+        self._buffer = buffer
+        self._start = start
+        self._count = count
+
+    def __len__(self) -> int:
+        """Return the number of records."""
+        return self._count
+
+    def __getitem__(self, position: int) -> float:
+        """Return the timestamp of a record."""
+        return struct.unpack_from(
+            "<d", self._buffer, self._start + position * INDEX_RECORD.size
+        )[0]
+
+
+def query_index(  # noqa: PLR0913
+    archive: Path,
+    start: float,
+    end: float,
+    min_level: int = 0,
+    limit: int | None = None,
+    *,
+    newest_first: bool = True,
+) -> list[dict[str, Any]]:
+    """
+    Return the entries of an indexed archive within a time window.
+
+    The window is found by bisecting the index and only the matching entries
+    are read from the log text. Blocking; run it in an executor.
+
+    Args:
+        archive: Indexed log archive
+        start: Window start (unix timestamp, inclusive)
+        end: Window end (unix timestamp, exclusive)
+        min_level: Lowest severity level included
+        limit: Maximum number of entries returned
+        newest_first: Return the newest entries (first) instead of the oldest
+
+    Returns:
+        Entries with time, severity, member and message
+
+    Raises:
+        OSError: If the index or log text cannot be read
+        ValueError: If the index is not a compatible log index
+
+    """
+    with index_path(archive).open("rb") as index:
+        header = index.read(INDEX_HEADER.size)
+        if len(header) < INDEX_HEADER.size:
+            msg = f"{index.name} is not a log index"
+            raise ValueError(msg)
+        magic, version, length, text_size = INDEX_HEADER.unpack(header)
+        if (magic, version) != (LOG_INDEX_MAGIC, LOG_INDEX_VERSION):
+            msg = f"{index.name} is not a compatible log index"
+            raise ValueError(msg)
+        meta = json.loads(index.read(length))
+        first = INDEX_HEADER.size + length
+        size = index.seek(0, 2)
+        if size == first:
+            return []
+        buffer = mmap.mmap(index.fileno(), 0, access=mmap.ACCESS_READ)
+
+    with buffer:
+        timestamps = _Timestamps(buffer, first, (size - first) // INDEX_RECORD.size)
+        low = bisect_left(timestamps, start)
+        high = bisect_left(timestamps, end)
+        positions = range(high - 1, low - 1, -1) if newest_first else range(low, high)
+        matches = []
+        for position in positions:
+            record = INDEX_RECORD.unpack_from(
+                buffer, first + position * INDEX_RECORD.size
+            )
+            if record[1] >= min_level:
+                matches.append(record)
+                if limit is not None and len(matches) >= limit:
+                    break
+
+    text_path = archive.with_name(meta["text"])
+    if text_path.stat().st_size != text_size:
+        msg = f"{text_path.name} changed since it was indexed"
+        raise ValueError(msg)
+    entries = []
+    with text_path.open("rb") as text:
+        for timestamp, level, member, offset, entry_length in matches:
+            text.seek(offset)
+            message = text.read(min(entry_length, LOG_MESSAGE_MAX_BYTES))
+            entries.append(
+                {
+                    "time": timestamp,
+                    "severity": LOG_SEVERITIES[level],
+                    "member": meta["members"][member],
+                    "message": message.decode(errors="replace").rstrip(),
+                }
+            )
+    return entries
+
+
+def latest_archive(directory: Path, prefix: str) -> Path | None:
+    """Return the newest indexed archive whose name starts with prefix."""
+    indexes = sorted(directory.glob(f"{prefix}*{LOG_INDEX_SUFFIX}"))
+    if not indexes:
+        return None
+    return indexes[-1].with_name(indexes[-1].name.removesuffix(LOG_INDEX_SUFFIX))
+
+
+def prune_archives(directory: Path, prefix: str, keep: int) -> None:
+    """Delete all but the newest keep archives (with their index and text)."""
+    indexes = sorted(directory.glob(f"{prefix}*{LOG_INDEX_SUFFIX}"))
+    for index in indexes[: max(len(indexes) - keep, 0)]:
+        archive = index.with_name(index.name.removesuffix(LOG_INDEX_SUFFIX))
+        for path in (
+            archive,
+            archive.with_name(archive.name + LOG_TEXT_SUFFIX),
+            index,
+        ):
+            path.unlink(missing_ok=True)
+        _LOGGER.debug("Pruned log archive %s", archive)
@@ -0,0 +1,152 @@
+"""Command-to-confirmation latency tracking for Barco Pulse integration."""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_LOGGER = logging.getLogger(__name__)
+
+LATENCY_WINDOW_SIZE = 100  # Completed commands kept per command type
+COMMAND_CONFIRM_TIMEOUT = 30.0  # Seconds before an unconfirmed command expires
+LATENCY_PERCENTILES = (50, 95, 99)
+
+
+@dataclass(slots=True)
+class _PendingCommand:
+    """Command waiting for the projector to report its target value."""
+
+    target: Any
+    started: float
+
+
+def _values_match(reported: Any, target: Any) -> bool:
+    """Return True if a reported value confirms the target value."""
+    if isinstance(target, float) or isinstance(reported, float):
+        try:
+            return math.isclose(
+                float(reported), float(target), rel_tol=1e-3, abs_tol=1e-3
+            )
+        except (TypeError, ValueError):
+            return False
+    return reported == target
+
+
+def _percentile(ordered: list[float], percentile: int) -> float:
+    """Return the nearest-rank percentile of an ordered sample."""
+    rank = max(1, math.ceil(percentile / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class CommandLatencyTracker:
+    """
+    Track time from a user command until the projector reports the new value.
+
+    Commands are stamped when issued via start() and completed when a
+    coordinator snapshot (or change notification) passed to observe() reports
+    the target value. Completed latencies are kept in a rolling window per
+    command type.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._pending: dict[str, _PendingCommand] = {}
+        self._samples: dict[str, deque[float]] = {}
+        self._timeouts: dict[str, int] = {}
+
+    def start(self, command_type: str, target: Any) -> None:
+        """
+        Stamp a command at entry.
+
+        Args:
+            command_type: Coordinator data key the command changes
+                (e.g. "source", "brightness")
+            target: Value the projector is expected to report
+
+        """
+        # A newer command of the same type supersedes the pending one
+        self._pending[command_type] = _PendingCommand(target, time.monotonic())
+
+    def cancel(self, command_type: str) -> None:
+        """Drop a pending command (e.g. because the request failed)."""
+        self._pending.pop(command_type, None)
+
+    @contextmanager
+    def track(self, command_type: str, target: Any) -> Iterator[None]:
+        """Stamp a command for the duration of its request; drop it on failure."""
+        self.start(command_type, target)
+        try:
+            yield
+        except BaseException:
+            self.cancel(command_type)
+            raise
+
+    def observe(self, values: dict[str, Any]) -> None:
+        """
+        Complete pending commands confirmed by reported values.
+
+        Args:
+            values: Reported values keyed by coordinator data key
+
+        """
+        if not self._pending:
+            return
+
+        now = time.monotonic()
+        for command_type, pending in list(self._pending.items()):
+            if command_type in values and _values_match(
+                values[command_type], pending.target
+            ):
+                latency = now - pending.started
+                self._samples.setdefault(
+                    command_type, deque(maxlen=LATENCY_WINDOW_SIZE)
+                ).append(latency)
+                del self._pending[command_type]
+                _LOGGER.debug(
+                    "%s confirmed after %.0f ms", command_type, latency * 1000
+                )
+            elif now - pending.started > COMMAND_CONFIRM_TIMEOUT:
+                self._timeouts[command_type] = self._timeouts.get(command_type, 0) + 1
+                del self._pending[command_type]
+                _LOGGER.debug(
+                    "%s not confirmed within %ss", command_type, COMMAND_CONFIRM_TIMEOUT
+                )
+
+    def percentiles(self, command_type: str) -> dict[str, float] | None:
+        """Return latency percentiles in milliseconds for a command type."""
+        samples = self._samples.get(command_type)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        return {
+            f"p{percentile}": round(_percentile(ordered, percentile) * 1000, 1)
+            for percentile in LATENCY_PERCENTILES
+        }
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Return percentiles, sample count and timeouts per command type."""
+        summary: dict[str, dict[str, Any]] = {}
+        for command_type in self._samples.keys() | self._timeouts.keys():
+            summary[command_type] = {
+                **(self.percentiles(command_type) or {}),
+                "count": len(self._samples.get(command_type, ())),
+                "timeouts": self._timeouts.get(command_type, 0),
+            }
+        return summary
+
+    def overall_percentile(self, percentile: int = 95) -> float | None:
+        """Return a latency percentile in milliseconds across all command types."""
+        ordered = sorted(
+            sample for samples in self._samples.values() for sample in samples
+        )
+        if not ordered:
+            return None
+        return round(_percentile(ordered, percentile) * 1000, 1)
@@ -0,0 +1,348 @@
+"""Leader/follower picture setting mirroring for Barco Pulse projector groups."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.debounce import Debouncer
+
+from .exceptions import BarcoApiError, BarcoConnectionError, BarcoError, BarcoStateError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+    from .api import BarcoDevice
+    from .data import BarcoRuntimeData
+    from .group import BarcoGroupController
+
+_LOGGER = logging.getLogger(__name__)
+
+# Mirrored setting -> (property, coordinator data keys of its min/max or None)
+MIRROR_PROPERTIES: dict[str, tuple[str, tuple[str, str] | None]] = {
+    "brightness": ("image.brightness", None),
+    "contrast": ("image.contrast", None),
+    "saturation": ("image.saturation", None),
+    "hue": ("image.hue", None),
+    "laser_power": ("illumination.sources.laser.power", ("laser_min", "laser_max")),
+}
+_SETTINGS = {prop: key for key, (prop, _) in MIRROR_PROPERTIES.items()}
+MIRROR_IMAGE_RANGE = (-1.0, 1.0)  # Range of the image.* settings
+
+MIRROR_COOLDOWN = 0.3  # Seconds between follower writes while a slider moves
+MIRROR_STAGE_TIMEOUT = 0.5  # Seconds to wait for all followers to be staged
+MIRROR_TOLERANCE = 0.005  # Read-back difference still considered matched
+
+
+class BarcoPictureMirror:
+    """
+    Mirror the leader's picture settings to the other group members.
+
+    The leader's settings are observed through property subscriptions.
+    Changes are coalesced: the first change is written right away, further
+    changes within MIRROR_COOLDOWN only keep their latest value, and that is
+    written when the cooldown ends, so dragging a slider costs at most a few
+    writes per second per follower. Each write is staged on every follower
+    connection (lock held, rate limit waited, connected, no fleet request
+    slot held) and all are released together; once the leader has settled,
+    followers are read back and any still off target are written once more.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        controller: BarcoGroupController,
+        leader_id: str,
+        offsets: dict[str, dict[str, float]],
+    ) -> None:
+        """
+        Initialize the mirror.
+
+        Args:
+            hass: Home Assistant instance
+            controller: Controller of the group whose members are mirrored
+            leader_id: Config entry id of the leader projector
+            offsets: Per follower entry id, an offset per mirrored setting
+
+        """
+        self.hass = hass
+        self.controller = controller
+        self.leader_id = leader_id
+        self.offsets = offsets
+        self.mismatches: dict[str, list[str]] = {}  # Follower title -> settings
+        self._leader: BarcoDevice | None = None
+        self._followers: set[str] = set()
+        self._pending: dict[str, float] = {}  # Setting -> leader value
+        self._unsubscribers: list[Callable[[], None]] = []
+        self._leader_unsubscribers: list[Callable[[], None]] = []
+        self._debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=MIRROR_COOLDOWN,
+            immediate=True,
+            function=self._async_sync,
+        )
+
+    @callback
+    def async_start(self) -> None:
+        """Follow the leader as members (re)load."""
+        self._unsubscribers.append(
+            self.controller.async_add_listener(self._async_members_changed)
+        )
+        self._async_members_changed()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop mirroring."""
+        self._debouncer.async_shutdown()
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        self._unsubscribers = []
+        self._async_unbind_leader()
+
+    def _members(self) -> tuple[BarcoRuntimeData | None, dict[str, BarcoRuntimeData]]:
+        """Return the loaded leader and followers (entry id -> runtime data)."""
+        leader = None
+        followers = {}
+        for entry, data in self.controller.members:
+            if entry.entry_id == self.leader_id:
+                leader = data
+            else:
+                followers[entry.entry_id] = data
+        return leader, followers
+
+    @callback
+    def _async_members_changed(self) -> None:
+        """Rebind to the leader and catch up new followers."""
+        leader, followers = self._members()
+        leader_device = leader.client if leader is not None else None
+        if leader_device is not self._leader:
+            self._async_unbind_leader()
+            if leader_device is not None:
+                self._async_bind_leader(leader_device)
+            self._followers = set(followers)
+            return
+        if self._leader is not None and not followers.keys() <= self._followers:
+            self.hass.async_create_background_task(
+                self._async_resync(), "barco_pulse_mirror_resync"
+            )
+        self._followers = set(followers)
+
+    @callback
+    def _async_bind_leader(self, device: BarcoDevice) -> None:
+        """Observe the leader's settings and bring followers in line."""
+        self._leader = device
+        self._leader_unsubscribers = [
+            device.add_notification_listener(self._handle_notification),
+            device.add_connect_listener(self._handle_connect),
+        ]
+        self.hass.async_create_background_task(
+            self._async_subscribe(device), "barco_pulse_mirror_subscribe"
+        )
+
+    @callback
+    def _async_unbind_leader(self) -> None:
+        """Stop observing the leader."""
+        for unsubscribe in self._leader_unsubscribers:
+            unsubscribe()
+        self._leader_unsubscribers = []
+        self._leader = None
+        self._pending.clear()
+
+    async def _async_subscribe(self, device: BarcoDevice) -> None:
+        """Subscribe to the leader's settings and mirror their current values."""
+        try:
+            await device.subscribe_properties(list(_SETTINGS))
+        except (BarcoConnectionError, BarcoApiError, BarcoStateError) as err:
+            _LOGGER.debug("Mirror subscription deferred: %s", err)
+        await self._async_resync()
+
+    async def _async_resync(self) -> None:
+        """Read all of the leader's settings and mirror them."""
+        device = self._leader
+        if device is None:
+            return
+        try:
+            values = await device.get_properties(list(_SETTINGS))
+        except (BarcoConnectionError, BarcoApiError, BarcoStateError) as err:
+            _LOGGER.debug("Could not read leader picture settings: %s", err)
+            return
+        self._queue({_SETTINGS[prop]: value for prop, value in values.items()})
+
+    @callback
+    def _handle_connect(self) -> None:
+        """Re-mirror after the leader reconnected (changes may be missed)."""
+        self.hass.async_create_background_task(
+            self._async_resync(), "barco_pulse_mirror_resync"
+        )
+
+    @callback
+    def _handle_notification(self, method: str, params: Any) -> None:
+        """Queue the leader's setting changes."""
+        if method != "property.changed" or not isinstance(params, dict):
+            return
+        changes = params.get("property")
+        if isinstance(changes, dict):
+            changes = [changes]
+        if not isinstance(changes, list):
+            return
+        self._queue(
+            {
+                _SETTINGS[name]: value
+                for change in changes
+                if isinstance(change, dict)
+                for name, value in change.items()
+                if name in _SETTINGS
+            }
+        )
+
+    @callback
+    def _queue(self, values: dict[str, Any]) -> None:
+        """Coalesce leader values and schedule a (rate limited) sync."""
+        for key, value in values.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                self._pending[key] = float(value)
+        if self._pending:
+            self.hass.async_create_background_task(
+                self._debouncer.async_call(), "barco_pulse_mirror_sync"
+            )
+
+    def _target(
+        self, data: BarcoRuntimeData, entry_id: str, key: str, value: float
+    ) -> float:
+        """Return a follower's target for a leader value: offset, then clamped."""
+        value += self.offsets.get(entry_id, {}).get(key, 0.0)
+        limits = MIRROR_PROPERTIES[key][1]
+        if limits is None:
+            low, high = MIRROR_IMAGE_RANGE
+        else:
+            low = data.coordinator.data.get(limits[0], 0.0)
+            high = data.coordinator.data.get(limits[1], 100.0)
+        return round(min(max(value, low), high), 4)
+
+    async def _async_sync(self) -> None:
+        """Write the pending leader values to all followers at once."""
+        if not self._pending:
+            return
+        values = dict(self._pending)
+        self._pending.clear()
+        _, followers = self._members()
+        targets = {
+            entry_id: {
+                MIRROR_PROPERTIES[key][0]: self._target(data, entry_id, key, value)
+                for key, value in values.items()
+            }
+            for entry_id, data in followers.items()
+        }
+        await self._async_write(followers, targets)
+
+        # Read back once the leader has settled (a newer value follows anyway)
+        if self._pending:
+            return
+        retry = await self._async_verify(followers, targets)
+        if retry:
+            await self._async_write(followers, retry)
+            retry = await self._async_verify(followers, retry)
+        self.mismatches = {
+            followers[entry_id].coordinator.config_entry.title: sorted(values)
+            for entry_id, values in retry.items()
+        }
+        for title, properties in self.mismatches.items():
+            _LOGGER.warning("Mirror follower %s did not apply %s", title, properties)
+
+    async def _async_write(
+        self,
+        followers: dict[str, BarcoRuntimeData],
+        targets: dict[str, dict[str, float]],
+    ) -> None:
+        """Stage one batched property.set per follower, then release them all."""
+        targets = {entry_id: values for entry_id, values in targets.items() if values}
+        if not targets:
+            return
+        unstaged = len(targets)
+        go = asyncio.Event()
+
+        def _arrived() -> None:
+            """Count a follower as staged (or failed); the last releases all."""
+            nonlocal unstaged
+            unstaged -= 1
+            if not unstaged:
+                go.set()
+
+        async def _write(device: BarcoDevice, values: dict[str, float]) -> None:
+            staged = False
+
+            async def _release() -> None:
+                nonlocal staged
+                staged = True
+                _arrived()
+                # Don't let a slow follower hold back the others for long
+                with contextlib.suppress(TimeoutError):
+                    async with asyncio.timeout(MIRROR_STAGE_TIMEOUT):
+                        await go.wait()
+
+            device.invalidate_cache(list(values))
+            try:
+                results = await device.send_batch(
+                    [
+                        ("property.set", {"property": prop, "value": value})
+                        for prop, value in values.items()
+                    ],
+                    release=_release,
+                )
+            except BarcoError as err:
+                _LOGGER.debug("Mirror write failed: %s", err)
+                return
+            finally:
+                if not staged:
+                    _arrived()
+                device.invalidate_cache(list(values))
+            for prop, result in zip(values, results, strict=True):
+                if isinstance(result, BarcoError):
+                    _LOGGER.debug("Mirror write of %s failed: %s", prop, result)
+
+        await asyncio.gather(
+            *(
+                _write(followers[entry_id].client, values)
+                for entry_id, values in targets.items()
+            )
+        )
+
+    async def _async_verify(
+        self,
+        followers: dict[str, BarcoRuntimeData],
+        targets: dict[str, dict[str, float]],
+    ) -> dict[str, dict[str, float]]:
+        """
+        Read followers back.
+
+        Returns:
+            Per follower, the targets it does not report (yet)
+
+        """
+
+        async def _read(entry_id: str) -> dict[str, float]:
+            expected = targets[entry_id]
+            try:
+                values = await followers[entry_id].client.get_properties(list(expected))
+            except BarcoError:
+                return expected
+            return {
+                prop: target
+                for prop, target in expected.items()
+                if not isinstance(values.get(prop), (int, float))
+                or abs(values[prop] - target) > MIRROR_TOLERANCE
+            }
+
+        entry_ids = [entry_id for entry_id in targets if targets[entry_id]]
+        results = await asyncio.gather(*(_read(entry_id) for entry_id in entry_ids))
+        return {
+            entry_id: missing
+            for entry_id, missing in zip(entry_ids, results, strict=True)
+            if missing
+        }
@@ -0,0 +1,203 @@
+"""Projector notification (alarm) tracking for Barco Pulse integration."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+
+from .const import DOMAIN, EVENT_NOTIFICATION
+from .exceptions import BarcoApiError, BarcoConnectionError, BarcoStateError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .api import BarcoDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+SIGNAL_EMITTED = "notification.emitted"
+SIGNAL_DISMISSED = "notification.dismissed"
+# Per-severity signals carry no arguments; they only trigger a resync on
+# firmware that does not send the generic signals above
+SEVERITY_SIGNALS = tuple(
+    f"notification.{severity}.{action}"
+    for severity in ("error", "warning", "caution")
+    for action in ("emitted", "dismissed")
+)
+NOTIFICATION_SIGNALS = (SIGNAL_EMITTED, SIGNAL_DISMISSED, *SEVERITY_SIGNALS)
+
+# Severities that make the problem binary sensor turn on
+PROBLEM_SEVERITIES = frozenset({"ERROR", "WARNING", "CAUTION"})
+
+
+class BarcoNotificationManager:
+    """
+    Active projector notifications, kept current by signal subscriptions.
+
+    The active set is read once from notification.list (and again after every
+    reconnect, since signals may have been missed while disconnected); after
+    that it is updated incrementally from signal.callback notifications, so
+    alarms show up immediately and cost no polling.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, device: BarcoDevice
+    ) -> None:
+        """Initialize the notification manager."""
+        self.hass = hass
+        self.entry = entry
+        self.device = device
+        self.active: dict[str, dict[str, Any]] = {}
+        self._listeners: list[Callable[[], None]] = []
+        self._unsubscribers: list[Callable[[], None]] = []
+        self._synced = False
+        self._generic_signals_seen = False
+
+    @property
+    def problem(self) -> bool:
+        """Return True if an error, warning or caution is active."""
+        return any(
+            item.get("severity") in PROBLEM_SEVERITIES for item in self.active.values()
+        )
+
+    @callback
+    def async_add_listener(
+        self, update_callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Listen for changes of the active notification set."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def _remove() -> None:
+            if update_callback in self._listeners:
+                self._listeners.remove(update_callback)
+
+        return _remove
+
+    @callback
+    def _async_update_listeners(self) -> None:
+        """Notify entities of a change."""
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    async def async_start(self) -> None:
+        """Subscribe to notification signals and read the active set."""
+        self._unsubscribers = [
+            self.device.add_notification_listener(self._handle_notification),
+            self.device.add_connect_listener(self._handle_connect),
+        ]
+        try:
+            await self.device.subscribe_signals(list(NOTIFICATION_SIGNALS))
+        except (BarcoConnectionError, BarcoApiError, BarcoStateError) as err:
+            # Remembered by the device; sent again on the next connect
+            _LOGGER.debug("Notification subscription deferred: %s", err)
+            return
+        await self.async_resync()
+
+    async def async_stop(self) -> None:
+        """Stop tracking notifications and drop the signal subscriptions."""
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        self._unsubscribers = []
+        try:
+            await self.device.unsubscribe_signals(list(NOTIFICATION_SIGNALS))
+        except (BarcoConnectionError, BarcoApiError, BarcoStateError) as err:
+            _LOGGER.debug("Could not unsubscribe notification signals: %s", err)
+
+    async def async_resync(self) -> None:
+        """Replace the active set with notification.list."""
+        try:
+            items = await self.device.get_notifications()
+        except (BarcoConnectionError, BarcoApiError, BarcoStateError) as err:
+            _LOGGER.debug("Could not read notification list: %s", err)
+            return
+
+        active = {str(item["id"]): item for item in items if "id" in item}
+        if self._synced:
+            # Report what changed while we were not listening
+            for notification_id in active.keys() - self.active.keys():
+                self._fire("emitted", active[notification_id])
+            for notification_id in self.active.keys() - active.keys():
+                self._fire("dismissed", self.active[notification_id])
+        self._synced = True
+        self.active = active
+        self._async_update_listeners()
+
+    @callback
+    def _handle_connect(self) -> None:
+        """Resync after a (re)connect, also if the first read never succeeded."""
+        self.entry.async_create_background_task(
+            self.hass, self.async_resync(), f"{DOMAIN}_notification_resync"
+        )
+
+    @callback
+    def _handle_notification(self, method: str, params: Any) -> None:
+        """Apply notification signals from the projector."""
+        if method != "signal.callback" or not isinstance(params, dict):
+            return
+        signals = params.get("signal")
+        if isinstance(signals, dict):
+            signals = [signals]
+        if not isinstance(signals, list):
+            return
+
+        changed = False
+        resync = False
+        for signal in signals:
+            if not isinstance(signal, dict):
+                continue
+            for name, args in signal.items():
+                if name == SIGNAL_EMITTED and isinstance(args, dict):
+                    self._generic_signals_seen = True
+                    changed |= self._add(args.get("notification"))
+                elif name == SIGNAL_DISMISSED and isinstance(args, dict):
+                    self._generic_signals_seen = True
+                    changed |= self._remove(args.get("id"))
+                elif name in SEVERITY_SIGNALS and not self._generic_signals_seen:
+                    resync = True
+
+        if changed:
+            self._async_update_listeners()
+        if resync:
+            self.entry.async_create_background_task(
+                self.hass, self.async_resync(), f"{DOMAIN}_notification_resync"
+            )
+
+    def _add(self, notification: Any) -> bool:
+        """Add an emitted notification; return True if the set changed."""
+        if not isinstance(notification, dict) or "id" not in notification:
+            return False
+        notification_id = str(notification["id"])
+        is_new = notification_id not in self.active
+        self.active[notification_id] = notification
+        if is_new:
+            self._fire("emitted", notification)
+        return True
+
+    def _remove(self, notification_id: Any) -> bool:
+        """Remove a dismissed notification; return True if the set changed."""
+        notification = self.active.pop(str(notification_id), None)
+        if notification is None:
+            return False
+        self._fire("dismissed", notification)
+        return True
+
+    def _fire(self, action: str, notification: dict[str, Any]) -> None:
+        """Fire a notification event on the Home Assistant bus."""
+        _LOGGER.debug("Notification %s: %s", action, notification)
+        self.hass.bus.async_fire(
+            EVENT_NOTIFICATION,
+            {
+                "config_entry_id": self.entry.entry_id,
+                "action": action,
+                "id": notification.get("id"),
+                "severity": notification.get("severity"),
+                "code": notification.get("code"),
+                "message": notification.get("message"),
+            },
+        )
@@ -11,8 +11,10 @@ from homeassistant.components.number import (
     NumberMode,
 )
 from homeassistant.const import PERCENTAGE
+from homeassistant.exceptions import HomeAssistantError
 
-from .entity import BarcoEntity
+from .entity import BarcoEntity, BarcoGroupEntity
+from .group import is_group_entry
 from .helpers import handle_api_errors, safe_refresh
 
 if TYPE_CHECKING:
@@ -21,7 +23,8 @@ if TYPE_CHECKING:
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .coordinator import BarcoDataUpdateCoordinator
-    from .data import BarcoRuntimeData
+    from .data import BarcoGroupRuntimeData, BarcoRuntimeData
+    from .group import BarcoGroupController
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,9 +56,12 @@ class BarcoNumberEntity(BarcoEntity, NumberEntity):
             _LOGGER.error("%s validation failed: %s", method_name, msg)
             raise ValueError(msg)
 
-        # Call the device method
+        # Call the device method, timing until the new value is reported
         method = getattr(self.coordinator.device, method_name)
-        await method(value)
+        with self.coordinator.command_latency.track(
+            method_name.removeprefix("set_"), value
+        ):
+            await method(value)
 
         # Request refresh
         await safe_refresh(self.coordinator, method_name)
@@ -185,12 +191,89 @@ class BarcoHueNumber(BarcoNumberEntity):
         await self._set_value_with_validation(value, "set_hue")
 
 
+class BarcoGroupNumber(BarcoGroupEntity, NumberEntity):
+    """Picture setting of a projector group (the mean of its members)."""
+
+    _attr_mode = NumberMode.SLIDER
+    _attr_native_min_value = -1.0
+    _attr_native_max_value = 1.0
+    _attr_native_step = 0.01
+
+    def __init__(self, controller: BarcoGroupController, key: str) -> None:
+        """
+        Initialize the group number.
+
+        Args:
+            controller: Group controller
+            key: Coordinator data key; the device setter is set_<key>
+
+        """
+        super().__init__(controller, key)
+        self._key = key
+        self._attr_translation_key = key
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the mean value of the members."""
+        values = self.member_values(self._key)
+        return sum(values) / len(values) if values else None
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Set the value on all members."""
+        if value < self.native_min_value or value > self.native_max_value:
+            msg = (
+                f"Value {value} out of range "
+                f"[{self.native_min_value}, {self.native_max_value}]"
+            )
+            raise HomeAssistantError(msg)
+        method_name = f"set_{self._key}"
+        await self.controller.async_fan_out(
+            method_name, lambda data: getattr(data.client, method_name)(value)
+        )
+
+
+class BarcoGroupLaserPowerNumber(BarcoGroupNumber):
+    """Laser power of a projector group, limited to the range all support."""
+
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_device_class = NumberDeviceClass.POWER_FACTOR
+    _attr_native_step = None
+
+    def __init__(self, controller: BarcoGroupController) -> None:
+        """Initialize the group laser power number."""
+        super().__init__(controller, "laser_power")
+
+    @property
+    def native_min_value(self) -> float:
+        """Return the highest minimum laser power of the members."""
+        return max(self.member_values("laser_min"), default=0.0)
+
+    @property
+    def native_max_value(self) -> float:
+        """Return the lowest maximum laser power of the members."""
+        return min(self.member_values("laser_max"), default=100.0)
+
+
 async def async_setup_entry(
     _hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Barco Pulse number entities from a config entry."""
+    if is_group_entry(entry):
+        group_data: BarcoGroupRuntimeData = entry.runtime_data
+        controller = group_data.controller
+        async_add_entities(
+            [
+                BarcoGroupLaserPowerNumber(controller),
+                *(
+                    BarcoGroupNumber(controller, key)
+                    for key in ("brightness", "contrast", "saturation", "hue")
+                ),
+            ]
+        )
+        return
+
     runtime_data: BarcoRuntimeData = entry.runtime_data
     coordinator = runtime_data.coordinator
 
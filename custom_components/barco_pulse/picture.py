@@ -0,0 +1,157 @@
+"""Named picture snapshots for Barco Pulse projectors."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .exceptions import BarcoApiError, BarcoStateError
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .api import BarcoDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+PICTURE_STORAGE_VERSION = 1
+
+# Snapshot setting -> property; a stored snapshot lists the values in this
+# order, followed by the profile (None where unknown)
+PICTURE_PROPERTIES: dict[str, str] = {
+    "brightness": "image.brightness",
+    "contrast": "image.contrast",
+    "saturation": "image.saturation",
+    "hue": "image.hue",
+    "laser_power": "illumination.sources.laser.power",
+    "source": "image.window.main.source",
+}
+PICTURE_TOLERANCE = 0.005  # Difference of a numeric setting still considered equal
+
+
+def picture_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, list[Any]]]:
+    """Return the storage holding the named picture snapshots of a projector."""
+    return Store(hass, PICTURE_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.pictures")
+
+
+def _differs(current: Any, target: Any) -> bool:
+    """Return True if a setting's current value does not match the target."""
+    if isinstance(current, (int, float)) and isinstance(target, (int, float)):
+        return abs(current - target) > PICTURE_TOLERANCE
+    return current != target
+
+
+class BarcoPictureSnapshots:
+    """
+    Save and restore named picture snapshots of a projector.
+
+    A snapshot holds the picture settings, laser power and source, read in
+    one batched request, plus the profile last activated through the
+    integration (the projector does not report its active profile).
+    Restoring a snapshot with a profile always activates it first and waits
+    for the reply: profile changes made outside the integration go unseen, so
+    the projector's active profile can never be trusted to match. It then
+    reads the current values (one batched request, unless cached) and writes
+    only those that differ as one batched request.
+    Snapshots are stored as value lists rather than keyed objects.
+    """
+
+    def __init__(self, hass: HomeAssistant, device: BarcoDevice, entry_id: str) -> None:
+        """Initialize the snapshots of a projector."""
+        self.device = device
+        self._store = picture_store(hass, entry_id)
+        self._snapshots: dict[str, list[Any]] | None = None
+        self._lock = asyncio.Lock()
+
+    async def _async_load(self) -> dict[str, list[Any]]:
+        """Return the stored snapshots, loading them on first use."""
+        if self._snapshots is None:
+            self._snapshots = await self._store.async_load() or {}
+        return self._snapshots
+
+    async def async_names(self) -> list[str]:
+        """Return the names of the stored snapshots."""
+        async with self._lock:
+            return sorted(await self._async_load())
+
+    async def async_save(self, name: str) -> dict[str, Any]:
+        """
+        Capture the current picture as a named snapshot.
+
+        Returns:
+            The captured settings
+
+        Raises:
+            BarcoStateError: If the projector is not on
+            BarcoConnectionError: If connection fails
+
+        """
+        values = await self.device.get_properties(list(PICTURE_PROPERTIES.values()))
+        snapshot = {key: values.get(prop) for key, prop in PICTURE_PROPERTIES.items()}
+        snapshot["profile"] = self.device.active_profile
+        async with self._lock:
+            snapshots = await self._async_load()
+            snapshots[name] = list(snapshot.values())
+            await self._store.async_save(snapshots)
+        _LOGGER.debug("Saved picture snapshot %s: %s", name, snapshot)
+        return snapshot
+
+    async def async_restore(self, name: str) -> dict[str, Any] | None:
+        """
+        Restore a named snapshot.
+
+        Returns:
+            The settings written and those the projector rejected (setting ->
+            error), or None if there is no snapshot of that name
+
+        Raises:
+            BarcoConnectionError: If connection fails
+
+        """
+        async with self._lock:
+            stored = (await self._async_load()).get(name)
+        if stored is None:
+            return None
+        *values, profile = stored
+        targets = {
+            prop: value
+            for prop, value in zip(PICTURE_PROPERTIES.values(), values, strict=True)
+            if value is not None
+        }
+        failed: dict[str, Exception] = {}
+        if profile is not None:
+            # The profile rewrites the picture: apply it before comparing
+            try:
+                await self.device.activate_profile(profile)
+            except (BarcoApiError, BarcoStateError) as err:
+                failed["profile"] = err
+        if targets:
+            # Only write what differs from the projector. Not on yet: write
+            # everything once it is (the writes are held while powering on)
+            try:
+                current = await self.device.get_properties(list(targets))
+            except BarcoStateError:
+                current = {}
+            targets = {
+                prop: value
+                for prop, value in targets.items()
+                if _differs(current.get(prop), value)
+            }
+        if targets:
+            failed |= await self.device.set_properties(targets)
+
+        keys = {prop: key for key, prop in PICTURE_PROPERTIES.items()}
+        written = (["profile"] if profile else []) + [keys[prop] for prop in targets]
+        _LOGGER.debug("Restored picture snapshot %s: %s", name, written)
+        return {
+            "changed": [
+                key for key in written if PICTURE_PROPERTIES.get(key, key) not in failed
+            ],
+            "failed": {
+                keys.get(prop, prop): str(error) for prop, error in failed.items()
+            },
+        }
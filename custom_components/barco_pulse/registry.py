@@ -0,0 +1,183 @@
+"""Shared connection registry for Barco Pulse integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+
+from .api import BarcoDevice
+from .const import DATA_CONNECTIONS, DEFAULT_TIMEOUT, DOMAIN, SESSION_IDLE_TIMEOUT
+from .exceptions import BarcoConnectionError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import Event, HomeAssistant
+
+    from .transport import ConnectionFactory
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class _Session:
+    """Shared projector session with reference count."""
+
+    device: BarcoDevice
+    refcount: int = 0
+    cancel_idle_close: Callable[[], None] | None = None
+
+
+class BarcoConnectionRegistry:
+    """
+    Hand out refcounted, already-authenticated projector sessions.
+
+    Sessions are keyed by host:port so the config flow, reconfigure flow and
+    runtime share one TCP connection per projector. When the last user releases
+    a session it stays open for SESSION_IDLE_TIMEOUT seconds, so entry reloads
+    and a setup following the config flow reuse the warm connection instead of
+    paying TCP + authentication latency again.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the registry."""
+        self.hass = hass
+        self._sessions: dict[str, _Session] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    @staticmethod
+    def _key(host: str, port: int) -> str:
+        """Return the registry key for a projector."""
+        return f"{host}:{port}"
+
+    async def async_acquire(
+        self,
+        host: str,
+        port: int,
+        auth_code: str | None = None,
+        connection_factory: ConnectionFactory | None = None,
+        *,
+        connect: bool = True,
+    ) -> BarcoDevice:
+        """
+        Return a connected, authenticated session for host:port.
+
+        Args:
+            host: Projector IP address or hostname
+            port: TCP port
+            auth_code: Optional 5-digit authentication code
+            connection_factory: Transport factory of the session; replaces that
+                of a shared session (reconnecting it if it differs). None keeps
+                a shared session's factory, or uses a plain TCP socket
+            connect: Connect now; when False the session connects lazily on
+                its first request
+
+        Raises:
+            BarcoConnectionError: If the connection cannot be established
+            BarcoAuthError: If authentication fails
+
+        """
+        key = self._key(host, port)
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            session = self._sessions.get(key)
+            if session is None:
+                session = _Session(
+                    BarcoDevice(
+                        host=host,
+                        port=port,
+                        auth_code=auth_code,
+                        timeout=DEFAULT_TIMEOUT,
+                        connection_factory=connection_factory,
+                    )
+                )
+            else:
+                if session.device.auth_code != auth_code:
+                    # Credentials changed (e.g. reconfigure); re-authenticate
+                    if auth_code and session.device.is_connected:
+                        await session.device.authenticate(auth_code)
+                    session.device.auth_code = auth_code
+                if connection_factory is not None:
+                    # Session recording switched on or off (entry reload)
+                    await session.device.set_connection_factory(connection_factory)
+
+            if session.cancel_idle_close:
+                session.cancel_idle_close()
+                session.cancel_idle_close = None
+
+            if connect:
+                await session.device.connect()
+
+            session.refcount += 1
+            self._sessions[key] = session
+            _LOGGER.debug("Acquired session %s (refs: %d)", key, session.refcount)
+            return session.device
+
+    async def async_release(self, device: BarcoDevice) -> None:
+        """Release a session; it is closed after an idle grace period."""
+        key = self._key(device.host, device.port)
+        session = self._sessions.get(key)
+        if session is None or session.device is not device:
+            await device.disconnect()
+            return
+
+        session.refcount = max(0, session.refcount - 1)
+        _LOGGER.debug("Released session %s (refs: %d)", key, session.refcount)
+        if session.refcount == 0 and session.cancel_idle_close is None:
+
+            @callback
+            def _async_idle_close(_now: object) -> None:
+                session.cancel_idle_close = None
+                self.hass.async_create_task(
+                    self._async_close_if_idle(key, session),
+                    f"{DOMAIN}_close_idle_session",
+                )
+
+            session.cancel_idle_close = async_call_later(
+                self.hass, SESSION_IDLE_TIMEOUT, _async_idle_close
+            )
+
+    async def _async_close_if_idle(self, key: str, session: _Session) -> None:
+        """Close a session that has not been re-acquired."""
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            if session.refcount or self._sessions.get(key) is not session:
+                return
+            del self._sessions[key]
+            await self._async_disconnect(session.device)
+
+    async def async_close_all(self) -> None:
+        """Close every session (Home Assistant shutdown)."""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            if session.cancel_idle_close:
+                session.cancel_idle_close()
+            await self._async_disconnect(session.device)
+
+    @staticmethod
+    async def _async_disconnect(device: BarcoDevice) -> None:
+        """Disconnect a device, ignoring connection errors."""
+        try:
+            await device.disconnect()
+        except (BarcoConnectionError, OSError) as err:
+            _LOGGER.debug("Error closing session: %s", err)
+
+
+@callback
+def async_get_registry(hass: HomeAssistant) -> BarcoConnectionRegistry:
+    """Return the shared connection registry, creating it on first use."""
+    domain_data: dict = hass.data.setdefault(DOMAIN, {})
+    registry: BarcoConnectionRegistry | None = domain_data.get(DATA_CONNECTIONS)
+    if registry is None:
+        registry = domain_data[DATA_CONNECTIONS] = BarcoConnectionRegistry(hass)
+
+        async def _async_close_all(_event: Event) -> None:
+            await registry.async_close_all()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close_all)
+    return registry
@@ -2,22 +2,46 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from itertools import groupby
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.components.remote import RemoteEntity
+from homeassistant.components.remote import (
+    ATTR_DELAY_SECS,
+    ATTR_HOLD_SECS,
+    ATTR_NUM_REPEATS,
+    DEFAULT_DELAY_SECS,
+    DEFAULT_HOLD_SECS,
+    DEFAULT_NUM_REPEATS,
+    RemoteEntity,
+)
+from homeassistant.exceptions import HomeAssistantError
 
-from .const import ACTIVE_STATES, PowerState
+from .commands import GROUP_PROFILE, GROUP_SOURCE, collapse_ops, compile_command
+from .const import (
+    ACTIVE_STATES,
+    DEFAULT_KEY_REPEAT_DELAY,
+    DEFAULT_KEY_REPEAT_INTERVAL,
+    PowerState,
+)
 from .entity import BarcoEntity, BarcoPowerMixin
-from .helpers import handle_api_errors, parse_preset_command, safe_refresh
+from .exceptions import (
+    BarcoApiError,
+    BarcoConnectionError,
+    BarcoError,
+    BarcoStateError,
+)
+from .helpers import safe_refresh
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .commands import RemoteOp
     from .coordinator import BarcoDataUpdateCoordinator
     from .data import BarcoRuntimeData
 
@@ -33,6 +57,7 @@ class BarcoRemote(BarcoPowerMixin, BarcoEntity, RemoteEntity):
         """Initialize the remote."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.unique_id}_remote"
+        self._repeat_timing: tuple[float, float] | None = None
 
     @property
     def is_on(self) -> bool:
@@ -43,59 +68,224 @@ class BarcoRemote(BarcoPowerMixin, BarcoEntity, RemoteEntity):
         except (ValueError, TypeError):
             return False
 
-    @handle_api_errors
-    async def _execute_command(self, cmd: str) -> None:
-        """Execute a single command with validation and error handling."""
-        if cmd.startswith("source_"):
-            # Extract source name (e.g., "source_HDMI 1" -> "HDMI 1")
-            source_name = cmd[7:]
-            if not source_name:
-                _LOGGER.warning("Empty source name in command: %s", cmd)
-                return
-            await self.coordinator.device.set_source(source_name)
-
-        elif cmd.startswith("preset_"):
-            # Parse preset command (e.g., "preset_5" -> 5)
-            preset_num = parse_preset_command(cmd)
-
-            if preset_num is None:
-                _LOGGER.warning("Invalid preset command: %s", cmd)
-                return
-
-            await self.coordinator.device.activate_preset(preset_num)
-
-        elif cmd.startswith("profile_"):
-            # Extract profile name (e.g., "profile_Cinema" -> "Cinema")
-            profile_name = cmd[8:]
-            if not profile_name:
-                _LOGGER.warning("Empty profile name in command: %s", cmd)
-                return
-            await self.coordinator.device.activate_profile(profile_name)
-
-        else:
-            _LOGGER.warning("Unknown command format: %s", cmd)
-
-    async def async_send_command(self, command: Iterable[str], **_kwargs: Any) -> None:
+    async def _get_repeat_timing(self) -> tuple[float, float]:
+        """Return the projector's key repeat delay and interval (read once)."""
+        if self._repeat_timing is None:
+            try:
+                self._repeat_timing = (
+                    await self.coordinator.device.get_key_repeat_timing()
+                )
+            except (
+                BarcoApiError,
+                BarcoConnectionError,
+                BarcoStateError,
+                KeyError,
+                TypeError,
+                ValueError,
+            ) as err:
+                _LOGGER.debug("Using default key repeat timing: %s", err)
+                return DEFAULT_KEY_REPEAT_DELAY, DEFAULT_KEY_REPEAT_INTERVAL
+        return self._repeat_timing
+
+    async def _send_key(self, key: str, num_repeats: int, hold_secs: float) -> None:
+        """
+        Press a key, stream repeats at the native repeat rate, and release it.
+
+        Repeats are paced against absolute deadlines so request round trips
+        don't stretch the interval, and RELEASE is always sent so a key never
+        stays held on the projector.
+
+        Args:
+            key: Key name for keydispatcher.postevent
+            num_repeats: Number of key presses (extra presses become REPEATs)
+            hold_secs: Seconds to hold the key (auto-repeat after the delay)
+
+        """
+        device = self.coordinator.device
+        repeat_delay, repeat_interval = await self._get_repeat_timing()
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await device.post_key_event(key, "PRESS")
+        try:
+            # Explicit repeats follow each other at the repeat interval
+            deadline = start
+            for _ in range(num_repeats - 1):
+                deadline += repeat_interval
+                await asyncio.sleep(max(0.0, deadline - loop.time()))
+                await device.post_key_event(key, "REPEAT")
+
+            # Holding behaves like the physical key: delay, then auto-repeat
+            if hold_secs > 0:
+                release_at = start + hold_secs
+                deadline = max(deadline, start + repeat_delay)
+                while deadline < release_at:
+                    await asyncio.sleep(max(0.0, deadline - loop.time()))
+                    await device.post_key_event(key, "REPEAT")
+                    deadline += repeat_interval
+                await asyncio.sleep(max(0.0, release_at - loop.time()))
+        finally:
+            await device.post_key_event(key, "RELEASE")
+
+    async def async_send_command(self, command: Iterable[str], **kwargs: Any) -> None:
         """
-        Send a command to the projector with validation and error handling.
+        Send commands to the projector as a compiled pipeline.
 
         Supported command formats:
         - source_<name>: Switch to input source (e.g., "source_HDMI 1")
         - preset_<number>: Activate preset by number (e.g., "preset_5")
         - profile_<name>: Activate profile by name (e.g., "profile_Cinema")
+        - <key>: Remote/keypad key (e.g., "menu", "RC_ZOOM_PLUS", "KP_OK");
+          num_repeats and hold_secs repeat it at the projector's native
+          repeat rate, delay_secs separates consecutive key presses
+
+        Adjacent commands setting the same state collapse to the last one, and
+        everything not separated by a key delay or a held key is sent as one
+        JSON-RPC batch. Every command runs even if an earlier one fails; the
+        failures are reported together afterwards.
         """
-        commands_executed = 0
+        num_repeats = int(kwargs.get(ATTR_NUM_REPEATS, DEFAULT_NUM_REPEATS))
+        delay_secs = float(kwargs.get(ATTR_DELAY_SECS, DEFAULT_DELAY_SECS))
+        hold_secs = float(kwargs.get(ATTR_HOLD_SECS, DEFAULT_HOLD_SECS))
+
+        failures: list[str] = []
+        ops: list[RemoteOp] = []
         for cmd in command:
-            if not isinstance(cmd, str):
-                _LOGGER.warning("Invalid command type: %s (expected str)", type(cmd))
+            op = compile_command(cmd) if isinstance(cmd, str) else None
+            if op is None:
+                _LOGGER.warning("Unknown command format: %s", cmd)
+                failures.append(f"{cmd}: unknown command")
+            else:
+                ops.append(op)
+        ops, superseded = collapse_ops(ops)
+        for op in superseded:
+            _LOGGER.debug("Command %s superseded by a later command", op.command)
+
+        streamed = num_repeats > 1 or hold_secs > 0
+        stage: list[RemoteOp] = []
+        executed: list[RemoteOp] = []
+        for op in ops:
+            if op.key is not None and streamed:
+                # Repeats/holds are timed; they run on their own
+                executed += await self._run_stage(stage, failures)
+                stage = []
+                if executed and delay_secs > 0:
+                    await asyncio.sleep(delay_secs)
+                try:
+                    await self._send_key(op.key, num_repeats, hold_secs)
+                except BarcoError as err:
+                    failures.append(f"{op.command}: {err}")
+                else:
+                    executed.append(op)
                 continue
+            if op.key is not None and delay_secs > 0 and any(o.key for o in stage):
+                # Give the OSD time to follow between key presses
+                executed += await self._run_stage(stage, failures)
+                stage = []
+                await asyncio.sleep(delay_secs)
+            stage.append(op)
+        executed += await self._run_stage(stage, failures)
+
+        # Only refresh once, and only if state the coordinator polls changed
+        refreshes = sum(op.refresh for op in executed)
+        if refreshes:
+            await safe_refresh(self.coordinator, f"{refreshes} command(s)")
+
+        if failures:
+            msg = f"Remote command(s) failed: {'; '.join(failures)}"
+            raise HomeAssistantError(msg)
+
+    async def _run_stage(
+        self, ops: list[RemoteOp], failures: list[str]
+    ) -> list[RemoteOp]:
+        """
+        Send ops in as few JSON-RPC batches as possible; record results.
+
+        Runs of key presses and of state ops are sent as separate batches,
+        the latter held while the projector powers on; presets and profiles
+        are sent on their own (see RemoteOp.barrier).
+
+        Args:
+            ops: Ops to send together
+            failures: Receives a description of every failed command
+
+        Returns:
+            Ops that succeeded
+
+        """
+        if not ops:
+            return []
+        device = self.coordinator.device
+        latency = self.coordinator.command_latency
+        for op in ops:
+            if op.group == GROUP_SOURCE:
+                latency.start("source", op.params["value"])
+
+        results = await self._send_ops(ops)
+
+        succeeded: list[RemoteOp] = []
+        for op, result in zip(ops, results, strict=True):
+            if isinstance(result, BarcoError):
+                _LOGGER.debug("Command %s failed: %s", op.command, result)
+                failures.append(f"{op.command}: {result}")
+                if op.group == GROUP_SOURCE:
+                    latency.cancel("source")
+            else:
+                _LOGGER.debug("Command %s succeeded: %s", op.command, result)
+                succeeded.append(op)
+
+        # Reads issued before the batch may hold the old values
+        profiles = [op for op in succeeded if op.group == GROUP_PROFILE]
+        if profiles:
+            device.invalidate_cache()
+            # A preset activates whichever profile is assigned to it
+            last = profiles[-1]
+            device.active_profile = (
+                last.params if last.method == "profile.activateprofile" else None
+            )
+        elif any(op.group == GROUP_SOURCE for op in succeeded):
+            device.invalidate_cache(["image.window.main.source"])
+        return succeeded
+
+    async def _send_ops(self, ops: list[RemoteOp]) -> list[Any]:
+        """Send ops in order; return per op its result or the error it failed with."""
+        device = self.coordinator.device
+        results: list[Any] = []
+        for is_key, run in _batches(ops):
+            calls = [(op.method, op.params) for op in run]
+            try:
+                if is_key:
+                    results += await device.send_batch(calls)
+                else:
+                    # Source/preset/profile changes wait for the projector
+                    results += await device.send_batch_when_ready(calls)
+            except BarcoError as err:
+                results += [err] * len(run)
+        return results
+
+
+def _batches(ops: list[RemoteOp]) -> Iterator[tuple[bool, list[RemoteOp]]]:
+    """
+    Split ops into batches sent one after another, in order.
+
+    Consecutive ops of one kind (key presses or state ops) share a batch;
+    a barrier op is a batch of its own.
 
-            await self._execute_command(cmd)
-            commands_executed += 1
+    Yields:
+        (is_key, ops) per batch
 
-        # Only refresh once after all commands are executed
-        if commands_executed > 0:
-            await safe_refresh(self.coordinator, f"{commands_executed} command(s)")
+    """
+    for is_key, group in groupby(ops, key=lambda op: op.key is not None):
+        batch: list[RemoteOp] = []
+        for op in group:
+            if op.barrier:
+                if batch:
+                    yield is_key, batch
+                    batch = []
+                yield is_key, [op]
+            else:
+                batch.append(op)
+        if batch:
+            yield is_key, batch
 
 
 async def async_setup_entry(
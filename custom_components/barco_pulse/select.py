@@ -6,9 +6,11 @@ import logging
 from typing import TYPE_CHECKING
 
 from homeassistant.components.select import SelectEntity
+from homeassistant.exceptions import HomeAssistantError
 
 from .const import PRESET_MAX_NUMBER, PowerState
-from .entity import BarcoEntity
+from .entity import BarcoEntity, BarcoGroupEntity
+from .group import is_group_entry
 from .helpers import (
     format_preset_display,
     handle_api_errors,
@@ -22,7 +24,8 @@ if TYPE_CHECKING:
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .coordinator import BarcoDataUpdateCoordinator
-    from .data import BarcoRuntimeData
+    from .data import BarcoGroupRuntimeData, BarcoRuntimeData
+    from .group import BarcoGroupController
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -62,9 +65,12 @@ class BarcoSourceSelect(BarcoEntity, SelectEntity):
             _LOGGER.error("%s validation failed: %s", method_name, msg)
             raise ValueError(msg)
 
-        # Call the device method
+        # Call the device method, timing until the new value is reported
         method = getattr(self.coordinator.device, method_name)
-        await method(option)
+        with self.coordinator.command_latency.track(
+            method_name.removeprefix("set_"), option
+        ):
+            await method(option)
 
         # Request refresh
         await safe_refresh(self.coordinator, method_name)
@@ -178,12 +184,138 @@ class BarcoProfileSelect(BarcoEntity, SelectEntity):
         await safe_refresh(self.coordinator, "activate_profile")
 
 
+class BarcoGroupSelect(BarcoGroupEntity, SelectEntity):
+    """Base class for projector group selects."""
+
+    def common_options(self, key: str) -> list[str]:
+        """Return the list entries all members share, in the first's order."""
+        lists = self.member_values(key)
+        if not lists:
+            return []
+        shared = set(lists[0]).intersection(*lists[1:])
+        return [option for option in lists[0] if option in shared]
+
+    def _validate_option(self, option: str) -> None:
+        """Reject options not offered by every member."""
+        if option not in self.options:
+            msg = f"Invalid option for all group members: {option}"
+            raise HomeAssistantError(msg)
+
+
+class BarcoGroupSourceSelect(BarcoGroupSelect):
+    """Source select of a projector group."""
+
+    _attr_translation_key = "source"
+    _attr_icon = "mdi:video-input-hdmi"
+
+    def __init__(self, controller: BarcoGroupController) -> None:
+        """Initialize the group source select."""
+        super().__init__(controller, "source")
+
+    @property
+    def current_option(self) -> str | None:
+        """Return the source if all members show the same one."""
+        sources = set(self.member_values("source"))
+        return sources.pop() if len(sources) == 1 else None
+
+    @property
+    def options(self) -> list[str]:
+        """Return the sources available on every member."""
+        return self.common_options("available_sources") or ["Unknown"]
+
+    async def async_select_option(self, option: str) -> None:
+        """Switch all members to a source."""
+        self._validate_option(option)
+        await self.controller.async_fan_out(
+            "set_source", lambda data: data.client.set_source(option)
+        )
+
+
+class BarcoGroupPresetSelect(BarcoGroupSelect):
+    """Preset select of a projector group."""
+
+    _attr_translation_key = "preset"
+    _attr_icon = "mdi:palette"
+    _attr_current_option = None
+
+    def __init__(self, controller: BarcoGroupController) -> None:
+        """Initialize the group preset select."""
+        super().__init__(controller, "preset")
+
+    @property
+    def options(self) -> list[str]:
+        """Return the list of available presets."""
+        return [format_preset_display(num) for num in range(PRESET_MAX_NUMBER + 1)]
+
+    @property
+    def available(self) -> bool:
+        """Return if any member is powered on."""
+        return any(
+            state in (PowerState.ON, PowerState.READY)
+            for state in self.member_values("state")
+        )
+
+    async def async_select_option(self, option: str) -> None:
+        """Activate a preset on all members."""
+        preset_num = parse_preset_display(option)
+        if preset_num is None:
+            msg = f"Invalid preset option: {option}"
+            raise HomeAssistantError(msg)
+        await self.controller.async_fan_out(
+            "activate_preset", lambda data: data.client.activate_preset(preset_num)
+        )
+
+
+class BarcoGroupProfileSelect(BarcoGroupSelect):
+    """Profile select of a projector group."""
+
+    _attr_translation_key = "profile"
+    _attr_icon = "mdi:image-filter-hdr"
+    _attr_current_option = None
+
+    def __init__(self, controller: BarcoGroupController) -> None:
+        """Initialize the group profile select."""
+        super().__init__(controller, "profile")
+
+    @property
+    def options(self) -> list[str]:
+        """Return the profiles configured on every member."""
+        return self.common_options("profiles") or ["No profiles configured"]
+
+    @property
+    def available(self) -> bool:
+        """Return if any member is powered on."""
+        return any(
+            state in (PowerState.ON, PowerState.READY)
+            for state in self.member_values("state")
+        )
+
+    async def async_select_option(self, option: str) -> None:
+        """Activate a profile on all members."""
+        self._validate_option(option)
+        await self.controller.async_fan_out(
+            "activate_profile", lambda data: data.client.activate_profile(option)
+        )
+
+
 async def async_setup_entry(
     _hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Barco Pulse select from a config entry."""
+    if is_group_entry(entry):
+        group_data: BarcoGroupRuntimeData = entry.runtime_data
+        controller = group_data.controller
+        async_add_entities(
+            [
+                BarcoGroupSourceSelect(controller),
+                BarcoGroupPresetSelect(controller),
+                BarcoGroupProfileSelect(controller),
+            ]
+        )
+        return
+
     runtime_data: BarcoRuntimeData = entry.runtime_data
     coordinator = runtime_data.coordinator
 
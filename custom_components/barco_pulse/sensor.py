@@ -5,10 +5,29 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import (
+    PERCENTAGE,
+    REVOLUTIONS_PER_MINUTE,
+    UnitOfElectricPotential,
+    UnitOfFrequency,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+from homeassistant.core import callback
 from homeassistant.helpers.entity import EntityCategory
 
-from .entity import BarcoEntity
+from .entity import (
+    BarcoConnectorEntity,
+    BarcoCounterEntity,
+    BarcoEntity,
+    BarcoTelemetryEntity,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -17,8 +36,12 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .connectors import BarcoConnectorMonitor
     from .coordinator import BarcoDataUpdateCoordinator
+    from .counters import BarcoCounterCoordinator
     from .data import BarcoRuntimeData
+    from .notifications import BarcoNotificationManager
+    from .telemetry import BarcoTelemetryCoordinator
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -73,6 +96,36 @@ SENSORS: tuple[BarcoSensorEntityDescription, ...] = (
 )
 
 
+# Environment value type -> (device class, unit, icon)
+ENVIRONMENT_SENSOR_TYPES: dict[str, tuple[SensorDeviceClass | None, str, str]] = {
+    "Temperature": (
+        SensorDeviceClass.TEMPERATURE,
+        UnitOfTemperature.CELSIUS,
+        "mdi:thermometer",
+    ),
+    "Speed": (None, REVOLUTIONS_PER_MINUTE, "mdi:fan"),
+    "PWM": (None, PERCENTAGE, "mdi:fan-chevron-up"),
+    "Voltage": (SensorDeviceClass.VOLTAGE, UnitOfElectricPotential.VOLT, "mdi:flash"),
+}
+
+
+# statistics.*.getunit value -> native unit of the counter sensor
+COUNTER_UNITS: dict[str, str] = {
+    "hours": UnitOfTime.HOURS,
+    "minutes": UnitOfTime.MINUTES,
+    "seconds": UnitOfTime.SECONDS,
+}
+
+# Counters shown by default and with a derived usage-per-day sensor
+PRIMARY_COUNTERS = ("laserruntime", "projectorruntime")
+
+
+def _environment_sensor_name(block: str) -> str:
+    """Return a display name for an environment block (e.g. 'Fan Psu Tacho')."""
+    parts = block.removeprefix("environment.").split(".")
+    return " ".join(part.replace("_", " ").capitalize() for part in parts)
+
+
 class BarcoSensor(BarcoEntity, SensorEntity):
     """Barco Pulse sensor entity."""
 
@@ -95,6 +148,266 @@ class BarcoSensor(BarcoEntity, SensorEntity):
         return self.entity_description.value_fn(self.coordinator.data)
 
 
+class BarcoCommandLatencySensor(BarcoEntity, SensorEntity):
+    """Command-to-confirmation latency (p95) with per-command percentiles."""
+
+    _attr_translation_key = "command_latency"
+    _attr_icon = "mdi:timer-outline"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+
+    def __init__(self, coordinator: BarcoDataUpdateCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.unique_id}_command_latency"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the p95 latency across all command types."""
+        return self.coordinator.command_latency.overall_percentile(95)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return rolling percentiles per command type."""
+        return self.coordinator.command_latency.summary()
+
+
+class BarcoNotificationCountSensor(BarcoEntity, SensorEntity):
+    """Number of active projector notifications."""
+
+    _attr_translation_key = "notification_count"
+    _attr_icon = "mdi:bell-alert-outline"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: BarcoDataUpdateCoordinator,
+        notifications: BarcoNotificationManager,
+    ) -> None:
+        """Initialize the notification count sensor."""
+        super().__init__(coordinator)
+        self._notifications = notifications
+        self._attr_unique_id = f"{coordinator.unique_id}_notification_count"
+
+    async def async_added_to_hass(self) -> None:
+        """Listen for notification changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._notifications.async_add_listener(self.async_write_ha_state)
+        )
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of active notifications."""
+        return len(self._notifications.active)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return active notification counts per severity."""
+        counts: dict[str, int] = {}
+        for item in self._notifications.active.values():
+            severity = str(item.get("severity", "unknown")).lower()
+            counts[severity] = counts.get(severity, 0) + 1
+        return counts
+
+
+class BarcoEnvironmentSensor(BarcoTelemetryEntity, SensorEntity):
+    """Environment sensor discovered via environment.getcontrolblocks."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self, coordinator: BarcoTelemetryCoordinator, value_type: str, block: str
+    ) -> None:
+        """Initialize the environment sensor."""
+        super().__init__(coordinator)
+        self._value_type = value_type
+        self._position = coordinator.data[value_type].index[block]
+        device_class, unit, icon = ENVIRONMENT_SENSOR_TYPES.get(
+            value_type, (None, "", "mdi:gauge")
+        )
+        self._attr_device_class = device_class
+        self._attr_native_unit_of_measurement = unit or None
+        self._attr_icon = icon
+        self._attr_name = _environment_sensor_name(block)
+        self._attr_unique_id = f"{coordinator.coordinator.unique_id}_{block}"
+        # Laser bank/heatsink sensors are numerous; opt-in per sensor
+        self._attr_entity_registry_enabled_default = not block.startswith(
+            "environment.laser."
+        )
+
+        self._published_available: bool | None = None
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the last published reading."""
+        return self.coordinator.data[self._value_type].value(self._position)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if the reading passed the deadband filter."""
+        if (
+            self._position in self.coordinator.published.get(self._value_type, ())
+            or self.available != self._published_available
+        ):
+            self._published_available = self.available
+            self.async_write_ha_state()
+
+
+class BarcoCounterSensor(BarcoCounterEntity, SensorEntity):
+    """Statistics counter (runtime hours, uptime, ...) sensor."""
+
+    def __init__(self, coordinator: BarcoCounterCoordinator, counter: str) -> None:
+        """Initialize the counter sensor."""
+        super().__init__(coordinator)
+        self._counter = counter
+        info = coordinator.info[counter]
+        self._attr_name = info.name
+        self._attr_unique_id = (
+            f"{coordinator.coordinator.unique_id}_statistics_{counter}"
+        )
+        if info.unit in COUNTER_UNITS:
+            self._attr_device_class = SensorDeviceClass.DURATION
+            self._attr_native_unit_of_measurement = COUNTER_UNITS[info.unit]
+            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+            self._attr_icon = "mdi:timer-outline"
+        elif info.unit == "percent":
+            self._attr_native_unit_of_measurement = PERCENTAGE
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+        else:
+            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+            self._attr_icon = "mdi:counter"
+        if counter not in PRIMARY_COUNTERS:
+            self._attr_entity_category = EntityCategory.DIAGNOSTIC
+            # Per laser bank counters are numerous; opt-in per sensor
+            self._attr_entity_registry_enabled_default = "plate" not in counter
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the counter value."""
+        return (self.coordinator.data or {}).get(self._counter)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the derived usage rate."""
+        rate = self.coordinator.rates.get(self._counter)
+        return None if rate is None else {"hours_per_day": rate}
+
+
+class BarcoCounterRateSensor(BarcoCounterEntity, SensorEntity):
+    """Average daily usage derived from a runtime counter."""
+
+    _attr_icon = "mdi:chart-timeline-variant"
+    _attr_native_unit_of_measurement = "h/d"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_translation_key = "counter_rate"
+
+    def __init__(self, coordinator: BarcoCounterCoordinator, counter: str) -> None:
+        """Initialize the usage rate sensor."""
+        super().__init__(coordinator)
+        self._counter = counter
+        self._attr_translation_placeholders = {
+            "counter": coordinator.info[counter].name
+        }
+        self._attr_unique_id = (
+            f"{coordinator.coordinator.unique_id}_statistics_{counter}_rate"
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        """Return average hours per day over the trailing week."""
+        return self.coordinator.rates.get(self._counter)
+
+
+class BarcoConnectorResolutionSensor(BarcoConnectorEntity, SensorEntity):
+    """Resolution of the signal detected on an input connector."""
+
+    _attr_icon = "mdi:monitor-screenshot"
+    _attr_translation_key = "connector_resolution"
+
+    def __init__(
+        self,
+        coordinator: BarcoDataUpdateCoordinator,
+        connectors: BarcoConnectorMonitor,
+        connector: str,
+    ) -> None:
+        """Initialize the connector resolution sensor."""
+        super().__init__(coordinator, connectors, connector)
+        self._attr_unique_id = (
+            f"{coordinator.unique_id}_connector_{connector}_resolution"
+        )
+
+    @property
+    def native_value(self) -> str | None:
+        """Return the resolution (e.g. 3840x2160), None without signal."""
+        signal = self.signal
+        width = signal.get("horizontal_resolution")
+        height = signal.get("vertical_resolution")
+        if not signal.get("active") or not width or not height:
+            return None
+        return f"{width}x{height}"
+
+
+class BarcoConnectorFrequencySensor(BarcoConnectorEntity, SensorEntity):
+    """Vertical frequency of the signal detected on an input connector."""
+
+    _attr_device_class = SensorDeviceClass.FREQUENCY
+    _attr_native_unit_of_measurement = UnitOfFrequency.HERTZ
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 2
+    _attr_translation_key = "connector_frame_rate"
+
+    def __init__(
+        self,
+        coordinator: BarcoDataUpdateCoordinator,
+        connectors: BarcoConnectorMonitor,
+        connector: str,
+    ) -> None:
+        """Initialize the connector frequency sensor."""
+        super().__init__(coordinator, connectors, connector)
+        self._attr_unique_id = (
+            f"{coordinator.unique_id}_connector_{connector}_vertical_frequency"
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the vertical frequency, None without signal."""
+        if not self.signal.get("active"):
+            return None
+        try:
+            return float(self.signal["vertical_frequency"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+
+class BarcoConnectorGammaSensor(BarcoConnectorEntity, SensorEntity):
+    """Gamma (SDR/HDR transfer) type of the signal on an input connector."""
+
+    _attr_icon = "mdi:hdr"
+    _attr_translation_key = "connector_gamma"
+
+    def __init__(
+        self,
+        coordinator: BarcoDataUpdateCoordinator,
+        connectors: BarcoConnectorMonitor,
+        connector: str,
+    ) -> None:
+        """Initialize the connector gamma type sensor."""
+        super().__init__(coordinator, connectors, connector)
+        self._attr_unique_id = f"{coordinator.unique_id}_connector_{connector}_gamma"
+
+    @property
+    def native_value(self) -> str | None:
+        """Return the gamma type (e.g. PQ, HLG), None without signal."""
+        if not self.signal.get("active"):
+            return None
+        gamma_type = self.signal.get("gamma_type")
+        return str(gamma_type) if gamma_type else None
+
+
 async def async_setup_entry(
     _hass: HomeAssistant,
     entry: ConfigEntry,
@@ -104,6 +417,81 @@ async def async_setup_entry(
     runtime_data: BarcoRuntimeData = entry.runtime_data
     coordinator = runtime_data.coordinator
 
-    entities = [BarcoSensor(coordinator, description) for description in SENSORS]
+    entities: list[SensorEntity] = [
+        BarcoSensor(coordinator, description) for description in SENSORS
+    ]
+    entities.append(BarcoCommandLatencySensor(coordinator))
+    entities.append(
+        BarcoNotificationCountSensor(coordinator, runtime_data.notifications)
+    )
 
     async_add_entities(entities)
+
+    # Environment sensors are created as the telemetry sampler discovers them
+    telemetry = runtime_data.telemetry
+    known_blocks: set[str] = set()
+
+    @callback
+    def _async_add_environment_sensors() -> None:
+        """Add sensors for newly discovered environment blocks."""
+        new_entities = []
+        for value_type, columns in (telemetry.data or {}).items():
+            for block in columns.names:
+                if block not in known_blocks:
+                    known_blocks.add(block)
+                    new_entities.append(
+                        BarcoEnvironmentSensor(telemetry, value_type, block)
+                    )
+        if new_entities:
+            async_add_entities(new_entities)
+
+    _async_add_environment_sensors()
+    entry.async_on_unload(telemetry.async_add_listener(_async_add_environment_sensors))
+
+    # Counter sensors come from the persisted counter list, or are added once
+    # the first sample has discovered it
+    counters = runtime_data.counters
+    known_counters: set[str] = set()
+
+    @callback
+    def _async_add_counter_sensors() -> None:
+        """Add sensors for newly discovered statistics counters."""
+        new_entities: list[SensorEntity] = []
+        for counter in counters.info:
+            if counter in known_counters:
+                continue
+            known_counters.add(counter)
+            new_entities.append(BarcoCounterSensor(counters, counter))
+            if counter in PRIMARY_COUNTERS:
+                new_entities.append(BarcoCounterRateSensor(counters, counter))
+        if new_entities:
+            async_add_entities(new_entities)
+
+    _async_add_counter_sensors()
+    entry.async_on_unload(counters.async_add_listener(_async_add_counter_sensors))
+
+    # Connector sensors are added once the connector list has been read
+    connectors = runtime_data.connectors
+    known_connectors: set[str] = set()
+
+    @callback
+    def _async_add_connector_sensors() -> None:
+        """Add signal format sensors for newly listed connectors."""
+        new_entities: list[SensorEntity] = []
+        for connector in connectors.connectors:
+            if connector in known_connectors:
+                continue
+            known_connectors.add(connector)
+            new_entities.extend(
+                sensor_class(coordinator, connectors, connector)
+                for sensor_class in (
+                    BarcoConnectorResolutionSensor,
+                    BarcoConnectorFrequencySensor,
+                    BarcoConnectorGammaSensor,
+                )
+            )
+        if new_entities:
+            async_add_entities(new_entities)
+
+    _async_add_connector_sensors()
+    entry.async_on_unload(connectors.async_add_listener(_async_add_connector_sensors))
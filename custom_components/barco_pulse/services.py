@@ -0,0 +1,471 @@
+"""Services for Barco Pulse integration."""
+
+from __future__ import annotations
+
+import re
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, EVENT_FILE_TRANSFER, LOG_DIRECTORY, LOG_KEEP_ARCHIVES
+from .exceptions import BarcoError, BarcoStateError
+from .files import (
+    UPLOAD_ENDPOINTS,
+    async_download_file,
+    async_upload_file,
+    file_endpoint_url,
+)
+from .group import is_group_entry
+from .logs import (
+    LOG_ENDPOINTS,
+    LOG_SEVERITIES,
+    build_index,
+    latest_archive,
+    parse_severity,
+    prune_archives,
+    query_index,
+)
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+
+SERVICE_GET_TELEMETRY_HISTORY = "get_telemetry_history"
+SERVICE_UPLOAD_FILE = "upload_file"
+SERVICE_DOWNLOAD_LOGS = "download_logs"
+SERVICE_QUERY_LOGS = "query_logs"
+SERVICE_SNAPSHOT_PICTURE = "snapshot_picture"
+SERVICE_RESTORE_PICTURE = "restore_picture"
+
+ATTR_SENSORS = "sensors"
+ATTR_DURATION = "duration"
+ATTR_BUCKET = "bucket"
+ATTR_KIND = "kind"
+ATTR_FILE_PATH = "file_path"
+ATTR_ACTIVATE = "activate"
+ATTR_LOG = "log"
+ATTR_DIRECTORY = "directory"
+ATTR_SEVERITY = "severity"
+ATTR_LIMIT = "limit"
+ATTR_NAME = "name"
+
+UPLOAD_PROGRESS_STEP = 10  # Percent between progress events
+DOWNLOAD_PROGRESS_BYTES = 1024 * 1024  # Between progress events if size unknown
+_ARCHIVE_SUFFIX = re.compile(r"(?:\.[A-Za-z0-9]{1,8}){1,3}$")
+
+GET_TELEMETRY_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_SENSORS): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_DURATION, default=timedelta(hours=24)): vol.All(
+            cv.time_period, cv.positive_timedelta
+        ),
+        vol.Optional(ATTR_BUCKET, default=timedelta(minutes=10)): vol.All(
+            cv.time_period, cv.positive_timedelta
+        ),
+    }
+)
+
+UPLOAD_FILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_KIND): vol.In(list(UPLOAD_ENDPOINTS)),
+        vol.Required(ATTR_FILE_PATH): cv.string,
+        vol.Optional(ATTR_ACTIVATE, default=True): cv.boolean,
+    }
+)
+
+DOWNLOAD_LOGS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_LOG, default="notification"): vol.In(list(LOG_ENDPOINTS)),
+        vol.Optional(ATTR_DIRECTORY): cv.string,
+    }
+)
+
+QUERY_LOGS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_LOG, default="notification"): vol.In(list(LOG_ENDPOINTS)),
+        vol.Optional(ATTR_DURATION, default=timedelta(hours=24)): vol.All(
+            cv.time_period, cv.positive_timedelta
+        ),
+        vol.Optional(ATTR_SEVERITY, default="ERROR"): vol.All(
+            vol.Upper, vol.In(LOG_SEVERITIES)
+        ),
+        vol.Optional(ATTR_LIMIT, default=100): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=10000)
+        ),
+        vol.Optional(ATTR_DIRECTORY): cv.string,
+    }
+)
+
+PICTURE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_NAME): vol.All(cv.string, vol.Strip, vol.Length(min=1)),
+    }
+)
+
+
+def _projector_entry(hass: HomeAssistant, entry_id: str) -> ConfigEntry:
+    """Return a Barco Pulse projector config entry."""
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if entry is None or entry.domain != DOMAIN or is_group_entry(entry):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="invalid_config_entry",
+            translation_placeholders={"entry_id": entry_id},
+        )
+    return entry
+
+
+def _loaded_entry(hass: HomeAssistant, entry_id: str) -> ConfigEntry:
+    """Return a loaded Barco Pulse projector config entry."""
+    entry = _projector_entry(hass, entry_id)
+    if entry.state is not ConfigEntryState.LOADED:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="config_entry_not_loaded",
+            translation_placeholders={"entry_id": entry_id},
+        )
+    return entry
+
+
+async def _async_get_telemetry_history(call: ServiceCall) -> ServiceResponse:
+    """Return windowed min/max/mean aggregates from the local history."""
+    entry = _loaded_entry(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    history = entry.runtime_data.history
+    if history is None:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="history_unavailable",
+        )
+
+    end = time.time()
+    start = end - call.data[ATTR_DURATION].total_seconds()
+    aggregates = await call.hass.async_add_executor_job(
+        history.aggregates,
+        start,
+        end,
+        call.data[ATTR_BUCKET].total_seconds(),
+        history.columns(call.data.get(ATTR_SENSORS)),
+    )
+    return {
+        "sensors": {
+            name: [
+                {**bucket, "start": dt_util.utc_from_timestamp(bucket["start"])}
+                for bucket in buckets
+            ]
+            for name, buckets in aggregates.items()
+        }
+    }
+
+
+async def _async_upload_file(call: ServiceCall) -> ServiceResponse:
+    """Stream a warp grid or blend/black level mask to the projector."""
+    hass = call.hass
+    entry = _loaded_entry(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    kind = call.data[ATTR_KIND]
+    endpoint = UPLOAD_ENDPOINTS[kind]
+    path = Path(call.data[ATTR_FILE_PATH])
+    if not hass.config.is_allowed_path(str(path)):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="path_not_allowed",
+            translation_placeholders={"path": str(path)},
+        )
+
+    device = entry.runtime_data.client
+    reported = -UPLOAD_PROGRESS_STEP
+
+    @callback
+    def _progress(sent: int, total: int) -> None:
+        nonlocal reported
+        percent = sent * 100 // total if total else 100
+        if percent - reported >= UPLOAD_PROGRESS_STEP or sent == total:
+            reported = percent
+            hass.bus.async_fire(
+                EVENT_FILE_TRANSFER,
+                {
+                    "config_entry_id": entry.entry_id,
+                    "kind": kind,
+                    "file": path.name,
+                    "bytes": sent,
+                    "total": total,
+                    "percent": percent,
+                },
+            )
+
+    try:
+        size = await async_upload_file(
+            hass,
+            async_get_clientsession(hass),
+            file_endpoint_url(device.host, endpoint.path),
+            path,
+            _progress,
+        )
+    except OSError as err:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="file_unreadable",
+            translation_placeholders={"path": str(path), "error": str(err)},
+        ) from err
+    except BarcoError as err:
+        raise HomeAssistantError(str(err)) from err
+
+    if call.data[ATTR_ACTIVATE]:
+        # Select and enable the new file in one round trip
+        prop, value = endpoint.activate
+        try:
+            results = await device.send_batch(
+                [
+                    (
+                        "property.set",
+                        {"property": endpoint.selected, "value": path.name},
+                    ),
+                    ("property.set", {"property": prop, "value": value}),
+                ]
+            )
+        except BarcoError as err:
+            results = [err]
+        errors = [str(result) for result in results if isinstance(result, BarcoError)]
+        if errors:
+            msg = f"Uploaded, but not activated: {'; '.join(errors)}"
+            raise HomeAssistantError(msg)
+
+    return {"file": path.name, "bytes": size, "activated": call.data[ATTR_ACTIVATE]}
+
+
+def _log_directory(call: ServiceCall) -> Path:
+    """Return the directory holding a service call's log archives."""
+    hass = call.hass
+    if ATTR_DIRECTORY not in call.data:
+        return Path(hass.config.path(LOG_DIRECTORY))
+    directory = Path(call.data[ATTR_DIRECTORY])
+    if not hass.config.is_allowed_path(str(directory)):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="path_not_allowed",
+            translation_placeholders={"path": str(directory)},
+        )
+    return directory
+
+
+async def _async_download_logs(call: ServiceCall) -> ServiceResponse:
+    """Stream a projector log archive to disk and index it."""
+    hass = call.hass
+    entry = _loaded_entry(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    log = call.data[ATTR_LOG]
+    directory = _log_directory(call)
+    prefix = f"{entry.entry_id}_{log}_"
+    stem = prefix + dt_util.utcnow().strftime("%Y%m%dT%H%M%SZ")
+    download = directory / f"{stem}.download"
+    reported = 0
+
+    @callback
+    def _progress(received: int, total: int | None) -> None:
+        nonlocal reported
+        if total:
+            step = total * UPLOAD_PROGRESS_STEP // 100
+            percent: int | None = min(received * 100 // total, 100)
+        else:
+            step, percent = DOWNLOAD_PROGRESS_BYTES, None
+        if received - reported >= step or received == total:
+            reported = received
+            hass.bus.async_fire(
+                EVENT_FILE_TRANSFER,
+                {
+                    "config_entry_id": entry.entry_id,
+                    "kind": log,
+                    "file": stem,
+                    "bytes": received,
+                    "total": total,
+                    "percent": percent,
+                },
+            )
+
+    try:
+        size, filename = await async_download_file(
+            hass,
+            async_get_clientsession(hass),
+            file_endpoint_url(entry.runtime_data.client.host, LOG_ENDPOINTS[log]),
+            download,
+            _progress,
+        )
+        # Keep the projector's file type (e.g. ".tar.gz") for people opening it
+        suffix = _ARCHIVE_SUFFIX.search(Path(filename or "").name)
+        archive = download.with_name(stem + (suffix.group() if suffix else ".log"))
+        await hass.async_add_executor_job(download.replace, archive)
+        summary = await hass.async_add_executor_job(
+            build_index, archive, dt_util.get_default_time_zone()
+        )
+        await hass.async_add_executor_job(
+            prune_archives, directory, prefix, LOG_KEEP_ARCHIVES
+        )
+    except (OSError, ValueError) as err:
+        raise HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="log_unreadable",
+            translation_placeholders={"file": stem, "error": str(err)},
+        ) from err
+    except BarcoError as err:
+        raise HomeAssistantError(str(err)) from err
+
+    return {
+        "archive": str(archive),
+        "bytes": size,
+        "entries": summary.entries,
+        "severities": summary.severities,
+        "first": _utc(summary.first),
+        "last": _utc(summary.last),
+    }
+
+
+async def _async_query_logs(call: ServiceCall) -> ServiceResponse:
+    """Return entries of the newest downloaded log archive from its index."""
+    hass = call.hass
+    entry = _projector_entry(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    log = call.data[ATTR_LOG]
+    directory = _log_directory(call)
+    archive = await hass.async_add_executor_job(
+        latest_archive, directory, f"{entry.entry_id}_{log}_"
+    )
+    if archive is None:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="logs_unavailable",
+            translation_placeholders={"log": log},
+        )
+
+    end = time.time()
+    try:
+        entries = await hass.async_add_executor_job(
+            query_index,
+            archive,
+            end - call.data[ATTR_DURATION].total_seconds(),
+            end,
+            parse_severity(call.data[ATTR_SEVERITY]),
+            call.data[ATTR_LIMIT],
+        )
+    except (OSError, ValueError) as err:
+        raise HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="log_unreadable",
+            translation_placeholders={"file": archive.name, "error": str(err)},
+        ) from err
+    return {
+        "archive": str(archive),
+        "entries": [{**item, "time": _utc(item["time"])} for item in entries],
+    }
+
+
+async def _async_snapshot_picture(call: ServiceCall) -> ServiceResponse:
+    """Save the projector's current picture as a named snapshot."""
+    entry = _loaded_entry(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    try:
+        snapshot = await entry.runtime_data.pictures.async_save(call.data[ATTR_NAME])
+    except BarcoStateError as err:
+        raise HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="picture_unavailable",
+        ) from err
+    except BarcoError as err:
+        raise HomeAssistantError(str(err)) from err
+    return snapshot
+
+
+async def _async_restore_picture(call: ServiceCall) -> ServiceResponse:
+    """Apply a named picture snapshot, writing only what differs."""
+    entry = _loaded_entry(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    pictures = entry.runtime_data.pictures
+    name = call.data[ATTR_NAME]
+    try:
+        result = await pictures.async_restore(name)
+    except BarcoError as err:
+        raise HomeAssistantError(str(err)) from err
+    if result is None:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="picture_not_found",
+            translation_placeholders={
+                "name": name,
+                "names": ", ".join(await pictures.async_names()) or "-",
+            },
+        )
+    if result["failed"]:
+        raise HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="picture_restore_failed",
+            translation_placeholders={
+                "name": name,
+                "errors": "; ".join(
+                    f"{key}: {error}" for key, error in result["failed"].items()
+                ),
+            },
+        )
+    return result
+
+
+def _utc(timestamp: float | None) -> datetime | None:
+    """Return a unix timestamp as a UTC datetime."""
+    return dt_util.utc_from_timestamp(timestamp) if timestamp is not None else None
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register integration services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_TELEMETRY_HISTORY,
+        _async_get_telemetry_history,
+        schema=GET_TELEMETRY_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_UPLOAD_FILE,
+        _async_upload_file,
+        schema=UPLOAD_FILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DOWNLOAD_LOGS,
+        _async_download_logs,
+        schema=DOWNLOAD_LOGS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY_LOGS,
+        _async_query_logs,
+        schema=QUERY_LOGS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SNAPSHOT_PICTURE,
+        _async_snapshot_picture,
+        schema=PICTURE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESTORE_PICTURE,
+        _async_restore_picture,
+        schema=PICTURE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import SwitchDeviceClass, SwitchEntity
 
 from .const import ACTIVE_STATES, PowerState
-from .entity import BarcoEntity, BarcoPowerMixin
+from .entity import BarcoEntity, BarcoGroupEntity, BarcoPowerMixin
+from .group import is_group_entry
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -16,7 +17,8 @@ if TYPE_CHECKING:
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .coordinator import BarcoDataUpdateCoordinator
-    from .data import BarcoRuntimeData
+    from .data import BarcoGroupRuntimeData, BarcoRuntimeData
+    from .group import BarcoGroupController
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,12 +44,51 @@ class BarcoPowerSwitch(BarcoPowerMixin, BarcoEntity, SwitchEntity):
             return False
 
 
+class BarcoGroupPowerSwitch(BarcoGroupEntity, SwitchEntity):
+    """Power switch of a projector group."""
+
+    _attr_translation_key = "power"
+    _attr_device_class = SwitchDeviceClass.SWITCH
+
+    def __init__(self, controller: BarcoGroupController) -> None:
+        """Initialize the group power switch."""
+        super().__init__(controller, "power_switch")
+
+    @property
+    def is_on(self) -> bool:
+        """Return True if any member is on."""
+        for state in self.member_values("state"):
+            try:
+                if PowerState(state) in ACTIVE_STATES:
+                    return True
+            except ValueError:
+                continue
+        return False
+
+    async def async_turn_on(self, **_kwargs: Any) -> None:
+        """Turn all members on."""
+        await self.controller.async_fan_out(
+            "power on", lambda data: data.client.power_on()
+        )
+
+    async def async_turn_off(self, **_kwargs: Any) -> None:
+        """Turn all members off."""
+        await self.controller.async_fan_out(
+            "power off", lambda data: data.client.power_off()
+        )
+
+
 async def async_setup_entry(
     _hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Barco Pulse switch from a config entry."""
+    if is_group_entry(entry):
+        group_data: BarcoGroupRuntimeData = entry.runtime_data
+        async_add_entities([BarcoGroupPowerSwitch(group_data.controller)])
+        return
+
     runtime_data: BarcoRuntimeData = entry.runtime_data
     coordinator = runtime_data.coordinator
 
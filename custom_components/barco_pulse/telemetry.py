@@ -0,0 +1,277 @@
+"""Environment telemetry sampling for Barco Pulse integration."""
+
+# ruff: noqa: TRY003, EM102
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from array import array
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .anomaly import TelemetryAnomalyDetector
+from .const import (
+    ACTIVE_STATES,
+    CONF_TELEMETRY_DEADBANDS,
+    EVENT_TELEMETRY_ANOMALY,
+    NAME,
+    TELEMETRY_INTERVAL,
+    TELEMETRY_INTERVAL_STANDBY,
+    TELEMETRY_VALUE_TYPES,
+    PowerState,
+)
+from .exceptions import BarcoApiError, BarcoConnectionError, BarcoStateError
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import BarcoDataUpdateCoordinator
+    from .history import TelemetryHistory
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class TelemetryDeadband:
+    """Publish filter for one environment value type."""
+
+    absolute: float  # Minimum absolute change worth publishing
+    relative: float  # Minimum change as a fraction of the published value
+    min_interval: float  # Seconds between publishes, even if the value moves
+    max_interval: float  # Seconds after which a value is republished anyway
+
+
+# Per value type publish filters; unlisted types publish every sample. The
+# absolute threshold can be overridden per entry (CONF_TELEMETRY_DEADBANDS)
+TELEMETRY_DEADBANDS: dict[str, TelemetryDeadband] = {
+    "Temperature": TelemetryDeadband(0.5, 0.0, 10.0, 900.0),
+    "Speed": TelemetryDeadband(50.0, 0.02, 10.0, 900.0),
+    "PWM": TelemetryDeadband(2.0, 0.0, 10.0, 900.0),
+    "Voltage": TelemetryDeadband(0.1, 0.01, 10.0, 900.0),
+}
+NO_DEADBAND = TelemetryDeadband(0.0, 0.0, 0.0, 0.0)
+
+
+def _exceeds_deadband(current: float, last: float, deadband: TelemetryDeadband) -> bool:
+    """Return True if a reading moved beyond the deadband (NaN = missing)."""
+    if math.isnan(current) or math.isnan(last):
+        return math.isnan(current) != math.isnan(last)
+    return abs(current - last) > max(deadband.absolute, deadband.relative * abs(last))
+
+
+class TelemetryColumns:
+    """
+    Readings of one environment value type stored column-wise.
+
+    Sensor names are assigned a stable index on first discovery; readings live
+    in a flat float array at that index (NaN when missing from a sample), so a
+    sample costs one array write per sensor and no per-sample dict churn. The
+    last published vector is kept alongside, so publish decisions are a single
+    pass over parallel arrays.
+    """
+
+    __slots__ = ("index", "names", "published", "published_at", "values")
+
+    def __init__(self) -> None:
+        """Initialize empty columns."""
+        self.names: list[str] = []
+        self.index: dict[str, int] = {}
+        self.values = array("d")
+        self.published = array("d")
+        self.published_at = array("d")
+
+    def update(self, readings: dict[str, Any]) -> list[int]:
+        """
+        Store a sample.
+
+        Args:
+            readings: Block name -> reading from environment.getcontrolblocks
+
+        Returns:
+            Indexes of sensors discovered in this sample
+
+        """
+        discovered: list[int] = []
+        for position in range(len(self.values)):
+            self.values[position] = math.nan
+
+        for name, reading in readings.items():
+            position = self.index.get(name)
+            if position is None:
+                position = len(self.names)
+                self.index[name] = position
+                self.names.append(name)
+                self.values.append(math.nan)
+                self.published.append(math.nan)
+                self.published_at.append(-math.inf)
+                discovered.append(position)
+            try:
+                self.values[position] = float(reading)
+            except (TypeError, ValueError):
+                self.values[position] = math.nan
+
+        return discovered
+
+    def publish(self, deadband: TelemetryDeadband, now: float) -> set[int]:
+        """
+        Mark readings that moved beyond the deadband as published.
+
+        A reading is published when it differs from the last published value by
+        more than the absolute or relative deadband (whichever is larger), or
+        appears/disappears, and at least min_interval has passed. Readings are
+        republished after max_interval regardless.
+
+        Args:
+            deadband: Publish filter for this value type
+            now: Monotonic timestamp of the sample
+
+        Returns:
+            Indexes whose published value was updated
+
+        """
+        changed = {
+            position
+            for position, (current, last, last_at) in enumerate(
+                zip(self.values, self.published, self.published_at, strict=True)
+            )
+            if now - last_at >= deadband.min_interval
+            and (
+                now - last_at >= deadband.max_interval
+                or _exceeds_deadband(current, last, deadband)
+            )
+        }
+        for position in changed:
+            self.published[position] = self.values[position]
+            self.published_at[position] = now
+        return changed
+
+    def value(self, position: int) -> float | None:
+        """Return the last published reading at an index, None if missing."""
+        reading = self.published[position]
+        return None if math.isnan(reading) else reading
+
+
+class BarcoTelemetryCoordinator(DataUpdateCoordinator[dict[str, TelemetryColumns]]):
+    """
+    Low-priority sampler for environment temperatures, fan speeds and voltages.
+
+    Runs on its own slow cadence, independent of the state polling loop, and
+    issues one bulk environment.getcontrolblocks request per value type. Each
+    sample waits for an in-progress state refresh to finish first, so
+    telemetry never delays the hot path by more than a single request.
+
+    After each sample only readings that passed their value type's deadband
+    are listed in `published`; entities write state for those alone, so state
+    machine and recorder load follow thermal change, not sample rate.
+    """
+
+    config_entry: ConfigEntry
+
+    def __init__(
+        self, hass: HomeAssistant, coordinator: BarcoDataUpdateCoordinator
+    ) -> None:
+        """Initialize the telemetry sampler."""
+        super().__init__(
+            hass=hass,
+            logger=_LOGGER,
+            name=f"{NAME} telemetry",
+            update_interval=TELEMETRY_INTERVAL,
+        )
+        self.coordinator = coordinator
+        self.device = coordinator.device
+        self._columns: dict[str, TelemetryColumns] = {
+            value_type: TelemetryColumns() for value_type in TELEMETRY_VALUE_TYPES
+        }
+        self._unsupported: set[str] = set()
+        self.published: dict[str, set[int]] = {}
+        self.history: TelemetryHistory | None = None
+        self.anomalies = TelemetryAnomalyDetector()
+
+    def _projector_active(self) -> bool:
+        """Return True if the projector is in an active power state."""
+        try:
+            return PowerState(self.coordinator.data.get("state")) in ACTIVE_STATES
+        except (ValueError, TypeError, AttributeError):
+            return False
+
+    def _deadband(self, value_type: str) -> TelemetryDeadband:
+        """Return the publish filter of a value type, with the entry's option."""
+        deadband = TELEMETRY_DEADBANDS.get(value_type, NO_DEADBAND)
+        absolute = self.config_entry.options.get(
+            CONF_TELEMETRY_DEADBANDS.get(value_type, "")
+        )
+        if absolute is None:
+            return deadband
+        return replace(deadband, absolute=float(absolute))
+
+    async def _async_update_data(self) -> dict[str, TelemetryColumns]:
+        """Sample all environment value types."""
+        self.update_interval = (
+            TELEMETRY_INTERVAL
+            if self._projector_active()
+            else TELEMETRY_INTERVAL_STANDBY
+        )
+        self.published = {}
+        sampled: dict[str, TelemetryColumns] = {}
+
+        for value_type, columns in self._columns.items():
+            if value_type in self._unsupported:
+                continue
+
+            # Yield to the state polling loop
+            await self.coordinator.async_wait_idle()
+
+            try:
+                readings = await self.device.get_control_blocks("Sensor", value_type)
+            except BarcoStateError:
+                _LOGGER.debug("%s readings not available in current state", value_type)
+                continue
+            except BarcoApiError as err:
+                # Value type not supported by this model; don't ask again
+                _LOGGER.debug("Disabling %s telemetry: %s", value_type, err)
+                self._unsupported.add(value_type)
+                continue
+            except BarcoConnectionError as err:
+                raise UpdateFailed(f"Telemetry connection error: {err}") from err
+
+            discovered = columns.update(readings)
+            if discovered:
+                _LOGGER.debug(
+                    "Discovered %d %s sensors", len(discovered), value_type.lower()
+                )
+            self.published[value_type] = columns.publish(
+                self._deadband(value_type), time.monotonic()
+            )
+            sampled[value_type] = columns
+
+        if not sampled:
+            return self._columns
+
+        # Every raw sample goes to the local history, deadband or not
+        if self.history:
+            self.history.append(time.time(), sampled)
+
+        # Fans and lasers idle in standby; only judge a running projector
+        if not self._projector_active():
+            self.anomalies.pause()
+            return self._columns
+
+        for anomaly in self.anomalies.observe(sampled):
+            self.hass.bus.async_fire(
+                EVENT_TELEMETRY_ANOMALY,
+                {
+                    "config_entry_id": self.config_entry.entry_id,
+                    "kind": anomaly.kind,
+                    "sensor": anomaly.sensor,
+                    "value": anomaly.value,
+                    "baseline": anomaly.baseline,
+                    "z_score": anomaly.z_score,
+                },
+            )
+
+        return self._columns
@@ -0,0 +1,382 @@
+"""Session recording and replay transports for Barco Pulse connections."""
+
+# ruff: noqa: TRY003, EM101, EM102
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import struct
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+# Recording file format
+#
+# A recording starts with a 5 byte header (magic + format version) followed by
+# a flat sequence of records. Every record is a fixed 9 byte header
+# (kind, microseconds since the previous record, payload length) followed by
+# the raw payload bytes. Read records hold exactly the bytes a single
+# StreamReader.read() call returned, so replay reproduces the original TCP
+# fragmentation as well as the inter-arrival timing.
+RECORDING_MAGIC = b"BPRC"
+RECORDING_VERSION = 1
+RECORD_HEADER = struct.Struct("<cII")
+
+RECORD_CONNECT = b"C"  # New connection opened
+RECORD_WRITE = b"W"  # Bytes written to the projector
+RECORD_READ = b"R"  # Chunk returned by StreamReader.read()
+RECORD_EOF = b"E"  # Connection closed by projector
+
+MAX_RECORD_DELAY_US = 2**32 - 1  # Delays are clamped to fit the record header
+RECORDER_FLUSH_THRESHOLD = 64 * 1024  # Buffered bytes before writing to disk
+# Size after which a recording is rotated (to <name>.1) on the next connection
+RECORDING_MAX_SIZE = 32 * 1024 * 1024
+
+
+class TransportReader(Protocol):
+    """Subset of asyncio.StreamReader used by BarcoDevice."""
+
+    async def read(self, n: int = -1) -> bytes:
+        """Read up to n bytes."""
+        ...
+
+
+class TransportWriter(Protocol):
+    """Subset of asyncio.StreamWriter used by BarcoDevice."""
+
+    def write(self, data: bytes) -> None:
+        """Write bytes to the transport."""
+        ...
+
+    async def drain(self) -> None:
+        """Wait until the write buffer is flushed."""
+        ...
+
+    def close(self) -> None:
+        """Close the transport."""
+        ...
+
+    async def wait_closed(self) -> None:
+        """Wait until the transport is closed."""
+        ...
+
+    def is_closing(self) -> bool:
+        """Return True if the transport is closing or closed."""
+        ...
+
+
+if TYPE_CHECKING:
+    ConnectionFactory = Callable[
+        [str, int], Awaitable[tuple[TransportReader, TransportWriter]]
+    ]
+
+
+@dataclass(frozen=True, slots=True)
+class RecordedEvent:
+    """Single event of a recorded projector session."""
+
+    kind: bytes
+    delay: float  # Seconds since the previous event
+    data: bytes
+
+
+class SessionRecorder:
+    """
+    Record the raw byte stream of projector sessions to a compact file.
+
+    Records are buffered in memory and appended to the file from an executor
+    thread, so recording never blocks the event loop on disk I/O. Once the
+    file has grown past max_size it is moved to <name>.1 (replacing the
+    previous one) when the next connection opens, so each file starts with a
+    whole session and disk use stays below twice max_size.
+    """
+
+    def __init__(self, path: str | Path, max_size: int = RECORDING_MAX_SIZE) -> None:
+        """
+        Initialize the recorder.
+
+        Args:
+            path: Recording file; created with a header if it does not exist
+            max_size: File size in bytes after which the recording is rotated
+
+        """
+        self.path = Path(path)
+        self.max_size = max_size
+        self._size = 0  # Bytes in the file as of the last write
+        self._buffer = bytearray()
+        self._last_event = time.monotonic()
+        self._flush_lock = asyncio.Lock()
+        self._header_pending = True
+        self._flush_task: asyncio.Task[None] | None = None
+
+    def record(self, kind: bytes, data: bytes = b"") -> None:
+        """Append one event to the in-memory buffer."""
+        now = time.monotonic()
+        delay_us = min(int((now - self._last_event) * 1_000_000), MAX_RECORD_DELAY_US)
+        self._last_event = now
+        self._buffer += RECORD_HEADER.pack(kind, delay_us, len(data))
+        self._buffer += data
+
+        if len(self._buffer) >= RECORDER_FLUSH_THRESHOLD and (
+            self._flush_task is None or self._flush_task.done()
+        ):
+            self._flush_task = asyncio.get_running_loop().create_task(self.flush())
+
+    async def flush(self) -> None:
+        """Write buffered events to disk."""
+        async with self._flush_lock:
+            if not self._buffer:
+                return
+            payload = bytes(self._buffer)
+            self._buffer.clear()
+            await asyncio.to_thread(self._append, payload)
+
+    def _append(self, payload: bytes) -> None:
+        """Append payload to the recording file (runs in executor)."""
+        with self.path.open("ab") as file:
+            if self._header_pending and file.tell() == 0:
+                file.write(RECORDING_MAGIC + bytes([RECORDING_VERSION]))
+            self._header_pending = False
+            file.write(payload)
+            self._size = file.tell()
+
+    async def _rotate(self) -> None:
+        """Write buffered events, then move the file aside and start a new one."""
+        async with self._flush_lock:
+            payload = bytes(self._buffer)
+            self._buffer.clear()
+            await asyncio.to_thread(self._rotate_file, payload)
+
+    def _rotate_file(self, payload: bytes) -> None:
+        """Append payload and rename the recording file (runs in executor)."""
+        if payload:
+            self._append(payload)
+        self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+        self._header_pending = True
+        self._size = 0
+        _LOGGER.debug("Rotated session recording %s", self.path)
+
+    async def open_connection(
+        self, host: str, port: int
+    ) -> tuple[TransportReader, TransportWriter]:
+        """Open a real TCP connection whose traffic is recorded."""
+        if self._size >= self.max_size:
+            await self._rotate()
+        reader, writer = await asyncio.open_connection(host, port)
+        self.record(RECORD_CONNECT, f"{host}:{port}".encode())
+        return RecordingReader(reader, self), RecordingWriter(writer, self)
+
+
+class RecordingReader:
+    """StreamReader wrapper that records every chunk it returns."""
+
+    def __init__(self, reader: asyncio.StreamReader, recorder: SessionRecorder) -> None:
+        """Initialize the wrapper."""
+        self._reader = reader
+        self._recorder = recorder
+
+    async def read(self, n: int = -1) -> bytes:
+        """Read from the wrapped reader and record the chunk."""
+        chunk = await self._reader.read(n)
+        self._recorder.record(RECORD_READ if chunk else RECORD_EOF, chunk)
+        return chunk
+
+
+class RecordingWriter:
+    """StreamWriter wrapper that records every write."""
+
+    def __init__(self, writer: asyncio.StreamWriter, recorder: SessionRecorder) -> None:
+        """Initialize the wrapper."""
+        self._writer = writer
+        self._recorder = recorder
+
+    def write(self, data: bytes) -> None:
+        """Record and forward a write."""
+        self._recorder.record(RECORD_WRITE, data)
+        self._writer.write(data)
+
+    async def drain(self) -> None:
+        """Drain the wrapped writer."""
+        await self._writer.drain()
+
+    def close(self) -> None:
+        """Close the wrapped writer."""
+        self._writer.close()
+
+    async def wait_closed(self) -> None:
+        """Wait for the wrapped writer to close."""
+        await self._writer.wait_closed()
+
+    def is_closing(self) -> bool:
+        """Return True if the wrapped writer is closing."""
+        return self._writer.is_closing()
+
+
+def load_recording(path: str | Path) -> list[RecordedEvent]:
+    """
+    Load a recording file.
+
+    Performs blocking file I/O; call from an executor inside Home Assistant.
+
+    Args:
+        path: Recording file written by SessionRecorder
+
+    Returns:
+        Recorded events in original order
+
+    Raises:
+        ValueError: If the file is not a valid recording
+
+    """
+    raw = Path(path).read_bytes()
+    header_size = len(RECORDING_MAGIC) + 1
+    if raw[: len(RECORDING_MAGIC)] != RECORDING_MAGIC:
+        raise ValueError(f"{path} is not a Barco Pulse recording")
+    if raw[len(RECORDING_MAGIC)] != RECORDING_VERSION:
+        raise ValueError(f"Unsupported recording version {raw[len(RECORDING_MAGIC)]}")
+
+    events: list[RecordedEvent] = []
+    view = memoryview(raw)
+    offset = header_size
+    while offset + RECORD_HEADER.size <= len(raw):
+        kind, delay_us, length = RECORD_HEADER.unpack_from(raw, offset)
+        offset += RECORD_HEADER.size
+        data = bytes(view[offset : offset + length])
+        events.append(RecordedEvent(kind, delay_us / 1_000_000, data))
+        offset += length
+
+    if offset != len(raw):
+        _LOGGER.warning("Ignoring truncated trailing record in %s", path)
+
+    return events
+
+
+class ReplayTransport:
+    """
+    Feed a recorded session back into BarcoDevice.
+
+    Each call to open_connection() starts the next recorded connection. Read
+    chunks of a response are released only after the client has written the
+    request that preceded them in the recording, and are delivered with the
+    original chunk boundaries and (scaled) inter-arrival delays.
+    """
+
+    def __init__(self, events: list[RecordedEvent], speed: float = 1.0) -> None:
+        """
+        Initialize the replay transport.
+
+        Args:
+            events: Events returned by load_recording()
+            speed: Playback speed factor (0 disables delays entirely)
+
+        """
+        self._connections = _split_connections(events)
+        self._speed = speed
+
+    @classmethod
+    def from_file(cls, path: str | Path, speed: float = 1.0) -> ReplayTransport:
+        """Create a replay transport from a recording file."""
+        return cls(load_recording(path), speed)
+
+    @property
+    def remaining_connections(self) -> int:
+        """Return the number of recorded connections not yet replayed."""
+        return len(self._connections)
+
+    async def open_connection(
+        self, _host: str, _port: int
+    ) -> tuple[TransportReader, TransportWriter]:
+        """Start replaying the next recorded connection."""
+        if not self._connections:
+            raise ConnectionRefusedError("Recording exhausted")
+        stream = _ReplayStream(self._connections.pop(0), self._speed)
+        return stream, stream
+
+
+def _split_connections(events: list[RecordedEvent]) -> list[list[RecordedEvent]]:
+    """Split a flat event list into per-connection event lists."""
+    connections: list[list[RecordedEvent]] = []
+    for event in events:
+        if event.kind == RECORD_CONNECT:
+            connections.append([])
+        elif connections:
+            connections[-1].append(event)
+    return connections
+
+
+class _ReplayStream:
+    """Reader and writer side of a single replayed connection."""
+
+    def __init__(self, events: list[RecordedEvent], speed: float) -> None:
+        """Initialize the replay stream."""
+        self._events = events
+        self._speed = speed
+        self._position = 0
+        self._pending = b""
+        self._unmatched_writes = 0
+        self._writes = asyncio.Event()
+        self._closed = False
+
+    def write(self, _data: bytes) -> None:
+        """Register a client write, releasing the recorded reads that follow it."""
+        self._unmatched_writes += 1
+        self._writes.set()
+
+    async def drain(self) -> None:
+        """Nothing to drain on a replayed connection."""
+
+    def close(self) -> None:
+        """Close the replayed connection."""
+        self._closed = True
+        self._writes.set()
+
+    async def wait_closed(self) -> None:
+        """Nothing to wait for on a replayed connection."""
+
+    def is_closing(self) -> bool:
+        """Return True if the replayed connection was closed."""
+        return self._closed
+
+    async def read(self, n: int = -1) -> bytes:
+        """Return the next recorded chunk with its original delay."""
+        if self._pending:
+            return self._take_pending(n)
+
+        while not self._closed:
+            if self._position >= len(self._events):
+                return b""
+            event = self._events[self._position]
+            if event.kind == RECORD_WRITE:
+                # Response chunks only follow once the request was written
+                if self._unmatched_writes:
+                    self._unmatched_writes -= 1
+                    self._position += 1
+                else:
+                    self._writes.clear()
+                    await self._writes.wait()
+                continue
+
+            self._position += 1
+            if self._speed > 0 and event.delay > 0:
+                await asyncio.sleep(event.delay / self._speed)
+            if event.kind == RECORD_EOF:
+                return b""
+            self._pending = event.data
+            return self._take_pending(n)
+
+        return b""
+
+    def _take_pending(self, n: int) -> bytes:
+        """Return up to n bytes of the current recorded chunk."""
+        if n < 0 or n >= len(self._pending):
+            chunk, self._pending = self._pending, b""
+        else:
+            chunk, self._pending = self._pending[:n], self._pending[n:]
+        return chunk
@@ -0,0 +1,88 @@
+"""Wake-on-LAN for Barco Pulse projectors in ECO mode."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .transport import ConnectionFactory
+
+_LOGGER = logging.getLogger(__name__)
+
+WOL_ADDRESS = "255.255.255.255"  # Limited broadcast; a directed one also works
+WOL_PORT = 9
+WOL_PACKET_REPEAT = 3  # Packets per burst (UDP may drop one)
+WOL_RESEND_INTERVAL = 5.0  # Seconds between bursts while waiting
+WOL_WAKE_TIMEOUT = 90.0  # Seconds from the first packet to a listening port
+WOL_PROBE_TIMEOUT = 0.5  # Connect timeout of one readiness probe
+WOL_PROBE_MIN_DELAY = 0.1  # Backoff between probes, doubling up to the max
+WOL_PROBE_MAX_DELAY = 1.0
+
+_MAC_SEPARATORS = re.compile(r"[:\-.\s]")
+_MAC_HEX = re.compile(r"[0-9a-f]{12}")
+
+
+def normalize_mac(value: object) -> str | None:
+    """
+    Return a MAC address as aa:bb:cc:dd:ee:ff.
+
+    Returns:
+        The normalized address, or None if value is not a MAC address
+
+    """
+    if not isinstance(value, str):
+        return None
+    digits = _MAC_SEPARATORS.sub("", value).lower()
+    if not _MAC_HEX.fullmatch(digits) or digits == "0" * 12:
+        return None
+    return ":".join(digits[i : i + 2] for i in range(0, 12, 2))
+
+
+def magic_packet(mac: str) -> bytes:
+    """Return the Wake-on-LAN magic packet of a (normalized) MAC address."""
+    return b"\xff" * 6 + bytes.fromhex(mac.replace(":", "")) * 16
+
+
+async def async_send_magic_packet(
+    mac: str, address: str = WOL_ADDRESS, port: int = WOL_PORT
+) -> None:
+    """
+    Send a burst of magic packets over UDP.
+
+    Raises:
+        OSError: If the packets cannot be sent
+
+    """
+    packet = magic_packet(mac)
+    transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+        asyncio.DatagramProtocol, remote_addr=(address, port), allow_broadcast=True
+    )
+    try:
+        for _ in range(WOL_PACKET_REPEAT):
+            transport.sendto(packet)
+    finally:
+        transport.close()
+    _LOGGER.debug("Sent Wake-on-LAN packets for %s to %s:%s", mac, address, port)
+
+
+async def async_port_open(
+    host: str,
+    port: int,
+    *,
+    wait: float = WOL_PROBE_TIMEOUT,
+    connection_factory: ConnectionFactory | None = None,
+) -> bool:
+    """Return True if host accepts a TCP connection on port within wait seconds."""
+    factory = connection_factory or asyncio.open_connection
+    try:
+        _, writer = await asyncio.wait_for(factory(host, port), wait)
+    except (TimeoutError, OSError):
+        return False
+    writer.close()
+    with contextlib.suppress(ConnectionError, OSError):
+        await writer.wait_closed()
+    return True
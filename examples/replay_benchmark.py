@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Record a projector session and replay it offline for benchmarking.
+
+Usage:
+    python examples/replay_benchmark.py record 192.168.30.206 session.bprc --polls 100
+    python examples/replay_benchmark.py replay session.bprc --speed 10
+
+Recording performs coordinator-style polls against a real projector. Replay
+feeds the recorded byte chunks back into BarcoDevice with their original
+fragmentation and timing (scaled by --speed; 0 disables delays) and reports
+per-poll latency, so framing and coordinator changes can be compared offline.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from custom_components.barco_pulse.api import BarcoDevice
+from custom_components.barco_pulse.transport import ReplayTransport, SessionRecorder
+
+INFO_PROPERTIES = [
+    "system.serialnumber",
+    "system.modelname",
+    "system.firmwareversion",
+]
+ACTIVE_PROPERTIES = [
+    "illumination.sources.laser.power",
+    "illumination.sources.laser.power.min",
+    "illumination.sources.laser.power.max",
+    "image.window.main.source",
+    "image.brightness",
+    "image.contrast",
+    "image.saturation",
+    "profile.presetassignments",
+    "profile.profiles",
+]
+
+
+async def poll_once(device):
+    """Run one coordinator-style poll."""
+    state = await device.get_state()
+    await device.get_properties(INFO_PROPERTIES)
+    if state in ("on", "ready"):
+        await device.get_properties(ACTIVE_PROPERTIES)
+        await device.get_available_sources()
+
+
+async def run_polls(device, polls, interval):
+    """Run polls and return their durations in milliseconds."""
+    durations = []
+    await device.connect()
+    try:
+        for _ in range(polls):
+            start = time.perf_counter()
+            await poll_once(device)
+            durations.append((time.perf_counter() - start) * 1000)
+            if interval:
+                await asyncio.sleep(interval)
+    finally:
+        await device.disconnect()
+    return durations
+
+
+def report(durations):
+    """Print latency summary."""
+    if not durations:
+        print("No polls completed")
+        return
+    ordered = sorted(durations)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(f"Polls: {len(durations)}")
+    print(f"Mean:  {statistics.mean(durations):.1f} ms")
+    print(f"P50:   {statistics.median(durations):.1f} ms")
+    print(f"P95:   {p95:.1f} ms")
+    print(f"Max:   {ordered[-1]:.1f} ms")
+
+
+async def record(args):
+    """Record a live session."""
+    recorder = SessionRecorder(args.file)
+    device = BarcoDevice(
+        args.host,
+        args.port,
+        auth_code=args.auth_code,
+        connection_factory=recorder.open_connection,
+    )
+    try:
+        report(await run_polls(device, args.polls, args.interval))
+    finally:
+        await recorder.flush()
+    print(f"Recorded to {args.file}")
+
+
+async def replay(args):
+    """Replay a recorded session."""
+    transport = await asyncio.to_thread(
+        ReplayTransport.from_file, args.file, args.speed
+    )
+    device = BarcoDevice(
+        "replay",
+        auth_code=args.auth_code,
+        connection_factory=transport.open_connection,
+    )
+    durations = []
+    while transport.remaining_connections:
+        try:
+            durations += await run_polls(device, args.polls, 0)
+        except Exception as err:  # noqa: BLE001
+            # Recording ended mid-connection
+            print(f"Connection replay ended: {err}")
+    report(durations)
+
+
+def main():
+    """Parse arguments and run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    sub = parser.add_subparsers(dest="mode", required=True)
+
+    rec = sub.add_parser("record")
+    rec.add_argument("host")
+    rec.add_argument("file")
+    rec.add_argument("--port", type=int, default=9090)
+    rec.add_argument("--polls", type=int, default=100)
+    rec.add_argument("--interval", type=float, default=2.0)
+    rec.add_argument("--auth-code", default=None)
+
+    rep = sub.add_parser("replay")
+    rep.add_argument("file")
+    rep.add_argument("--speed", type=float, default=1.0)
+    rep.add_argument("--polls", type=int, default=100)
+    rep.add_argument("--auth-code", default=None)
+
+    args = parser.parse_args()
+    asyncio.run(record(args) if args.mode == "record" else replay(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Tests for the Barco Pulse integration."""
@@ -0,0 +1,175 @@
+"""Wake-on-LAN tests against a local UDP/TCP stand-in for an ECO projector."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import socket
+from typing import Any
+
+from custom_components.barco_pulse.api import BarcoDevice
+from custom_components.barco_pulse.wol import magic_packet, normalize_mac
+
+MAC = "00:04:a5:12:34:56"
+HOST = "127.0.0.1"
+
+
+def _free_port() -> int:
+    """Return a TCP port nothing listens on."""
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+class StandInProjector(asyncio.DatagramProtocol):
+    """
+    A projector in ECO mode: only its Wake-on-LAN listener is up.
+
+    The first magic packet starts the JSON-RPC server after boot_delay
+    seconds; system.poweron is answered as busy busy_count times before it
+    succeeds.
+    """
+
+    def __init__(self, port: int, boot_delay: float = 0.3, busy_count: int = 1) -> None:
+        """Initialize the stand-in."""
+        self.port = port
+        self.boot_delay = boot_delay
+        self.busy_count = busy_count
+        self.packets: list[bytes] = []
+        self.methods: list[str] = []
+        self.server: asyncio.Server | None = None
+
+    def datagram_received(self, data: bytes, _addr: Any) -> None:
+        """Record a magic packet; boot on the first one."""
+        self.packets.append(data)
+        if len(self.packets) == 1:
+            asyncio.get_running_loop().call_later(
+                self.boot_delay, lambda: asyncio.ensure_future(self.boot())
+            )
+
+    async def boot(self) -> None:
+        """Open the JSON-RPC port."""
+        self.server = await asyncio.start_server(self._handle, HOST, self.port)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer JSON-RPC requests."""
+        buffer = b""
+        while data := await reader.read(4096):
+            buffer += data
+            while b"\r\n\r\n" in buffer:
+                head, rest = buffer.split(b"\r\n\r\n", 1)
+                length = next(
+                    int(line.split(b":")[1])
+                    for line in head.split(b"\r\n")
+                    if line.lower().startswith(b"content-length")
+                )
+                if len(rest) < length:
+                    break
+                body, buffer = rest[:length], rest[length:]
+                request = json.loads(body)
+                self.methods.append(request["method"])
+                response: dict[str, Any] = {"jsonrpc": "2.0", "id": request["id"]}
+                if request["method"] == "system.poweron" and self.busy_count:
+                    self.busy_count -= 1
+                    response["error"] = {"code": -32009, "message": "busy"}
+                else:
+                    response["result"] = True
+                writer.write(json.dumps(response).encode())
+                await writer.drain()
+        writer.close()
+
+    def close(self) -> None:
+        """Stop the JSON-RPC server."""
+        if self.server is not None:
+            self.server.close()
+
+
+async def _start(
+    port: int, **kwargs: Any
+) -> tuple[StandInProjector, asyncio.DatagramTransport]:
+    """Start a stand-in projector listening for Wake-on-LAN on a UDP port."""
+    transport, projector = await asyncio.get_running_loop().create_datagram_endpoint(
+        lambda: StandInProjector(port, **kwargs), local_addr=(HOST, 0)
+    )
+    return projector, transport
+
+
+def _device(port: int, wol_port: int, **kwargs: Any) -> BarcoDevice:
+    """Return a device that wakes through the stand-in."""
+    device = BarcoDevice(HOST, port, timeout=2, **kwargs)
+    device.mac_address = MAC
+    device.wol_address = HOST
+    device.wol_port = wol_port
+    device.wake_timeout = 5.0
+    return device
+
+
+def test_normalize_mac() -> None:
+    """MAC addresses are normalized and invalid ones rejected."""
+    assert normalize_mac("00-04-A5-12-34-56") == MAC
+    assert normalize_mac("0004a5123456") == MAC
+    assert normalize_mac("00:00:00:00:00:00") is None
+    assert normalize_mac("not a mac") is None
+    assert normalize_mac(None) is None
+    assert magic_packet(MAC) == b"\xff" * 6 + bytes.fromhex("0004a5123456") * 16
+
+
+async def test_power_on_wakes_eco_projector() -> None:
+    """power_on wakes a projector whose port is closed, then powers it on."""
+    port = _free_port()
+    projector, transport = await _start(port)
+    device = _device(port, transport.get_extra_info("sockname")[1])
+    try:
+        await device.power_on()
+    finally:
+        await device.disconnect()
+        projector.close()
+        transport.close()
+
+    assert projector.packets
+    assert all(packet == magic_packet(MAC) for packet in projector.packets)
+    # Busy while booting, then accepted
+    assert projector.methods == ["system.poweron", "system.poweron"]
+
+
+async def test_power_on_awake_projector_sends_no_packets() -> None:
+    """power_on of a projector that is listening sends no magic packets."""
+    port = _free_port()
+    projector, transport = await _start(port, busy_count=0)
+    await projector.boot()
+    device = _device(port, transport.get_extra_info("sockname")[1])
+    try:
+        await device.power_on()
+    finally:
+        await device.disconnect()
+        projector.close()
+        transport.close()
+
+    assert not projector.packets
+    assert projector.methods == ["system.poweron"]
+
+
+async def test_wake_probes_bypass_connection_factory() -> None:
+    """Port probes don't go through a recording or replay transport."""
+    opened: list[tuple[str, int]] = []
+
+    async def factory(host: str, port: int) -> Any:
+        opened.append((host, port))
+        return await asyncio.open_connection(host, port)
+
+    port = _free_port()
+    projector, transport = await _start(port)
+    device = _device(
+        port, transport.get_extra_info("sockname")[1], connection_factory=factory
+    )
+    try:
+        await device.power_on()
+    finally:
+        await device.disconnect()
+        projector.close()
+        transport.close()
+
+    # Only the session itself was opened through the factory
+    assert opened == [(HOST, port)]